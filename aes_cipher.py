@@ -1,17 +1,67 @@
 import sbox_logic
 import os
+from functools import lru_cache
+
+# Koefisien kolom pertama MixColumns AES (matriks circulant [02 03 01 01])
+MIX_COLUMNS = (0x02, 0x01, 0x01, 0x03)
+
+
+def generate_rcon(field, count=16):
+    """Rcon[i] = x^(i-1) di medan field (Rcon[0] = 0 sebagai placeholder)."""
+    rcon = [0x00, 0x01]
+    while len(rcon) < count:
+        rcon.append(int(field.mul[rcon[-1], 0x02]))
+    return rcon
+
+
+def _circulant(column):
+    """Matriks circulant 4x4 dengan kolom pertama column: M[r][c] = column[(r - c) mod 4]."""
+    return [[column[(r - c) % 4] for c in range(4)] for r in range(4)]
+
+
+def invert_circulant(column, field):
+    """
+    Kolom pertama invers matriks circulant 4x4 atas medan field (Gauss-Jordan
+    dengan tabel perkalian dan invers medan). ValueError jika singular.
+    """
+    mul, inverse = field.mul, field.inverse
+    matrix = [row + [int(r == c) for c in range(4)] for r, row in enumerate(_circulant(column))]
+    for col in range(4):
+        pivot = next((r for r in range(col, 4) if matrix[r][col]), None)
+        if pivot is None:
+            raise ValueError(f"MixColumns tidak invertible di medan 0x{field.poly:X}")
+        matrix[col], matrix[pivot] = matrix[pivot], matrix[col]
+        scale = int(inverse[matrix[col][col]])
+        matrix[col] = [int(mul[scale, v]) for v in matrix[col]]
+        for r in range(4):
+            factor = matrix[r][col]
+            if r != col and factor:
+                matrix[r] = [v ^ int(mul[factor, p]) for v, p in zip(matrix[r], matrix[col])]
+    # Invers circulant juga circulant: cukup kolom pertamanya
+    return tuple(matrix[r][4] for r in range(4))
+
+
+@lru_cache(maxsize=None)
+def round_constants(poly=0x11B):
+    """(Rcon, kolom MixColumns, kolom InvMixColumns) untuk medan GF(2^8)/poly, di-cache per polinomial."""
+    field = sbox_logic.gf256(poly)
+    return generate_rcon(field), MIX_COLUMNS, invert_circulant(MIX_COLUMNS, field)
 
-# Konstanta AES (Rcon)
-Rcon = [
-    0x00, 0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40,
-    0x80, 0x1B, 0x36, 0x6C, 0xD8, 0xAB, 0x4D, 0x9A
-]
 
 class ModifiedAES:
-    def __init__(self, key, sbox, inv_sbox):
+    def __init__(self, key, sbox, inv_sbox=None, field=None):
         self.key = key
-        self.sbox = sbox
-        self.inv_sbox = inv_sbox
+        # SBox divalidasi sekali; inversnya diambil dari cache jika inv_sbox tidak diberikan
+        if inv_sbox is None:
+            sbox = sbox_logic.as_sbox(sbox)
+            inv_sbox = sbox.inverse
+        # Lookup byte langsung dari buffer SBox (tanpa list int)
+        self.sbox = sbox.data if isinstance(sbox, sbox_logic.SBox) else sbox
+        self.inv_sbox = inv_sbox.data if isinstance(inv_sbox, sbox_logic.SBox) else inv_sbox
+        # Medan untuk MixColumns dan Rcon (default AES 0x11B)
+        self.field = sbox_logic.as_field(field)
+        self.rcon, self.mix, self.inv_mix = round_constants(self.field.poly)
+        self.mul = self.field.mul_rows
         self.Nb = 4
         self.Nk = len(key) // 4
         self.Nr = 10  # Asumsi kunci 128-bit
@@ -35,7 +85,7 @@ class ModifiedAES:
             temp = w[4*(i-1):4*i]
             if i % self.Nk == 0:
                 temp = self.sub_word(self.rot_word(temp))
-                temp[0] ^= Rcon[i // self.Nk]
+                temp[0] ^= self.rcon[i // self.Nk]
             
             for j in range(4):
                 w[4*i+j] = w[4*(i-self.Nk)+j] ^ temp[j]
@@ -71,33 +121,21 @@ class ModifiedAES:
         state[3] = state[3][-3:] + state[3][:-3]
         return state
 
-    def gmul(self, a, b):
-        p = 0
-        for _ in range(8):
-            if b & 1: p ^= a
-            hi_bit_set = a & 0x80
-            a <<= 1
-            if hi_bit_set: a ^= 0x1B
-            b >>= 1
-        return p & 0xFF
-
-    def mix_columns(self, state):
+    def _mix(self, state, column):
+        """Mengalikan setiap kolom state dengan matriks circulant berkolom pertama column."""
+        matrix = [[self.mul[v] for v in row] for row in _circulant(column)]
         for c in range(4):
             col = [state[r][c] for r in range(4)]
-            state[0][c] = self.gmul(0x02, col[0]) ^ self.gmul(0x03, col[1]) ^ col[2] ^ col[3]
-            state[1][c] = col[0] ^ self.gmul(0x02, col[1]) ^ self.gmul(0x03, col[2]) ^ col[3]
-            state[2][c] = col[0] ^ col[1] ^ self.gmul(0x02, col[2]) ^ self.gmul(0x03, col[3])
-            state[3][c] = self.gmul(0x03, col[0]) ^ col[1] ^ col[2] ^ self.gmul(0x02, col[3])
+            for r in range(4):
+                row = matrix[r]
+                state[r][c] = row[0][col[0]] ^ row[1][col[1]] ^ row[2][col[2]] ^ row[3][col[3]]
         return state
 
+    def mix_columns(self, state):
+        return self._mix(state, self.mix)
+
     def inv_mix_columns(self, state):
-        for c in range(4):
-            col = [state[r][c] for r in range(4)]
-            state[0][c] = self.gmul(0x0e, col[0]) ^ self.gmul(0x0b, col[1]) ^ self.gmul(0x0d, col[2]) ^ self.gmul(0x09, col[3])
-            state[1][c] = self.gmul(0x09, col[0]) ^ self.gmul(0x0e, col[1]) ^ self.gmul(0x0b, col[2]) ^ self.gmul(0x0d, col[3])
-            state[2][c] = self.gmul(0x0d, col[0]) ^ self.gmul(0x09, col[1]) ^ self.gmul(0x0e, col[2]) ^ self.gmul(0x0b, col[3])
-            state[3][c] = self.gmul(0x0b, col[0]) ^ self.gmul(0x0d, col[1]) ^ self.gmul(0x09, col[2]) ^ self.gmul(0x0e, col[3])
-        return state
+        return self._mix(state, self.inv_mix)
 
     def encrypt_block(self, plaintext):
         state = [[plaintext[r + 4*c] for c in range(4)] for r in range(4)]
@@ -151,18 +189,19 @@ def unpad(data):
 # FUNGSI WRAPPER (MODE CBC DIIMPLEMENTASIKAN DI SINI)
 # ==========================================
 
-def encrypt_text(key_bytes, text, sbox, inv_sbox):
-    return encrypt_data(key_bytes, text.encode('utf-8'), sbox, inv_sbox).hex()
+def encrypt_text(key_bytes, text, sbox, inv_sbox=None, field=None):
+    return encrypt_data(key_bytes, text.encode('utf-8'), sbox, inv_sbox, field).hex()
 
-def decrypt_text(key_bytes, hex_text, sbox, inv_sbox):
-    return decrypt_data(key_bytes, bytes.fromhex(hex_text), sbox, inv_sbox).decode('utf-8')
+def decrypt_text(key_bytes, hex_text, sbox, inv_sbox=None, field=None):
+    return decrypt_data(key_bytes, bytes.fromhex(hex_text), sbox, inv_sbox, field).decode('utf-8')
 
-def encrypt_data(key_bytes, data_bytes, sbox, inv_sbox):
+def encrypt_data(key_bytes, data_bytes, sbox, inv_sbox=None, field=None):
     """
     Mengenkripsi data menggunakan mode CBC (Cipher Block Chaining).
     Mode ini PENTING untuk NPCR/UACI yang tinggi.
+    field: GF256 atau polinomial untuk MixColumns/Rcon (default AES 0x11B).
     """
-    aes = ModifiedAES(key_bytes, sbox, inv_sbox)
+    aes = ModifiedAES(key_bytes, sbox, inv_sbox, field)
     padded_data = pad(data_bytes)
     encrypted = b""
     
@@ -187,9 +226,9 @@ def encrypt_data(key_bytes, data_bytes, sbox, inv_sbox):
         
     return encrypted
 
-def decrypt_data(key_bytes, data_bytes, sbox, inv_sbox):
+def decrypt_data(key_bytes, data_bytes, sbox, inv_sbox=None, field=None):
     """Mendekripsi data menggunakan mode CBC."""
-    aes = ModifiedAES(key_bytes, sbox, inv_sbox)
+    aes = ModifiedAES(key_bytes, sbox, inv_sbox, field)
     decrypted = b""
     
     iv = bytes([0] * 16)
@@ -1,12 +1,18 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
+from collections import OrderedDict
+from functools import lru_cache
+import uuid
 import numpy as np
 
 # Import modul logika proyek Anda
 import sbox_logic
 import sbox_analysis
+import sbox_incremental
+import sbox_explore
+import sbox_canonical
 import aes_cipher
 
 # Inisialisasi Aplikasi
@@ -25,29 +31,93 @@ app.add_middleware(
 
 
 class MatrixRequest(BaseModel):
-    matrix: List[List[int]]
+    matrix: Optional[List[List[int]]] = None
+    # Alternatif: indeks enumerasi GL(8, 2) (lihat sbox_logic.AffineMatrix.rank)
+    rank: Optional[int] = None
+    # Polinomial iredusibel medan GF(2^8) untuk invers (default AES 0x11B)
+    polynomial: int = 0x11B
+
+
+class FlipRequest(BaseModel):
+    # Daftar sel (baris, kolom) matriks K yang dibalik; setiap sel tepat dua integer
+    flips: List[Tuple[int, int]]
 
 
 class SBoxRequest(BaseModel):
     sbox: List[int]
+    # Lebar input n (S-Box 2^n elemen) dan output m (default m = n; boleh m < n)
+    input_bits: int = 8
+    output_bits: Optional[int] = None
+    # Predikat screening opsional, mis. ["nl>=112", "du<=4"]
+    screen: Optional[List[str]] = None
+    # Provenance opsional: matriks affine K dan konstanta C yang menghasilkan S-Box ini
+    # (C integer 0-255 atau vektor 8 bit LSB dulu, default konstanta AES 0x63)
+    matrix: Optional[List[List[int]]] = None
+    constant: Union[int, List[int]] = 0x63
+    # Polinomial medan untuk provenance (default AES 0x11B)
+    polynomial: int = 0x11B
+    # Metrik opsional (mahal), mis. ["bu", "dlct_max"]
+    extra_metrics: Optional[List[str]] = None
+
+
+class BatchSBoxRequest(BaseModel):
+    sboxes: List[List[int]]
+    input_bits: int = 8
+    output_bits: Optional[int] = None
+    chunk_size: int = 8
+    screen: Optional[List[str]] = None
+    extra_metrics: Optional[List[str]] = None
+
+
+class FamilyRequest(BaseModel):
+    # Keluarga matriks: circulant, left_circulant, toeplitz, hankel
+    family: str = "circulant"
+    sort_by: str = "sv"
+    top: int = 20
+    constant: int = 0x63
+    polynomial: int = 0x11B
+    # Ekuivalensi untuk deduplikasi (sbox_explore.DEDUP_EQUIVALENCES), mis. "output_bit_permutation"
+    dedup: Optional[str] = None
+
+
+class PowerFamilyRequest(BaseModel):
+    # Keluarga eksponen: gold, kasami, inverse, all
+    family: str = "inverse"
+    # Lapisan affine output opsional: satu matriks atau seluruh keluarga matriks
+    matrix: Optional[List[List[int]]] = None
+    matrix_family: Optional[str] = None
+    constant: int = 0
+    sort_by: str = "sv"
+    top: int = 20
+    polynomial: int = 0x11B
+    bijective_only: bool = True
+    dedup: Optional[str] = None
+
+
+class CanonicalRequest(BaseModel):
+    sboxes: List[List[int]]
+    equivalence: str = "output_affine"
 
 
 class EncryptTextRequest(BaseModel):
     key: str
     plaintext: str
     sbox: List[int]
+    polynomial: int = 0x11B
 
 
 class DecryptTextRequest(BaseModel):
     key: str
     ciphertext_hex: str
     sbox: List[int]
+    polynomial: int = 0x11B
 
 
 class EncryptImageRequest(BaseModel):
     key: str
     image_hex: str  # Gambar dikirim sebagai Hex String
     sbox: List[int]
+    polynomial: int = 0x11B
 
 
 def calculate_entropy(data: bytes) -> float:
@@ -98,6 +168,27 @@ def calculate_npcr_uaci(c1: bytes, c2: bytes) -> tuple:
     return npcr, uaci
 
 
+def _screening_response(result, single=False):
+    """Mengubah hasil sbox_analysis.screen_sboxes menjadi respons JSON."""
+    response = {
+        "passed": result["passed"].tolist(),
+        "metrics": {name: values.tolist() for name, values in result["metrics"].items()},
+        "stages": result["stages"],
+    }
+    if single:
+        # Satu S-Box: kembalikan metrik langsung beserta tahap yang menolaknya
+        failed = [st["stage"] for st in result["stages"] if st["evaluated"] and not st["passed"]]
+        response = {
+            "passed": len(result["passed"]) == 1,
+            "failed_stage": failed[0] if failed else None,
+            "stages": result["stages"],
+        }
+        # Kandidat yang ditolak tetap membawa metrik yang sudah dihitung sampai tahap penolakan
+        metrics = result["rejected"][0]["metrics"] if result["rejected"] else result["metrics"]
+        response.update({name: values[0].item() for name, values in metrics.items() if len(values)})
+    return response
+
+
 # --- ENDPOINTS ---
 
 
@@ -134,63 +225,309 @@ def get_presets():
     return data
 
 
+MAX_RANDOM_MATRICES = 10000
+
+
 @app.get("/random-matrix")
-def get_random_matrix():
-    """Step 1 Extra: Generate matriks acak yang valid (Invertible)."""
+def get_random_matrix(seed: Optional[int] = None, count: int = 1):
+    """
+    Step 1 Extra: Generate matriks acak yang valid (Invertible).
+    seed membuat hasil dapat direproduksi; count > 1 mengembalikan banyak matriks
+    sekaligus di "matrices" ("matrix" tetap berisi matriks pertama).
+    """
+    if not 1 <= count <= MAX_RANDOM_MATRICES:
+        raise HTTPException(
+            status_code=400, detail=f"count harus berada dalam range 1-{MAX_RANDOM_MATRICES}"
+        )
+    if seed is not None and seed < 0:
+        raise HTTPException(status_code=400, detail="seed tidak boleh negatif")
     try:
-        matrix_np = sbox_logic.generate_random_affine_matrix()
-        return {"matrix": matrix_np.tolist()}
+        matrices = sbox_logic.generate_random_affine_matrices(seed, count)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    result = {"matrix": matrices[0].tolist()}
+    if count > 1:
+        result["matrices"] = matrices.tolist()
+    if seed is not None:
+        result["seed"] = seed
+    return result
+
+
+@lru_cache(maxsize=128)
+def _cached_sbox(data: bytes):
+    # Objek SBox dipakai ulang antar request sehingga validasi dan inversnya dihitung sekali
+    return sbox_logic.SBox(data)
+
+
+def _request_sbox(values: List[int]):
+    """SBox (tervalidasi, di-cache per isi) dari list request; 400 jika tidak valid."""
+    try:
+        return _cached_sbox(bytes(values))
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"S-Box tidak valid: {e}")
+
+
+def _request_field(polynomial: int):
+    """Medan GF(2^8) dari polinomial request; 400 jika tidak iredusibel."""
+    try:
+        return sbox_logic.gf256(polynomial)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _request_sboxes(sboxes: List[List[int]], input_bits: int, output_bits: Optional[int]):
+    """
+    Tumpukan S-Box (N, 2^n) dari request, divalidasi terhadap lebar input n dan
+    output m (default m = n); 400 jika jumlah elemen atau nilai tidak sesuai.
+    Returns: (array int64, m)
+    """
+    m = input_bits if output_bits is None else output_bits
+    for name, bits in (("input_bits", input_bits), ("output_bits", m)):
+        if not sbox_analysis.MIN_BITS <= bits <= sbox_analysis.MAX_BITS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{name} harus {sbox_analysis.MIN_BITS}..{sbox_analysis.MAX_BITS}, ditemukan {bits}",
+            )
+    size = 1 << input_bits
+    if any(len(sbox) != size for sbox in sboxes):
+        raise HTTPException(status_code=400, detail=f"Setiap S-Box harus {size} elemen")
+    limit = 1 << m
+    if any(not 0 <= value < limit for sbox in sboxes for value in sbox):
+        raise HTTPException(
+            status_code=400, detail=f"Semua elemen S-Box harus berada dalam range 0-{limit - 1} ({m} bit)"
+        )
+    return np.array(sboxes, dtype=np.int64).reshape(-1, size), m
+
+
+def _binary_matrix(matrix):
+    """Matriks affine 8x8 dari request; 400 jika bentuknya salah atau ada elemen selain 0/1."""
+    if len(matrix) != 8 or any(len(row) != 8 for row in matrix):
+        raise HTTPException(status_code=400, detail="Matriks harus 8x8")
+    try:
+        return sbox_logic.check_binary_matrices(matrix)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _request_matrix(req: MatrixRequest):
+    """Matriks K dari request: list 8x8 atau indeks enumerasi GL(8, 2)."""
+    if (req.matrix is None) == (req.rank is None):
+        raise HTTPException(status_code=400, detail="Isi tepat satu dari 'matrix' atau 'rank'")
+    if req.rank is not None and not 0 <= req.rank < sbox_logic.GL_ORDER:
+        raise HTTPException(
+            status_code=400, detail=f"rank harus berada dalam range 0-{sbox_logic.GL_ORDER - 1}"
+        )
+    try:
+        if req.rank is not None:
+            return sbox_logic.AffineMatrix.from_rank(req.rank).to_array()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _binary_matrix(req.matrix)
 
 
 @app.post("/generate-sbox")
 def generate_sbox(req: MatrixRequest):
     """Step 2: Konstruksi S-Box dari Matriks Affine"""
+    matrix_np = _request_matrix(req)
+    field = _request_field(req.polynomial)
     try:
-        matrix_np = np.array(req.matrix)
-        sbox = sbox_logic.construct_sbox(matrix_np)
-        return {"sbox": sbox}
+        sbox = sbox_logic.construct_sbox(matrix_np, field=field)
+        return {"sbox": sbox.tolist()}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/explore-family")
+def explore_family(req: FamilyRequest):
+    """Analisis seluruh anggota invertible sebuah keluarga matriks, diurutkan (default SV)."""
+    if req.top < 1:
+        raise HTTPException(status_code=400, detail="top harus >= 1")
+    if not 0 <= req.constant <= 255:
+        raise HTTPException(status_code=400, detail="constant harus berada dalam range 0-255")
+    try:
+        return sbox_explore.explore_family(
+            req.family, constant=req.constant, sort_by=req.sort_by, top=req.top,
+            field=_request_field(req.polynomial), dedup=req.dedup,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/explore-power")
+def explore_power(req: PowerFamilyRequest):
+    """Sapu peta pangkat x^d (opsional dengan lapisan affine), diurutkan (default SV)."""
+    if req.top < 1:
+        raise HTTPException(status_code=400, detail="top harus >= 1")
+    if not 0 <= req.constant <= 255:
+        raise HTTPException(status_code=400, detail="constant harus berada dalam range 0-255")
+    if req.matrix is not None and req.matrix_family is not None:
+        raise HTTPException(status_code=400, detail="Isi paling banyak satu dari 'matrix' atau 'matrix_family'")
+    field = _request_field(req.polynomial)
+    matrix = None if req.matrix is None else _binary_matrix(req.matrix)
+    try:
+        if req.matrix_family is not None:
+            output_matrices = sbox_explore.family_members(req.matrix_family)
+        else:
+            output_matrices = matrix
+        return sbox_explore.explore_power_family(
+            req.family, output_matrices, constant=req.constant, sort_by=req.sort_by,
+            top=req.top, field=field, bijective_only=req.bijective_only, dedup=req.dedup,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+# Batas jumlah S-Box per request /canonical. bit_permutation mencoba 8! permutasi
+# input (~2 s per S-Box), sehingga batasnya jauh lebih kecil.
+MAX_CANONICAL_SBOXES = 10000
+MAX_BIT_PERMUTATION_SBOXES = 4
+
+
+@app.post("/canonical")
+def canonical_sboxes(req: CanonicalRequest):
+    """Bentuk kanonik, hash dan statistik duplikat untuk sekumpulan S-Box."""
+    if any(len(sbox) != 256 for sbox in req.sboxes):
+        raise HTTPException(status_code=400, detail="Setiap S-Box harus 256 elemen")
+    limit = MAX_CANONICAL_SBOXES if req.equivalence in sbox_canonical.FAST_EQUIVALENCES else MAX_BIT_PERMUTATION_SBOXES
+    if not 1 <= len(req.sboxes) <= limit:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Jumlah S-Box untuk {req.equivalence} harus berada dalam range 1-{limit}",
+        )
+    try:
+        sboxes = np.array(req.sboxes, dtype=np.int64).reshape(-1, 256)
+        canonical = np.atleast_2d(sbox_canonical.canonical_form(sboxes, req.equivalence))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    stats = sbox_canonical.group_forms(canonical)
+    return {
+        "equivalence": req.equivalence,
+        "canonical": canonical.tolist(),
+        "hashes": [f"{h:016x}" for h in sbox_canonical.form_hashes(canonical)],
+        "classes": stats["classes"].tolist(),
+        "representatives": stats["representatives"].tolist(),
+        "total": stats["total"],
+        "unique": stats["unique"],
+        "duplicates": stats["duplicates"],
+        "collapse_ratio": stats["collapse_ratio"],
+        "invariant_metrics": list(sbox_canonical.INVARIANT_METRICS[req.equivalence]),
+    }
+
+
 @app.post("/analyze")
 def analyze_sbox(req: SBoxRequest):
     """Step 3: Analisis Kriptografi S-Box"""
-    sbox = req.sbox
-    if len(sbox) != 256:
-        raise HTTPException(status_code=400, detail="S-Box harus 256 elemen")
+    sboxes, m = _request_sboxes([req.sbox], req.input_bits, req.output_bits)
+    field = _request_field(req.polynomial)
+    if req.matrix is not None and (req.input_bits, m) != (8, 8):
+        raise HTTPException(status_code=400, detail="Provenance matriks hanya untuk S-Box 8-bit")
+    matrix = None if req.matrix is None else _binary_matrix(req.matrix)
 
     try:
-        # Hitung parameter menggunakan sbox_analysis.py
-        nl = sbox_analysis.calculate_nl(sbox)
-        sac = sbox_analysis.calculate_sac(sbox)
-        bic_nl, bic_sac = sbox_analysis.calculate_bic(sbox)
-        du, dap = sbox_analysis.calculate_du_dap(sbox)
-        lap = sbox_analysis.calculate_lap(sbox)
-        ad = sbox_analysis.calculate_ad(sbox)
-        ci = sbox_analysis.calculate_ci(sbox)
-        to = sbox_analysis.calculate_to(sbox)
-        sv = sbox_analysis.calculate_sv(nl, sac, bic_nl, bic_sac)
+        if req.screen:
+            # Mode screening: berhenti di tahap pertama yang gagal
+            result = sbox_analysis.screen_sboxes(
+                sboxes, req.screen,
+                metrics=sbox_analysis.METRICS + tuple(req.extra_metrics or ()), m=m
+            )
+            return _screening_response(result, single=True)
 
-        return {
-            "nl": nl,
-            "sac": sac,
-            "bic_nl": bic_nl,
-            "bic_sac": bic_sac,
-            "du": du,
-            "dap": dap,
-            "lap": lap,
-            "ad": ad,
-            "ci": ci,
-            "to": to,
-            "sv": sv,
-        }
+        if matrix is not None:
+            # Dengan provenance, tabel diturunkan dari tabel peta invers yang sudah di-cache
+            profile = sbox_analysis.SBoxProfile.from_affine(
+                matrix, req.constant, sbox=sboxes[0], field=field
+            )
+            return profile.as_dict(extra=req.extra_metrics or ())
+        if req.input_bits > 8:
+            # Tabel penuh 2^n x 2^m terlalu besar: reduksi berblok (memori terbatas)
+            columns = sbox_analysis.analyze_batch(sboxes, chunk_size=1, extra=req.extra_metrics or (), m=m)
+            return {name: values[0].item() for name, values in columns.items()}
+        # Semua metrik diturunkan dari satu profil: tabel Walsh/DDT/autokorelasi
+        # hanya dihitung sekali per S-Box
+        return sbox_analysis.SBoxProfile(sboxes[0], m).as_dict(extra=req.extra_metrics or ())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analisis: {str(e)}")
 
 
+@app.post("/analyze-batch")
+def analyze_sbox_batch(req: BatchSBoxRequest):
+    """Step 3 (Batch): Analisis banyak S-Box sekaligus, hasil per kolom metrik."""
+    sboxes, m = _request_sboxes(req.sboxes, req.input_bits, req.output_bits)
+
+    try:
+        if req.screen:
+            result = sbox_analysis.screen_sboxes(
+                sboxes, req.screen, metrics=sbox_analysis.METRICS + tuple(req.extra_metrics or ()),
+                chunk_size=req.chunk_size, m=m
+            )
+            return _screening_response(result)
+
+        columns = sbox_analysis.analyze_batch(
+            sboxes, chunk_size=req.chunk_size, extra=req.extra_metrics or (), m=m
+        )
+        return {name: values.tolist() for name, values in columns.items()}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error analisis: {str(e)}")
+
+
+# Sesi live editor matriks (disimpan di memori, LRU terbatas)
+MAX_LIVE_SESSIONS = 128
+live_sessions = OrderedDict()
+
+
+def _live_session_response(session_id, session):
+    return {
+        "session_id": session_id,
+        "matrix": session.matrix.tolist(),
+        "sbox": session.sbox.tolist(),
+        "invertible": session.is_invertible,
+        "metrics": session.metrics(),
+    }
+
+
+@app.post("/live-session")
+def create_live_session(req: MatrixRequest):
+    """Membuat sesi analisis live untuk editor matriks affine."""
+    try:
+        session = sbox_incremental.LiveAffineSession(
+            _request_matrix(req), field=_request_field(req.polynomial)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    session_id = uuid.uuid4().hex
+    live_sessions[session_id] = session
+    while len(live_sessions) > MAX_LIVE_SESSIONS:
+        live_sessions.popitem(last=False)
+    return _live_session_response(session_id, session)
+
+
+@app.post("/live-session/{session_id}/flip")
+def flip_live_session(session_id: str, req: FlipRequest):
+    """Membalik satu atau beberapa bit K dan mengembalikan metrik terbaru."""
+    session = live_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Sesi tidak ditemukan")
+    live_sessions.move_to_end(session_id)
+
+    try:
+        session.apply([(row, col) for row, col in req.flips])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _live_session_response(session_id, session)
+
+
+@app.delete("/live-session/{session_id}")
+def delete_live_session(session_id: str):
+    """Menutup sesi live."""
+    live_sessions.pop(session_id, None)
+    return {"status": "deleted"}
+
+
 @app.post("/encrypt-text")
 def encrypt_text(req: EncryptTextRequest):
     """Step 4/5: Enkripsi Teks"""
@@ -199,12 +536,11 @@ def encrypt_text(req: EncryptTextRequest):
             status_code=400, detail="Key harus tepat 16 karakter (128-bit)"
         )
 
+    field = _request_field(req.polynomial)
+    sbox = _request_sbox(req.sbox)
     try:
         key_bytes = req.key.encode("utf-8")
-        inv_sbox = sbox_logic.generate_inverse_sbox(req.sbox)
-        cipher_hex = aes_cipher.encrypt_text(
-            key_bytes, req.plaintext, req.sbox, inv_sbox
-        )
+        cipher_hex = aes_cipher.encrypt_text(key_bytes, req.plaintext, sbox, field=field)
         return {"ciphertext": cipher_hex}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -216,12 +552,11 @@ def decrypt_text(req: DecryptTextRequest):
     if len(req.key) != 16:
         raise HTTPException(status_code=400, detail="Key harus tepat 16 karakter")
 
+    field = _request_field(req.polynomial)
+    sbox = _request_sbox(req.sbox)
     try:
         key_bytes = req.key.encode("utf-8")
-        inv_sbox = sbox_logic.generate_inverse_sbox(req.sbox)
-        plaintext = aes_cipher.decrypt_text(
-            key_bytes, req.ciphertext_hex, req.sbox, inv_sbox
-        )
+        plaintext = aes_cipher.decrypt_text(key_bytes, req.ciphertext_hex, sbox, field=field)
         return {"plaintext": plaintext}
     except Exception as e:
         raise HTTPException(
@@ -238,14 +573,15 @@ def process_image(req: EncryptImageRequest, mode: str = "encrypt"):
     if len(req.key) != 16:
         raise HTTPException(status_code=400, detail="Key harus 16 karakter")
 
+    field = _request_field(req.polynomial)
+    sbox = _request_sbox(req.sbox)
     try:
         key_bytes = req.key.encode("utf-8")
-        inv_sbox = sbox_logic.generate_inverse_sbox(req.sbox)
         input_bytes = bytes.fromhex(req.image_hex)  # Konversi Hex -> Bytes
 
         if mode == "encrypt":
             # 1. Enkripsi Gambar Asli (C1)
-            c1 = aes_cipher.encrypt_data(key_bytes, input_bytes, req.sbox, inv_sbox)
+            c1 = aes_cipher.encrypt_data(key_bytes, input_bytes, sbox, field=field)
 
             # 2. Hitung Entropi C1
             entropy = calculate_entropy(c1)
@@ -258,7 +594,7 @@ def process_image(req: EncryptImageRequest, mode: str = "encrypt"):
 
             # Enkripsi P2 -> C2
             c2 = aes_cipher.encrypt_data(
-                key_bytes, bytes(input_array), req.sbox, inv_sbox
+                key_bytes, bytes(input_array), sbox, field=field
             )
 
             # Hitung NPCR & UACI antara C1 dan C2
@@ -273,7 +609,7 @@ def process_image(req: EncryptImageRequest, mode: str = "encrypt"):
             }
         else:
             result_bytes = aes_cipher.decrypt_data(
-                key_bytes, input_bytes, req.sbox, inv_sbox
+                key_bytes, input_bytes, sbox, field=field
             )
 
         return {"result_hex": result_bytes.hex(), "size": len(result_bytes)}
@@ -338,21 +674,12 @@ async def upload_excel_sbox(file: UploadFile = File(...)):
                 "source_format": source_format,
             }
 
-        # Jika valid, analisis S-Box
+        # Jika valid, analisis lengkap S-Box dalam satu profil (tabel dipakai bersama)
         try:
-            nl = sbox_analysis.calculate_nl(sbox)
-            sac = sbox_analysis.calculate_sac(sbox)
-            dac = sbox_analysis.calculate_dac(sbox)
-            pc = sbox_analysis.calculate_pc(sbox)
-            bd = sbox_analysis.calculate_bd(sbox)
-
-            analysis = {
-                "nonlinearity": nl,
-                "sac": round(float(sac), 4),
-                "dac": round(float(dac), 4),
-                "pc": round(float(pc), 4),
-                "bd": int(bd),
-            }
+            # Format dan presisi sama dengan /analyze (tanpa pembulatan)
+            analysis = sbox_analysis.SBoxProfile(sbox).as_dict(extra=("dac", "pc", "bd"))
+            # Alias kunci lama agar klien yang membaca "nonlinearity" tetap berjalan
+            analysis["nonlinearity"] = analysis["nl"]
         except Exception as e:
             # Jika analisis gagal, tetap kembalikan S-Box (untuk demo/testing)
             analysis = {"error": f"Analisis partial: {str(e)}"}
@@ -3,6 +3,7 @@ import numpy as np
 import sbox_logic
 import aes_cipher
 import sbox_analysis
+import sbox_incremental
 import io
 from PIL import Image
 
@@ -24,7 +25,7 @@ step = st.sidebar.radio("Tahapan Proyek:",
 
 if "current_sbox" not in st.session_state:
     # Default ke S-box 44 dari paper untuk awal
-    st.session_state["current_sbox"] = sbox_logic.SBOX_44
+    st.session_state["current_sbox"] = sbox_logic.SBox(sbox_logic.SBOX_44)
 if "affine_matrix" not in st.session_state:
     st.session_state["affine_matrix"] = None
 
@@ -71,6 +72,24 @@ if step == "1. Affine Matrix Exploration":
                 height=300
             )
 
+            # Analisis live: setiap sel yang berubah diterapkan sebagai flip bit K
+            edited_np = np.array(edited_matrix)
+            if np.all(np.isin(edited_np, [0, 1])):
+                if "live_session" not in st.session_state:
+                    st.session_state["live_session"] = sbox_incremental.LiveAffineSession(
+                        st.session_state["manual_input_matrix"]
+                    )
+                live = st.session_state["live_session"]
+                rows, cols = np.nonzero(edited_np != live.matrix)
+                live_metrics = live.apply(zip(rows.tolist(), cols.tolist()))
+
+                st.caption("Analisis live (diperbarui per sel):")
+                m1, m2, m3, m4 = st.columns(4)
+                m1.metric("Invertible", "Yes" if live.is_invertible else "No")
+                m2.metric("NL", f"{live_metrics['nl']}")
+                m3.metric("DU", f"{live_metrics['du']}")
+                m4.metric("SV", f"{live_metrics['sv']:.4f}")
+
             if st.button("Validasi & Gunakan Matriks Manual"):
                 # Konversi ke NumPy array
                 matrix_np = np.array(edited_matrix)
@@ -79,9 +98,8 @@ if step == "1. Affine Matrix Exploration":
                 if not np.all(np.isin(matrix_np, [0, 1])):
                     st.error("Error: Matriks hanya boleh berisi angka 0 atau 1!")
                 else:
-                    # Cek Determinan (Harus Ganjil/1 di mod 2 agar Invertible)
-                    det = int(round(np.linalg.det(matrix_np))) % 2
-                    if det == 0:
+                    # Cek invertibilitas eksak atas GF(2) (rank penuh = determinan 1 mod 2)
+                    if not sbox_logic.is_invertible_gf2(matrix_np):
                         st.error("⚠️ Matriks ini TIDAK VALID (Singular/Tidak punya invers). S-Box yang dihasilkan tidak akan bijektif (akan ada nilai output yang hilang atau duplikat).")
                         # Kita tetap izinkan masuk session state agar user bisa melihat kegagalannya di Step 3
                         st.session_state["affine_matrix"] = matrix_np
@@ -126,7 +144,11 @@ elif step == "2. Candidate S-box Construction":
             st.error("Harap generate Matriks Affine di Step 1 terlebih dahulu!")
         else:
             new_sbox = sbox_logic.construct_sbox(st.session_state["affine_matrix"])
-            st.session_state["current_sbox"] = new_sbox
+            try:
+                st.session_state["current_sbox"] = sbox_logic.SBox(new_sbox)
+            except ValueError:
+                # Matriks singular: simpan apa adanya agar kegagalannya terlihat di Step 3
+                st.session_state["current_sbox"] = new_sbox.tolist()
             st.success("S-Box Kandidat Berhasil Dibuat!")
             
     st.subheader("Visualisasi S-Box Saat Ini:")
@@ -136,6 +158,9 @@ elif step == "2. Candidate S-box Construction":
 elif step == "3. S-box Candidate Testing":
     st.header("Step 3: S-box Candidate Testing")
     st.markdown("Pengujian S-Box dengan parameter kriptografi lengkap.")
+    show_side_channel = st.checkbox(
+        "Sertakan metrik side-channel (Confusion Coefficient, DPA SNR)", value=False
+    )
     
     if st.button("Jalankan Analisis Lengkap"):
         sbox = st.session_state["current_sbox"]
@@ -145,15 +170,19 @@ elif step == "3. S-box Candidate Testing":
             unique_vals = len(set(sbox))
             is_bijective = (unique_vals == 256)
             
-            # 2. Advanced Metrics
-            nl = sbox_analysis.calculate_nl(sbox)
-            sac = sbox_analysis.calculate_sac(sbox)
-            bic_nl, bic_sac = sbox_analysis.calculate_bic(sbox) # Memastikan sbox_analysis.py sudah update
-            du, dap = sbox_analysis.calculate_du_dap(sbox)
-            lap = sbox_analysis.calculate_lap(sbox)
-            ad = sbox_analysis.calculate_ad(sbox)
-            ci = sbox_analysis.calculate_ci(sbox)
-            sv = sbox_analysis.calculate_sv(nl, sac, bic_nl, bic_sac)
+            # 2. Advanced Metrics (tabel bersama dihitung sekali lewat SBoxProfile)
+            profile = sbox_analysis.SBoxProfile(sbox)
+            nl = profile.nl
+            sac = profile.sac
+            bic_nl, bic_sac = profile.bic_nl, profile.bic_sac
+            du, dap = profile.du, profile.dap
+            lap = profile.lap
+            ad = profile.ad
+            ci = profile.ci
+            to = profile.to
+            sv = profile.sv
+            if show_side_channel:
+                cc_var, dpa_snr = profile.cc_var, profile.dpa_snr
         
         # Display Results
         st.subheader("Hasil Analisis")
@@ -180,6 +209,10 @@ elif step == "3. S-box Candidate Testing":
             st.metric("DAP", f"{dap:.6f}", help="Differential Approximation Probability") # DAP ditambahkan kembali
             st.metric("LAP", f"{lap:.6f}", help="Linear Approximation Probability")
             st.metric("Alg. Degree (AD)", f"{ad}", help="Ideal: 7") # AD tetap ada
+            st.metric("Transparency Order (TO)", f"{to:.4f}", help="Semakin kecil semakin tahan DPA")
+            if show_side_channel:
+                st.metric("Confusion Coef. Var.", f"{cc_var:.5f}", help="Variansi koefisien konfusi (model HW)")
+                st.metric("DPA SNR", f"{dpa_snr:.4f}", help="SNR DPA tersimulasi (AES ~9.6), semakin kecil semakin tahan")
             
         # Interpretasi Singkat
         st.markdown("---")
@@ -204,7 +237,7 @@ elif step == "4. Final AES S-box Modification":
     
     # Tombol aksi
     if st.button("Gunakan S-Box 44 (Terbaik dari Paper)"):
-        st.session_state["current_sbox"] = sbox_logic.SBOX_44
+        st.session_state["current_sbox"] = sbox_logic.SBox(sbox_logic.SBOX_44)
         st.success("S-Box 44 Dimuat sebagai S-Box Aktif!")
             
     # Visualisasi Tabel Penuh
@@ -228,6 +261,7 @@ elif step == "5. Implementasi Enkripsi & Dekripsi":
     else:
         key_bytes = key_input.encode('utf-8')
         sbox = st.session_state["current_sbox"]
+        # Untuk objek SBox, invers diambil dari cache
         inv_sbox = sbox_logic.generate_inverse_sbox(sbox)
 
         # Tab Selection
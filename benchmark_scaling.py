@@ -0,0 +1,97 @@
+"""
+Benchmark skala mesin analisis S-Box untuk lebar n = 4..12 bit.
+Untuk setiap lebar, S-Box bijektif acak dianalisis per metrik; dilaporkan waktu
+(detik) dan puncak memori (MB, via tracemalloc) per metrik. Kasus batch
+membandingkan analyze_batch dengan loop SBoxProfile untuk banyak kandidat 8-bit.
+
+Jalankan: python benchmark_scaling.py [--widths 4 6 8 10 12] [--seed 0] [--batch 64]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+import sbox_analysis
+
+# Metrik yang diukur: (nama, fungsi yang menerima satu S-Box)
+BENCHMARKS = (
+    ("nl", sbox_analysis.calculate_nl),
+    ("sac", sbox_analysis.calculate_sac),
+    ("bic", sbox_analysis.calculate_bic),
+    ("du_dap", sbox_analysis.calculate_du_dap),
+    ("lap", sbox_analysis.calculate_lap),
+    ("ad", sbox_analysis.calculate_ad),
+    ("ci", sbox_analysis.calculate_ci),
+    ("to", sbox_analysis.calculate_to),
+)
+
+
+def measure(fn, sbox):
+    """Menjalankan fn(sbox) sekali; mengembalikan (detik, puncak memori MB)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(sbox)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 2**20
+
+
+def run(widths, seed):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for n in widths:
+        sbox = rng.permutation(1 << n)
+        for name, fn in BENCHMARKS:
+            seconds, peak = measure(fn, sbox)
+            rows.append((n, name, seconds, peak))
+            print(f"n={n:>2}  {name:<7} {seconds:>9.4f} s  {peak:>9.2f} MB", flush=True)
+    return rows
+
+
+def run_batch(count, seed, chunk_size=8):
+    """Waktu per kandidat (ms): loop SBoxProfile(...).as_dict() vs analyze_batch."""
+    rng = np.random.default_rng(seed)
+    sboxes = np.array([rng.permutation(256) for _ in range(count)])
+    start = time.perf_counter()
+    for sbox in sboxes:
+        sbox_analysis.SBoxProfile(sbox).as_dict()
+    profile_ms = (time.perf_counter() - start) / count * 1e3
+    start = time.perf_counter()
+    sbox_analysis.analyze_batch(sboxes, chunk_size=chunk_size)
+    batch_ms = (time.perf_counter() - start) / count * 1e3
+    print(f"{count} kandidat 8-bit: profil {profile_ms:.2f} ms, batch (chunk {chunk_size}) "
+          f"{batch_ms:.2f} ms per kandidat ({profile_ms / batch_ms:.2f}x)")
+    return profile_ms, batch_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skala analisis S-Box n-bit")
+    parser.add_argument(
+        "--widths", type=int, nargs="+",
+        default=list(range(sbox_analysis.MIN_BITS, sbox_analysis.MAX_BITS + 1)),
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch", type=int, default=64, help="jumlah kandidat kasus batch (0 = lewati)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"BENCHMARK SKALA (BLOCK_ELEMENTS = {sbox_analysis.BLOCK_ELEMENTS})")
+    print("=" * 60)
+    rows = run(args.widths, args.seed)
+
+    print("\nTotal per lebar:")
+    for n in args.widths:
+        total = sum(seconds for width, _, seconds, _ in rows if width == n)
+        peak = max(peak for width, _, _, peak in rows if width == n)
+        print(f"n={n:>2}  {total:>9.4f} s  puncak {peak:>9.2f} MB")
+
+    if args.batch > 0:
+        print("\nBatch vs profil:")
+        run_batch(args.batch, args.seed)
+
+
+if __name__ == "__main__":
+    main()
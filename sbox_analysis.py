@@ -1,272 +1,1495 @@
+import operator
+import re
+import time
+from functools import cached_property, lru_cache
+from statistics import NormalDist
+
 import numpy as np
 
+import sbox_logic
+
+# Lebar S-Box yang didukung: n bit input (2^n entri), output m bit
+MIN_BITS = 4
+MAX_BITS = 12
+
+# Bobot Hamming (popcount) untuk semua nilai hingga MAX_BITS bit
+HW_TABLE = np.array([bin(i).count("1") for i in range(1 << MAX_BITS)], dtype=np.int64)
+
+# Batas jumlah elemen array perantara per langkah (~8 MB int64), mis. pasangan BCT.
+CHUNK_ELEMENTS = 1 << 20
+
+# Tabel 2^n x 2^m (Walsh, DDT) dibangun dan direduksi per blok baris sehingga memori
+# perantara tidak tumbuh dengan 2^(2n). Blok ~128 KB (int64) muat di cache: jauh lebih
+# cepat daripada satu blok besar untuk banyak kandidat sekaligus.
+BLOCK_ELEMENTS = 1 << 14
+
+# Screening menyimpan tabel perantara (DDT, spektrum koordinat) antar tahap hanya jika
+# tabel per kandidat dan total untuk semua kandidat yang dievaluasi tidak melebihi batas ini.
+SCREEN_TABLE_ELEMENTS = 1 << 16
+SCREEN_CACHE_ELEMENTS = 1 << 26
+
+def coordinate_masks(m):
+    """Mask output e_i untuk m fungsi koordinat."""
+    return np.array([1 << i for i in range(m)], dtype=np.int64)
+
+def pair_masks(m):
+    """Mask e_i XOR e_j untuk C(m, 2) pasangan koordinat (BIC)."""
+    return np.array(
+        [(1 << i) | (1 << j) for i in range(m) for j in range(i + 1, m)], dtype=np.int64
+    )
+
+# Mask output untuk 8 fungsi koordinat dan 28 pasangan koordinat (BIC) S-Box 8-bit
+COORDINATE_MASKS = coordinate_masks(8)
+PAIR_MASKS = pair_masks(8)
+
+def sbox_widths(sbox, m=None):
+    """
+    Lebar (n, m) S-Box berdimensi (..., 2^n): n dari jumlah entri,
+    m = max(n, jumlah bit nilai output terbesar) kecuali lebar output m diberikan
+    (boleh m < n); semua nilai harus muat dalam m bit.
+    """
+    s = np.asarray(sbox)
+    size = s.shape[-1]
+    n = size.bit_length() - 1
+    if size != 1 << n or not MIN_BITS <= n <= MAX_BITS:
+        raise ValueError(
+            f"Jumlah entri S-Box harus 2^n dengan n = {MIN_BITS}..{MAX_BITS}, ditemukan {size}"
+        )
+    if m is None:
+        m = max(n, int(np.max(s)).bit_length())
+        if m > MAX_BITS:
+            raise ValueError(f"Nilai output S-Box melebihi {MAX_BITS} bit")
+        return n, m
+    if not MIN_BITS <= m <= MAX_BITS:
+        raise ValueError(f"Lebar output S-Box harus {MIN_BITS}..{MAX_BITS} bit, ditemukan {m}")
+    if int(np.min(s)) < 0 or int(np.max(s)) >= 1 << m:
+        raise ValueError(f"Nilai output S-Box harus berada dalam range 0-{(1 << m) - 1} ({m} bit)")
+    return n, m
+
+def _row_blocks(rows, row_elements):
+    """Slice blok baris sehingga (baris per blok) * row_elements <= BLOCK_ELEMENTS."""
+    step = max(1, BLOCK_ELEMENTS // max(1, row_elements))
+    return [slice(start, min(start + step, rows)) for start in range(0, rows, step)]
+
+
+@lru_cache(maxsize=None)
+def _hadamard_matrix(size):
+    """Matriks Hadamard Sylvester berukuran size x size (float64, untuk BLAS)."""
+    h = np.ones((1, 1))
+    while h.shape[0] < size:
+        h = np.block([[h, h], [h, -h]])
+    return h
+
 def walsh_hadamard_transform(f):
-    """Menghitung Walsh-Hadamard Transform (WHT) dari fungsi boolean f."""
-    n = len(f)
-    w = f.copy()
-    h = 1
-    while h < n:
-        for i in range(0, n, h * 2):
-            for j in range(i, i + h):
-                x = w[j]
-                y = w[j + h]
-                w[j] = x + y
-                w[j + h] = x - y
-        h *= 2
-    return w
-
-def get_bit_components(sbox):
-    """Memecah S-Box menjadi 8 fungsi boolean (koordinat)."""
-    n = len(sbox)
-    components = []
-    for i in range(8):
-        # Ambil bit ke-i dari setiap output S-Box
-        comp = np.array([(x >> i) & 1 for x in sbox])
-        components.append(comp)
-    return components
-
-def calculate_nl(sbox):
-    """Menghitung Nonlinearity (NL)."""
-    components = get_bit_components(sbox)
-    n = 8
-    min_nl = 255
-    
-    for f in components:
-        f_signed = np.where(f == 0, 1, -1)
-        spectrum = walsh_hadamard_transform(f_signed)
-        max_abs_wht = np.max(np.abs(spectrum))
-        nl = (2**(n-1)) - (max_abs_wht / 2)
-        if nl < min_nl:
-            min_nl = nl
-            
-    return int(min_nl)
-
-def calculate_sac(sbox):
+    """
+    Menghitung Walsh-Hadamard Transform (WHT) dari fungsi boolean f.
+    f boleh berdimensi (..., N): transformasi berjalan di sumbu terakhir untuk
+    semua baris (dan semua kandidat) sekaligus.
+
+    H_N difaktorkan sebagai H_a (x) H_b (N = a * b), sehingga transformasi menjadi
+    H_a @ F @ H_b untuk setiap baris F (a x b) dalam satu matmul batch, tanpa
+    salinan transpose. Perhitungan di float64 tetap eksak untuk nilai bulat (< 2^53).
+    """
+    w = np.asarray(f, dtype=np.float64)
+    n = w.shape[-1]
+    lead = w.shape[:-1]
+    a = 1 << ((n.bit_length() - 1) // 2)
+    b = n // a
+
+    # Indeks x = hi * b + lo: H_a mentransformasi bagian hi, H_b bagian lo
+    w = _hadamard_matrix(a) @ w.reshape(-1, a, b) @ _hadamard_matrix(b)
+    return w.reshape(lead + (n,)).astype(np.int64)
+
+# --- Tabel kebenaran terpaket (bit-packed) ---
+# Tabel kebenaran 2^n entri disimpan sebagai word uint64 (256 entri -> 4 word): bit x
+# berada di word x // 64, posisi x % 64; untuk n < 6 sisa word diisi 0. Kombinasi XOR,
+# bobot, flip input (SAC) dan ANF dikerjakan per word dengan XOR/shift + popcount.
+
+WORD_BITS = 64
+
+# Mask posisi dalam satu word yang bit ke-i indeksnya 0 (untuk flip input bit i < 6)
+_LOW_HALF_MASKS = np.array(
+    [sum(1 << p for p in range(WORD_BITS) if not (p >> i) & 1) for i in range(6)], dtype=np.uint64
+)
+
+def pack_truth_tables(f):
+    """Mengemas tabel kebenaran 0/1 (..., 2^n) menjadi (..., ceil(2^n / 64)) uint64."""
+    bits = np.packbits(np.asarray(f, dtype=np.uint8) & 1, axis=-1, bitorder="little")
+    pad = -bits.shape[-1] % 8
+    if pad:
+        bits = np.concatenate([bits, np.zeros(bits.shape[:-1] + (pad,), dtype=np.uint8)], axis=-1)
+    return np.ascontiguousarray(bits).view("<u8").astype(np.uint64)
+
+def unpack_truth_tables(packed, size=None):
+    """Kebalikan pack_truth_tables: (..., word) uint64 -> (..., size) int64 (0/1)."""
+    raw = np.ascontiguousarray(packed, dtype="<u8").view(np.uint8)
+    return np.unpackbits(raw, axis=-1, bitorder="little", count=size).astype(np.int64)
+
+def popcount(words):
+    """Popcount per word uint64 (np.bitwise_count jika tersedia, selain itu tabel byte)."""
+    words = np.asarray(words, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).astype(np.int64)
+    return HW_TABLE[np.ascontiguousarray(words)[..., None].view(np.uint8)].sum(axis=-1)
+
+def packed_weight(packed):
+    """Bobot Hamming tabel kebenaran terpaket (jumlah x dengan f(x) = 1)."""
+    return popcount(packed).sum(axis=-1)
+
+def packed_correlation(f, g, size=None):
+    """Korelasi sum_x (-1)^(f(x) XOR g(x)) = N - 2 * wt(f XOR g), N = size (default word * 64)."""
+    f = np.asarray(f, dtype=np.uint64)
+    if size is None:
+        size = f.shape[-1] * WORD_BITS
+    return size - 2 * packed_weight(f ^ np.asarray(g, dtype=np.uint64))
+
+def packed_input_flip(packed, i):
+    """Tabel kebenaran g(x) = f(x XOR e_i) dari f terpaket."""
+    packed = np.asarray(packed, dtype=np.uint64)
+    if i < 6:
+        shift = np.uint64(1 << i)
+        mask = _LOW_HALF_MASKS[i]
+        return ((packed >> shift) & mask) | ((packed & mask) << shift)
+    words = np.arange(packed.shape[-1]) ^ (1 << (i - 6))
+    return packed[..., words]
+
+def packed_coordinates(sbox, m=None):
+    """m fungsi koordinat S-Box dalam bentuk terpaket: (..., m, word)."""
+    s = np.asarray(sbox, dtype=np.int64)
+    _, m = sbox_widths(s, m)
+    return pack_truth_tables((s[..., None, :] >> np.arange(m)[:, None]) & 1)
+
+def packed_components(sbox, masks=None, m=None):
+    """
+    Fungsi komponen b.S(x) terpaket untuk mask b (default b = 1..2^m - 1): (..., jumlah mask, word).
+    Semua 2^m kombinasi dibangun dengan menggandakan: komponen[b | 2^i] = komponen[b] XOR f_i.
+    """
+    coords = packed_coordinates(sbox, m)
+    m = coords.shape[-2]
+    components = np.zeros(coords.shape[:-2] + (1 << m, coords.shape[-1]), dtype=np.uint64)
+    for i in range(m):
+        components[..., 1 << i:2 << i, :] = components[..., :1 << i, :] ^ coords[..., i, None, :]
+    if masks is None:
+        masks = np.arange(1, 1 << m)
+    return components[..., np.asarray(masks), :]
+
+def packed_avalanche_counts(packed, n):
+    """counts[..., i] = #{x : f(x) != f(x XOR e_i)} untuk n bit input i."""
+    return np.stack(
+        [packed_weight(packed ^ packed_input_flip(packed, i)) for i in range(n)], axis=-1
+    )
+
+def packed_anf(packed, n):
+    """ANF (transformasi Mobius) dari tabel kebenaran terpaket n variabel, tetap terpaket."""
+    anf = np.array(packed, dtype=np.uint64)
+    for i in range(min(n, 6)):
+        shift = np.uint64(1 << i)
+        anf ^= (anf & _LOW_HALF_MASKS[i]) << shift
+    for i in range(n - 6):
+        high = np.arange(anf.shape[-1]) & (1 << i) != 0
+        anf[..., high] ^= anf[..., np.flatnonzero(high) ^ (1 << i)]
+    return anf
+
+@lru_cache(maxsize=None)
+def _degree_masks(n):
+    """Mask terpaket monomial berderajat d (bobot Hamming indeks = d), d = 0..n."""
+    return pack_truth_tables(HW_TABLE[None, :1 << n] == np.arange(n + 1)[:, None])
+
+def packed_degrees(packed, n):
+    """Derajat aljabar tabel kebenaran terpaket n variabel: derajat monomial aktif tertinggi."""
+    anf = packed_anf(packed, n)
+    active = np.any((anf[..., None, :] & _degree_masks(n)) != 0, axis=-1)
+    return np.max(np.where(active, np.arange(n + 1), 0), axis=-1)
+
+def _walsh_blocks(sbox, masks):
+    """
+    Spektrum Walsh per blok mask: menghasilkan (slice mask, spektrum (..., blok, 2^n)).
+    Komponen dibangun sekali dalam bentuk terpaket lalu dibuka per blok.
+    """
+    s = np.asarray(sbox, dtype=np.int64)
+    masks = np.asarray(masks, dtype=np.int64)
+    packed = packed_components(s, masks)
+    for block in _row_blocks(len(masks), s.size):
+        components = unpack_truth_tables(packed[..., block, :], s.shape[-1])
+        yield block, walsh_hadamard_transform(1 - 2 * components)
+
+def walsh_spectra(sbox, masks=None):
+    """Spektrum Walsh (bentuk +-1) dari fungsi komponen, dihitung per blok mask."""
+    s = np.asarray(sbox, dtype=np.int64)
+    if masks is None:
+        masks = np.arange(1, 1 << sbox_widths(s)[1])
+    spectra = np.empty(s.shape[:-1] + (len(masks), s.shape[-1]), dtype=np.int64)
+    for block, values in _walsh_blocks(s, masks):
+        spectra[..., block, :] = values
+    return spectra
+
+def walsh_table(sbox, m=None):
+    """
+    Tabel Walsh penuh W[b, a] = sum_x (-1)^(b.S(x) XOR a.x) untuk semua b, a (2^m x 2^n).
+    Linear Approximation Table (LAT) = W / 2.
+    """
+    return walsh_spectra(sbox, np.arange(1 << sbox_widths(sbox, m)[1]))
+
+def xor_differences(sbox, rows=None):
+    """Array diff[a, x] = S(x) XOR S(x XOR a) untuk beda input a di rows (default semua)."""
+    s = np.asarray(sbox)
+    s = s.astype(np.uint8 if sbox_widths(s)[1] <= 8 else np.uint16)
+    x = np.arange(s.shape[-1])
+    a = x if rows is None else np.asarray(rows)
+    return np.take(s, x[None, :] ^ a[:, None], axis=-1) ^ s[..., None, :]
+
+def _ddt_blocks(sbox, m=None):
+    """
+    DDT per blok baris: menghasilkan (slice baris a, blok (..., baris, 2^m)).
+    Setiap pasangan (kandidat, a) mendapat rentang bincount sendiri.
+    """
+    s = np.asarray(sbox, dtype=np.int64)
+    _, m = sbox_widths(s, m)
+    size = s.shape[-1]
+    width = 1 << m
+    lead = s.shape[:-1]
+    count = int(np.prod(lead))
+    for block in _row_blocks(size, s.size):
+        rows = np.arange(size)[block]
+        keys = xor_differences(s, rows).reshape(count * len(rows), size).astype(np.int64)
+        keys += (np.arange(count * len(rows)) * width)[:, None]
+        ddt = np.bincount(keys.ravel(), minlength=count * len(rows) * width)
+        yield block, ddt.reshape(lead + (len(rows), width))
+
+def difference_distribution_table(sbox, m=None):
+    """
+    Difference Distribution Table (DDT): ddt[a][b] = #{x : S(x) XOR S(x XOR a) = b}.
+    Tabel dibangun dengan bincount atas pasangan (a, b), per blok baris.
+    sbox boleh berdimensi (..., 2^n); setiap S-Box mendapat blok bincount sendiri.
+    """
+    s = np.asarray(sbox, dtype=np.int64)
+    _, m = sbox_widths(s, m)
+    ddt = np.empty(s.shape + (1 << m,), dtype=np.int64)
+    for block, rows in _ddt_blocks(s, m):
+        ddt[..., block, :] = rows
+    return ddt
+
+def differential_spectrum(ddt):
+    """
+    Spektrum diferensial: {nilai entri DDT: jumlah kemunculan} untuk a != 0.
+    Contoh S-Box AES: {0: 32895, 2: 32130, 4: 255}.
+    """
+    counts = np.bincount(np.asarray(ddt)[1:].ravel())
+    return {int(v): int(c) for v, c in enumerate(counts) if c}
+
+def autocorrelation_table(sbox, ddt=None):
+    """
+    Tabel autokorelasi AC[b, a] = sum_x (-1)^(b.(S(x) XOR S(x XOR a))) untuk semua
+    beta b dan shift a, dalam satu WHT batch atas baris DDT:
+    AC[b, a] = sum_y DDT[a, y] * (-1)^(b.y).
+    """
+    if ddt is not None:
+        return np.swapaxes(walsh_hadamard_transform(ddt), -1, -2)
+    s = np.asarray(sbox, dtype=np.int64)
+    _, m = sbox_widths(s)
+    ac = np.empty(s.shape[:-1] + (1 << m, s.shape[-1]), dtype=np.int64)
+    for block, rows in _ddt_blocks(s):
+        ac[..., block] = np.swapaxes(walsh_hadamard_transform(rows), -1, -2)
+    return ac
+
+def boomerang_connectivity_table(sbox, max_pairs=CHUNK_ELEMENTS):
+    """
+    Boomerang Connectivity Table (BCT):
+    bct[a][b] = #{x : S^-1(S(x) XOR b) XOR S^-1(S(x XOR a) XOR b) = a}.
+
+    Dengan y = S(x) dan D[g, y] = S^-1(y) XOR S^-1(y XOR g) (tabel beda XOR dari S^-1),
+    bct[a][b] = #{(g, y) : D[g, y] = a dan D[g, y XOR b] = a}. Untuk setiap g, nilai y
+    dikelompokkan menurut D[g, y]; setiap pasangan (y, y') dalam kelompok yang sama
+    menyumbang 1 ke bct[a][y XOR y']. Biayanya sebanding dengan sum DDT^2, bukan 2^(3n).
+    max_pairs membatasi jumlah pasangan per chunk baris g (memori).
+    """
+    s = np.asarray(sbox, dtype=np.int64)
+    n = len(s)
+    if len(np.unique(s)) != n:
+        raise ValueError("BCT hanya terdefinisi untuk S-Box bijektif")
+    inverse = np.empty(n, dtype=np.int64)
+    inverse[s] = np.arange(n)
+
+    row_pairs = np.concatenate([np.sum(rows ** 2, axis=-1) for _, rows in _ddt_blocks(inverse)])
+    y = np.arange(n)
+
+    # g = 0: semua y sekelas (a = 0), sehingga bct[0][b] = n
+    bct = np.zeros(n * n, dtype=np.int64)
+    bct[:n] += n
+
+    g = 1
+    while g < n:
+        # Kelompokkan baris g sebanyak mungkin selama jumlah pasangan <= max_pairs
+        end = g + 1
+        total = row_pairs[g]
+        while end < n and total + row_pairs[end] <= max_pairs:
+            total += row_pairs[end]
+            end += 1
+
+        diffs = xor_differences(inverse, np.arange(g, end)).astype(np.int64)
+        keys = (np.arange(g, end)[:, None] * n + diffs).ravel()
+        ys = np.broadcast_to(y, (end - g, n)).ravel()
+        order = np.argsort(keys, kind="stable")
+        keys, ys = keys[order], ys[order]
+
+        # Semua pasangan berurutan (i, j) di dalam setiap kelompok kunci yang sama
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        sizes = np.diff(np.r_[starts, len(keys)])
+        per_element = np.repeat(sizes, sizes)
+        first = np.repeat(np.arange(len(keys)), per_element)
+        offsets = np.arange(first.size) - np.repeat(np.cumsum(per_element) - per_element, per_element)
+        second = np.repeat(np.repeat(starts, sizes), per_element) + offsets
+
+        a = keys[first] % n
+        bct += np.bincount(a * n + (ys[first] ^ ys[second]), minlength=n * n)
+        g = end
+
+    return bct.reshape(n, n)
+
+def differential_linear_table(sbox, ac=None):
+    """
+    Differential-Linear Connectivity Table (DLCT):
+    dlct[a][b] = #{x : b.S(x) = b.S(x XOR a)} - N/2 = AC[b, a] / 2,
+    diambil langsung dari tabel autokorelasi.
+    """
+    if ac is None:
+        ac = autocorrelation_table(sbox)
+    return np.swapaxes(ac, -1, -2) // 2
+
+# --- Turunan metrik dari tabel (dipakai bersama oleh calculate_*, SBoxProfile, dan batch) ---
+# Semua helper mereduksi sumbu terakhir, sehingga tabel dengan sumbu kandidat di depan
+# menghasilkan satu nilai per kandidat.
+
+def _nl_from_spectra(spectra):
+    """NL minimum atas baris-baris spektrum Walsh."""
+    size = spectra.shape[-1]
+    max_abs_wht = np.max(np.abs(spectra), axis=(-2, -1))
+    return (size // 2) - (max_abs_wht / 2)
+
+def _bic_nl_from_spectra(spectra):
+    """Rata-rata NL dari spektrum pasangan komponen h = f_i XOR f_j."""
+    size = spectra.shape[-1]
+    pair_nl = (size // 2) - (np.max(np.abs(spectra), axis=-1) / 2)
+    return np.sum(pair_nl, axis=-1) / spectra.shape[-2]
+
+def _du_dap_from_ddt(ddt):
+    """DU dan DAP dari DDT (baris a = 0 diabaikan)."""
+    du = np.max(ddt[..., 1:, :], axis=(-2, -1))
+    dap = du / ddt.shape[-2]
+    return du, dap
+
+def _lap_from_spectra(spectra):
+    """LAP dari spektrum semua komponen non-nol."""
+    # Bias standar = MaxCorrelation / 2^(n+1) (S-Box 8-bit: MaxCorr / 512)
+    return np.max(np.abs(spectra), axis=(-2, -1)) / (2 * spectra.shape[-1])
+
+def _ci_from_spectra(spectra):
+    """CI minimum atas fungsi koordinat."""
+    # Bobot terendah dari mask w != 0 dengan spektrum non-nol, per fungsi koordinat
+    size = spectra.shape[-1]
+    weights = HW_TABLE[1:size]
+    lowest_weight_nonzero = np.where(spectra[..., 1:] != 0, weights, size.bit_length() - 1).min(axis=-1)
+    min_ci = np.min(lowest_weight_nonzero - 1, axis=-1)
+    return np.maximum(0, min_ci)
+
+def _bu_from_bct(bct):
+    """Boomerang uniformity: maksimum BCT untuk a != 0 dan b != 0."""
+    return np.max(bct[..., 1:, 1:], axis=(-2, -1))
+
+def _dlct_max_from_autocorrelation(ac):
+    """Maksimum |DLCT| untuk a != 0 dan b != 0."""
+    return np.max(np.abs(ac[..., 1:, 1:]), axis=(-2, -1)) // 2
+
+def _to_from_sum_abs(sum_abs_ac, N):
+    """TO dari sum_{a != 0} |AC_beta(a)| untuk beta = 1..2^m - 1 (N = 2^n shift)."""
+    m = sum_abs_ac.shape[-1].bit_length()
+    term = sum_abs_ac / (N * (N - 1))
+    return np.max(m - term, axis=-1)
+
+def _to_from_autocorrelation(ac):
+    """TO dari baris-baris tabel autokorelasi (beta != 0)."""
+    # Sum absolute AC untuk a != 0, dinormalisasi, lalu maksimum atas beta
+    return _to_from_sum_abs(np.sum(np.abs(ac[..., 1:]), axis=-1), ac.shape[-1])
+
+def _hw_sum_from_ddt(rows):
+    """sum_{a, b} DDT[a, b] * HW(b) atas baris-baris DDT yang diberikan."""
+    return np.sum(rows @ HW_TABLE[: rows.shape[-1]], axis=-1)
+
+def _dac_deviation_from_ddt(rows, N):
+    """
+    sum_{a, j} |p(a, j) - 1/2| atas baris-baris DDT yang diberikan, dengan
+    p(a, j) = sum_b DDT[a, b] * b_j / N: probabilitas bit output j berubah untuk beda a.
+    """
+    size = rows.shape[-1]
+    bits = (np.arange(size)[:, None] >> np.arange(size.bit_length() - 1)) & 1
+    return np.sum(np.abs((rows @ bits) / N - 0.5), axis=(-2, -1))
+
+def _branch_from_ddt(rows, inputs):
+    """Branch number diferensial: min HW(a) + HW(b) atas entri DDT[a, b] > 0 (baris = inputs)."""
+    weights = HW_TABLE[inputs][:, None] + HW_TABLE[: rows.shape[-1]][None, :]
+    return np.min(np.where(rows > 0, weights, 2 * MAX_BITS + 1), axis=(-2, -1))
+
+def _side_channel_from_spectra(spectra):
+    """
+    Metrik side-channel dari spektrum Walsh m fungsi koordinat (..., m, N).
+    Dengan h = HW(S(x)) dan sum_i W_i(a) = jumlah spektrum koordinat:
+    - WHT(h)(a) = (m * N / 2) [a = 0] - sum_i W_i(a) / 2, autokorelasi
+      R(d) = sum_x h(x) h(x XOR d) = WHT(WHT(h)^2) / N, dan koefisien konfusi
+      kappa(d) = E[(h(x) - h(x XOR d))^2] = 2 (R(0) - R(d)) / N untuk d = k_a XOR k_b;
+      cc_var = variansi kappa atas d != 0 (setara atas semua pasangan kunci berbeda).
+    - dpa_snr (Guilley): m * 2^n * (sum_a (sum_i W'_i(a))^4)^(-1/2) dengan W' = W / 2^(n/2).
+    """
+    m, N = spectra.shape[-2:]
+    total = np.sum(spectra, axis=-2)
+    h_spectrum = -total / 2
+    h_spectrum[..., 0] += m * N / 2
+    autocorrelation = walsh_hadamard_transform(h_spectrum ** 2) // N
+    kappa = 2 * (autocorrelation[..., :1] - autocorrelation[..., 1:]) / N
+    snr = m * N * N / np.sqrt(np.sum(total.astype(np.float64) ** 4, axis=-1))
+    return np.var(kappa, axis=-1), snr
+
+# --- Reduksi berblok: metrik dari tabel 2^n x 2^m tanpa menyimpan tabel penuh ---
+
+def _blocked_walsh(sbox, keep=(), m=None):
+    """
+    Satu lintasan per blok atas semua mask b = 1..2^m - 1:
+    - max_abs = maks |W_b(a)| (LAP)
+    - kept = baris spektrum untuk mask di keep (mis. koordinat dan pasangan BIC)
+    """
+    s = np.asarray(sbox, dtype=np.int64)
+    _, m = sbox_widths(s, m)
+    masks = np.arange(1, 1 << m)
+    keep = np.asarray(keep, dtype=np.int64)
+    kept = np.empty(s.shape[:-1] + (len(keep), s.shape[-1]), dtype=np.int64)
+    max_abs = 0
+    for block, spectra in _walsh_blocks(s, masks):
+        max_abs = np.maximum(max_abs, np.max(np.abs(spectra), axis=(-2, -1)))
+        inside = (keep >= masks[block][0]) & (keep <= masks[block][-1])
+        kept[..., inside, :] = spectra[..., keep[inside] - masks[block][0], :]
+    return max_abs, kept
+
+def _differential_blocks(sbox, m, ddt=None):
+    """Blok baris DDT: dari tabel penuh yang sudah ada (ddt) atau dibangun per blok."""
+    if ddt is None:
+        return _ddt_blocks(sbox, m)
+    return ((slice(0, ddt.shape[-2]), np.asarray(ddt, dtype=np.int64)),)
+
+def _blocked_differential(sbox, autocorrelation=True, m=None, ddt=None):
+    """
+    Satu lintasan per blok baris DDT (a != 0):
+    - du = maks DDT[a, b]
+    - sum_abs[..., beta-1] = sum_{a != 0} |AC_beta(a)| untuk beta != 0 (TO)
+    - max_abs = maks |AC_beta(a)| untuk a, beta != 0 (DLCT)
+    Autokorelasi (WHT per baris) dilewati jika autocorrelation=False.
+    ddt: DDT penuh yang sudah dihitung (opsional), dipakai tanpa membangun ulang.
+    """
+    s = np.asarray(sbox, dtype=np.int64)
+    _, m = sbox_widths(s, m)
+    du = 0
+    sum_abs = np.zeros(s.shape[:-1] + ((1 << m) - 1,), dtype=np.int64) if autocorrelation else None
+    max_abs = 0 if autocorrelation else None
+    for block, rows in _differential_blocks(s, m, ddt):
+        if block.start == 0:
+            rows = rows[..., 1:, :]
+        if not rows.shape[-2]:
+            continue
+        du = np.maximum(du, np.max(rows, axis=(-2, -1)))
+        if autocorrelation:
+            # ac[..., a, beta] untuk a di blok ini
+            ac = np.abs(walsh_hadamard_transform(rows)[..., 1:])
+            sum_abs += np.sum(ac, axis=-2)
+            max_abs = np.maximum(max_abs, np.max(ac, axis=(-2, -1)))
+    return du, sum_abs, max_abs
+
+def calculate_nl(sbox, m=None):
+    """Menghitung Nonlinearity (NL). m: lebar output (default disimpulkan dari nilai)."""
+    return int(_nl_from_spectra(walsh_spectra(sbox, coordinate_masks(sbox_widths(sbox, m)[1]))))
+
+def avalanche_matrices(sbox, m=None):
+    """
+    Mesin avalanche: komponen terpaket dibandingkan dengan versi yang bit inputnya
+    diflip, lalu diturunkan:
+    - sac_matrix[i, j]: probabilitas bit output j berubah saat bit input i diflip
+    - bic_sac_matrix[j, k]: SAC dari h = f_j XOR f_k (simetris, diagonal 0)
+    """
+    n, m = sbox_widths(sbox, m)
+    return avalanche_from_components(packed_components(sbox, np.arange(1 << m), m), n)
+
+def avalanche_from_components(packed, n):
+    """
+    Matriks avalanche dari 2^m komponen terpaket (..., 2^m, word) fungsi n variabel:
+    counts[b, i] = jumlah perubahan b.S saat bit input i diflip (XOR + popcount per word).
+    """
+    N = 1 << n
+    coords = coordinate_masks(packed.shape[-2].bit_length() - 1)
+    counts = packed_avalanche_counts(packed, n)
+    sac_matrix = np.swapaxes(counts[..., coords, :], -1, -2) / N
+
+    # h = f_j XOR f_k adalah komponen dengan mask e_j XOR e_k (diagonal: mask 0 -> 0)
+    pairs = coords[:, None] ^ coords[None, :]
+    bic_sac_matrix = counts[..., pairs, :].sum(axis=-1) / (N * n)
+    return sac_matrix, bic_sac_matrix
+
+def _bic_sac_from_matrix(bic_sac_matrix):
+    """Rata-rata BIC-SAC atas C(m, 2) pasangan (segitiga atas matriks)."""
+    upper = np.triu_indices(bic_sac_matrix.shape[-1], k=1)
+    return np.mean(bic_sac_matrix[..., upper[0], upper[1]], axis=-1)
+
+def calculate_sac(sbox, m=None):
     """Menghitung Strict Avalanche Criterion (SAC) global."""
-    n = 8
-    total_sac = 0
-    count = 0
-    
-    for i in range(n):
-        input_mask = 1 << i
-        change_count = 0
-        total_pairs = 0
-        
-        for x in range(256):
-            y1 = sbox[x]
-            y2 = sbox[x ^ input_mask]
-            diff = y1 ^ y2
-            hw = bin(diff).count('1')
-            change_count += hw
-            total_pairs += 1
-            
-        avg_change = change_count / (total_pairs * n)
-        total_sac += avg_change
-        count += 1
-        
-    return total_sac / count
+    sac_matrix, _ = avalanche_matrices(sbox, m)
+    return float(np.mean(sac_matrix))
 
 # --- FUNGSI BARU/UPDATED UNTUK BIC-SAC ---
 def calculate_sac_of_function(f):
     """
     Helper: Menghitung SAC untuk satu fungsi boolean f.
-    Digunakan di dalam perhitungan BIC-SAC.
+    Probabilitas rata-rata f berubah saat satu bit input diflip (Ideal 0.5).
     """
-    n = 8
-    total_sac = 0
-    
-    for i in range(n): # Bit input ke-i diflip
-        input_mask = 1 << i
-        flip_count = 0
-        
-        for x in range(256):
-            y1 = f[x]
-            y2 = f[x ^ input_mask]
-            if y1 != y2:
-                flip_count += 1
-                
-        # Probabilitas bit output berubah (Ideal 0.5)
-        prob = flip_count / 256.0
-        total_sac += prob
-        
-    return total_sac / n
-
-def calculate_bic(sbox):
+    n = len(f).bit_length() - 1
+    counts = packed_avalanche_counts(pack_truth_tables(f), n)
+    return float(np.mean(counts) / len(f))
+
+def calculate_bic_sac(sbox, m=None):
+    """Menghitung BIC-SAC: rata-rata SAC dari h = f_i XOR f_j untuk C(m, 2) pasangan."""
+    _, bic_sac_matrix = avalanche_matrices(sbox, m)
+    return float(_bic_sac_from_matrix(bic_sac_matrix))
+
+def calculate_bic(sbox, m=None):
     """
     Menghitung Bit Independence Criterion (BIC).
     Output: Tuple (BIC-NL, BIC-SAC)
     """
-    components = get_bit_components(sbox)
-    n = 8
-    
-    sum_bic_nl = 0
-    sum_bic_sac = 0
-    pair_count = 0
-    
-    for i in range(n):
-        for j in range(i + 1, n):
-            # XOR dua komponen fungsi output
-            h = components[i] ^ components[j]
-            
-            # 1. Hitung NL untuk h (BIC-NL)
-            h_signed = np.where(h == 0, 1, -1)
-            spectrum = walsh_hadamard_transform(h_signed)
-            nl = (2**(n-1)) - (np.max(np.abs(spectrum)) / 2)
-            sum_bic_nl += nl
-            
-            # 2. Hitung SAC untuk h (BIC-SAC)
-            # Pastikan fungsi helper 'calculate_sac_of_function' sudah ada di atas
-            sac_val = calculate_sac_of_function(h)
-            sum_bic_sac += sac_val
-            
-            pair_count += 1
-            
-    avg_bic_nl = sum_bic_nl / pair_count
-    avg_bic_sac = sum_bic_sac / pair_count
-    
+    # BIC-NL: spektrum Walsh semua fungsi h = f_i XOR f_j dihitung sekaligus
+    pairs = pair_masks(sbox_widths(sbox, m)[1])
+    avg_bic_nl = float(_bic_nl_from_spectra(walsh_spectra(sbox, pairs)))
+    avg_bic_sac = calculate_bic_sac(sbox, m)
     return avg_bic_nl, avg_bic_sac
 # ---------------------------------------------
 
-def calculate_du_dap(sbox):
+def calculate_du_dap(sbox, m=None):
     """Menghitung Differential Uniformity (DU) dan DAP."""
-    n = 256
-    ddt = np.zeros((n, n), dtype=int)
-    
-    for input_diff in range(1, n):
-        for x in range(n):
-            y1 = sbox[x]
-            y2 = sbox[x ^ input_diff]
-            output_diff = y1 ^ y2
-            ddt[input_diff][output_diff] += 1
-            
-    du = int(np.max(ddt))
-    dap = du / n
-    return du, dap
+    du, _, _ = _blocked_differential(sbox, autocorrelation=False, m=m)
+    return int(du), float(du / np.shape(sbox)[-1])
 
-def calculate_lap(sbox):
+def calculate_lap(sbox, m=None):
     """Menghitung Linear Approximation Probability (LAP)."""
-    n = 8
-    max_bias = 0
-    components = get_bit_components(sbox)
-    
-    for i in range(1, 256): 
-        f_comb = np.zeros(256, dtype=int)
-        for bit in range(8):
-            if (i >> bit) & 1:
-                f_comb ^= components[bit]
-        
-        f_signed = np.where(f_comb == 0, 1, -1)
-        spectrum = walsh_hadamard_transform(f_signed)
-        
-        current_max = np.max(np.abs(spectrum))
-        # Bias standar = MaxCorrelation / 2^(n+1) -> di sini kita pakai MaxCorr / 512
-        this_lap = (current_max) / 512 
-        if this_lap > max_bias:
-            max_bias = this_lap
-            
-    return max_bias
+    # Spektrum semua fungsi komponen b.S(x), direduksi per blok mask
+    return float(_blocked_walsh(sbox, m=m)[0] / (2 * np.shape(sbox)[-1]))
 
 def algebraic_normal_form(f):
-    """Helper ANF."""
-    n = len(f)
-    anf = f.copy()
+    """
+    Helper ANF (transformasi Mobius di GF(2)).
+    f boleh 1-D atau 2-D (satu fungsi per baris); semua baris ditransformasi sekaligus.
+    """
+    anf = np.array(f, dtype=np.int64)
+    n = anf.shape[-1]
+    lead = anf.shape[:-1]
     h = 1
     while h < n:
-        for i in range(0, n, h * 2):
-            for j in range(i, i + h):
-                anf[j + h] ^= anf[j]
+        # Tahap butterfly: setiap blok (x, y) berukuran h menjadi (x, x XOR y)
+        anf = anf.reshape(lead + (n // (h * 2), 2, h))
+        x = anf[..., 0, :]
+        y = anf[..., 1, :]
+        anf = np.stack((x, x ^ y), axis=-2)
         h *= 2
-    return anf
+    return anf.reshape(lead + (n,))
+
+def algebraic_degrees(sbox, m=None):
+    """Derajat aljabar setiap fungsi komponen b.S(x), diindeks dengan mask b (b = 0 -> 0)."""
+    n, m = sbox_widths(sbox, m)
+    return packed_degrees(packed_components(sbox, np.arange(1 << m), m), n)
+
+def algebraic_degree_profile(sbox, m=None):
+    """
+    Profil derajat aljabar dari semua fungsi komponen non-nol:
+    - max_degree: derajat maksimum (= AD)
+    - min_degree: derajat komponen minimum (untuk screening higher-order differential)
+    - degrees: derajat per komponen, diindeks dengan mask b
+    """
+    degrees = algebraic_degrees(sbox, m)
+    return {
+        "max_degree": int(np.max(degrees[1:])),
+        "min_degree": int(np.min(degrees[1:])),
+        "degrees": degrees,
+    }
 
-def calculate_ad(sbox):
+def calculate_ad(sbox, m=None):
     """Menghitung Algebraic Degree (AD)."""
-    components = get_bit_components(sbox)
-    max_degree = 0
-    
-    for f in components:
-        anf = algebraic_normal_form(f)
-        curr_deg = 0
-        for i in range(256):
-            if anf[i] == 1:
-                weight = bin(i).count('1')
-                if weight > curr_deg:
-                    curr_deg = weight
-        if curr_deg > max_degree:
-            max_degree = curr_deg
-            
-    return max_degree
-
-def calculate_ci(sbox):
+    n, m = sbox_widths(sbox, m)
+    return int(np.max(packed_degrees(packed_coordinates(sbox, m), n), axis=-1))
+
+def calculate_ci(sbox, m=None):
     """Menghitung Correlation Immunity (CI)."""
-    components = get_bit_components(sbox)
-    min_ci = 8
-    
-    for f in components:
-        f_signed = np.where(f == 0, 1, -1)
-        spectrum = walsh_hadamard_transform(f_signed)
-        
-        lowest_weight_nonzero = 8
-        for w in range(1, 256):
-            if spectrum[w] != 0:
-                hw = bin(w).count('1')
-                if hw < lowest_weight_nonzero:
-                    lowest_weight_nonzero = hw
-        
-        f_ci = lowest_weight_nonzero - 1
-        if f_ci < min_ci:
-            min_ci = f_ci
-            
-    return max(0, min_ci)
-
-def calculate_to(sbox):
+    return int(_ci_from_spectra(walsh_spectra(sbox, coordinate_masks(sbox_widths(sbox, m)[1]))))
+
+def calculate_to(sbox, m=None):
     """
     Menghitung Transparency Order (TO).
     Rumus (via Autocorrelation): TO = max_beta ( n - (Sum_{a!=0} |AC_beta(a)|) / (N*(N-1)) )
     Semakin kecil nilai TO (ideal), semakin tahan terhadap serangan DPA.
     Namun, S-Box AES standar memiliki TO ~7.8 (yang dianggap tinggi/kurang ideal untuk DPA tanpa masking).
     """
-    n = 8
-    N = 256
-    components = get_bit_components(sbox)
-    max_val = -100.0
-
-    # Iterasi semua kombinasi linear beta (1..255)
-    for beta in range(1, 256):
-        # 1. Konstruksi f_beta = beta * S(x)
-        f_beta = np.zeros(N, dtype=int)
-        for i in range(8):
-            if (beta >> i) & 1:
-                f_beta ^= components[i]
-        
-        # 2. Hitung Spektrum Autocorrelation (AC) menggunakan Teorema Konvolusi
-        #    AC(a) = IWHT( WHT(f)^2 ) / N
-        f_signed = np.where(f_beta == 0, 1, -1)
-        wht = walsh_hadamard_transform(f_signed)
-        
-        # Kuadratkan spektrum WHT (elemen-wise)
-        wht_sq = wht ** 2
-        
-        # Inverse WHT (di GF(2) sama dengan Forward WHT) dibagi N
-        ac = walsh_hadamard_transform(wht_sq) // N
-        
-        # 3. Hitung metrik untuk beta ini
-        #    Sum absolute AC untuk a != 0
-        sum_abs_ac = np.sum(np.abs(ac[1:]))
-        
-        #    Normalisasi
-        term = sum_abs_ac / (N * (N - 1))
-        val = n - term
-        
-        if val > max_val:
-            max_val = val
-            
-    return max_val
-
-def calculate_sv(nl, sac, bic_nl, bic_sac):
+    # Sum |AC| per beta dari blok-blok baris DDT, lalu maksimum atas beta != 0
+    _, sum_abs, _ = _blocked_differential(sbox, m=m)
+    return float(_to_from_sum_abs(sum_abs, np.shape(sbox)[-1]))
+
+def _dac_bd_blocked(sbox, m=None, ddt=None):
+    """DAC dan branch number diferensial dalam satu lintasan blok DDT (a != 0)."""
+    s = np.asarray(sbox, dtype=np.int64)
+    _, m = sbox_widths(s, m)
+    size = s.shape[-1]
+    total = 0
+    branch = 2 * MAX_BITS + 1
+    for block, rows in _differential_blocks(s, m, ddt):
+        inputs = np.arange(size)[block]
+        if block.start == 0:
+            rows, inputs = rows[..., 1:, :], inputs[1:]
+        if len(inputs):
+            total = total + _dac_deviation_from_ddt(rows, size)
+            branch = np.minimum(branch, _branch_from_ddt(rows, inputs))
+    return total / (m * (size - 1)), branch
+
+def calculate_dac(sbox, m=None):
+    """
+    Menghitung Differential Avalanche Criterion (DAC): rata-rata deviasi |p(a, j) - 1/2|
+    atas semua beda input a != 0 dan bit output j, dengan p(a, j) probabilitas bit j
+    berubah. Setara dengan rata-rata |AC_{e_j}(a)| / (2N). Ideal 0; S-Box linear bernilai 0.5.
+    """
+    dac, _ = _dac_bd_blocked(sbox, m)
+    return float(dac)
+
+def low_weight_differences(n, order):
+    """Semua beda input a dengan 1 <= HW(a) <= order (n bit)."""
+    a = np.arange(1, 1 << n)
+    return a[HW_TABLE[a] <= order]
+
+def _pc_from_differences(diffs, m):
+    """PC dari beda output S(x) XOR S(x XOR a) (..., jumlah a, N): rata-rata HW / m."""
+    return np.mean(HW_TABLE[diffs], axis=(-2, -1)) / m
+
+def calculate_pc(sbox, order=2, m=None):
+    """
+    Menghitung Propagation Criterion (PC) orde k: rata-rata probabilitas bit output
+    berubah untuk beda input a dengan 1 <= HW(a) <= k (Ideal 0.5). Setara dengan
+    rata-rata (1 - AC_{e_j}(a) / N) / 2 atas koordinat j; PC orde 1 = SAC.
+    """
+    s = np.asarray(sbox, dtype=np.int64)
+    n, m = sbox_widths(s, m)
+    diffs = xor_differences(s, low_weight_differences(n, order))
+    return float(_pc_from_differences(diffs, m))
+
+def calculate_bd(sbox, m=None):
+    """
+    Menghitung branch number diferensial (BD): min_{x, a != 0} HW(a) + HW(S(x) XOR S(x XOR a)),
+    dibaca dari entri DDT yang tidak nol. Semakin tinggi semakin baik difusinya.
+    """
+    _, bd = _dac_bd_blocked(sbox, m)
+    return int(bd)
+
+def calculate_cc_var(sbox, m=None):
+    """
+    Menghitung variansi koefisien konfusi (model Hamming weight) atas semua pasangan kunci.
+    Semakin kecil, semakin sulit kunci dibedakan lewat DPA/CPA.
+    """
+    spectra = walsh_spectra(sbox, coordinate_masks(sbox_widths(sbox, m)[1]))
+    return float(_side_channel_from_spectra(spectra)[0])
+
+def calculate_dpa_snr(sbox, m=None):
+    """
+    Menghitung SNR DPA tersimulasi (Guilley) untuk model Hamming weight
+    (S-Box AES ~9.6). Semakin kecil semakin tahan DPA.
+    """
+    spectra = walsh_spectra(sbox, coordinate_masks(sbox_widths(sbox, m)[1]))
+    return float(_side_channel_from_spectra(spectra)[1])
+
+def sv_reference(n):
+    """Konstanta acuan SV: batas NL fungsi bent 2^(n-1) - 2^(n/2-1) (120 untuk n = 8)."""
+    return 2.0 ** (n - 1) - 2.0 ** (n / 2 - 1)
+
+def calculate_sv(nl, sac, bic_nl, bic_sac, n=8):
     """
     Menghitung Strength Value (SV) berdasarkan Eq. 20 di paper.
     SV = (120 - NL) + abs(0.5 - SAC) + (120 - BIC_NL) + abs(0.5 - BIC_SAC)
-    Semakin dekat ke 0, semakin baik.
+    Semakin dekat ke 0, semakin baik. Konstanta 120 dari paper (n = 8) diskalakan
+    untuk lebar input n lewat sv_reference(n).
+    """
+    reference = sv_reference(n)
+    sv = (reference - nl) + abs(0.5 - sac) + (reference - bic_nl) + abs(0.5 - bic_sac)
+    return sv
+
+
+# ==========================================
+# ESTIMASI BERBASIS SAMPLING (TRIASE CEPAT)
+# ==========================================
+# SAC, BIC-SAC dan TO adalah rata-rata atas input x (atau shift a). Dengan
+# mengambil sampel acak tanpa pengembalian, rata-rata sampel memberi estimasi
+# dan galat baku-nya memberi interval kepercayaan (aproksimasi normal dengan
+# koreksi populasi hingga). samples = ukuran populasi menghasilkan nilai eksak.
+
+def _sample_indices(rng, population, samples, offset=0):
+    """Indeks sampel tanpa pengembalian dari offset..offset+population-1 (terurut)."""
+    rng = np.random.default_rng(rng)
+    samples = min(int(samples), population)
+    if samples < 2:
+        raise ValueError("samples harus >= 2")
+    return np.sort(rng.choice(population, size=samples, replace=False)) + offset
+
+def _interval(values, population, confidence, min_variance=0.0):
+    """
+    Estimasi rata-rata populasi dari sampel (sumbu terakhir) beserta interval kepercayaan.
+    min_variance: batas bawah variansi sampel (mis. variansi gabungan beberapa estimasi).
+    Returns: dict {"estimate", "low", "high", "half_width", "samples", "confidence"}.
+    """
+    count = values.shape[-1]
+    mean = np.mean(values, axis=-1)
+    fpc = (population - count) / (population - 1)
+    variance = np.maximum(np.var(values, axis=-1, ddof=1), min_variance)
+    stderr = np.sqrt(variance / count * fpc)
+    half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * stderr
+    return {
+        "estimate": mean,
+        "low": mean - half_width,
+        "high": mean + half_width,
+        "half_width": half_width,
+        "samples": count,
+        "confidence": confidence,
+    }
+
+def _as_scalars(result):
+    """Untuk satu S-Box, ubah nilai array 0-D menjadi float."""
+    return {
+        key: float(value) if isinstance(value, (np.ndarray, np.generic)) and np.ndim(value) == 0 else value
+        for key, value in result.items()
+    }
+
+def _input_flip_weights(sbox, xs):
+    """HW(S(x) XOR S(x XOR e_i)) untuk x sampel dan n bit input i: (..., n, jumlah sampel)."""
+    s = np.asarray(sbox, dtype=np.int64)
+    n, _ = sbox_widths(s)
+    flipped = np.take(s, xs[None, :] ^ coordinate_masks(n)[:, None], axis=-1)
+    return HW_TABLE[flipped ^ s[..., None, xs]]
+
+def estimate_sac(sbox, samples=64, rng=None, confidence=0.95):
+    """
+    Estimasi SAC dari sampel input x: SAC = rata-rata_x HW(S(x) XOR S(x XOR e_i)) / (n * m)
+    (dijumlah atas n bit input i). rng: seed atau np.random.Generator.
+    sbox boleh berdimensi (..., 2^n); semua kandidat memakai sampel x yang sama.
+    """
+    s = np.asarray(sbox, dtype=np.int64)
+    n, m = sbox_widths(s)
+    xs = _sample_indices(rng, s.shape[-1], samples)
+    per_input = _input_flip_weights(s, xs).sum(axis=-2) / (n * m)
+    result = _interval(per_input, s.shape[-1], confidence)
+    return _as_scalars(result) if s.ndim == 1 else result
+
+def estimate_bic_sac(sbox, samples=64, rng=None, confidence=0.95):
+    """
+    Estimasi BIC-SAC dari sampel input x. Untuk beda output d, jumlah pasangan (j, k)
+    dengan bit berbeda adalah HW(d) * (m - HW(d)), sehingga
+    BIC-SAC = rata-rata_x sum_i HW(d_i) * (m - HW(d_i)) / (C(m, 2) * n).
+    """
+    s = np.asarray(sbox, dtype=np.int64)
+    n, m = sbox_widths(s)
+    xs = _sample_indices(rng, s.shape[-1], samples)
+    weights = _input_flip_weights(s, xs)
+    per_input = np.sum(weights * (m - weights), axis=-2) / (m * (m - 1) // 2 * n)
+    result = _interval(per_input, s.shape[-1], confidence)
+    return _as_scalars(result) if s.ndim == 1 else result
+
+def estimate_to(sbox, samples=32, rng=None, confidence=0.95):
+    """
+    Estimasi Transparency Order dari sampel shift a != 0.
+    Hanya baris DDT untuk shift sampel yang dibangun; |AC_beta(a)| untuk semua beta
+    didapat dari WHT baris tersebut. Untuk setiap beta:
+    TO_beta = m - rata-rata_a |AC_beta(a)| / N, lalu TO = max_beta TO_beta.
+    Interval: [max_beta low_beta, max_beta high_beta] dengan koreksi Bonferroni atas
+    2^m - 1 beta; estimasi max sedikit bias ke atas untuk sampel kecil.
+    |AC| sangat miring (sebagian besar kecil, sesekali besar), sehingga variansi
+    sampel per beta sering terlalu kecil dan low_beta melewati TO (cakupan ~83% pada
+    32 sampel). Variansi per beta karena itu dibatasi bawah oleh rata-rata variansi
+    semua beta; cakupan empiris >= 95% untuk S-Box acak dan turunan peta invers.
+    """
+    s = np.asarray(sbox, dtype=np.int64)
+    _, m = sbox_widths(s)
+    N = s.shape[-1]
+    width = 1 << m
+    shifts = _sample_indices(rng, N - 1, samples, offset=1)
+
+    diffs = xor_differences(s, shifts).astype(np.int64)
+    lead = diffs.shape[:-2]
+    count = int(np.prod(lead)) * len(shifts)
+    keys = diffs.reshape(count, N) + (np.arange(count) * width)[:, None]
+    ddt_rows = np.bincount(keys.ravel(), minlength=count * width)
+    ddt_rows = ddt_rows.reshape(lead + (len(shifts), width))
+
+    # ac[..., beta, a_sampel] untuk beta != 0
+    ac = np.swapaxes(walsh_hadamard_transform(ddt_rows), -1, -2)[..., 1:, :]
+    values = m - np.abs(ac) / N
+    pooled = np.mean(np.var(values, axis=-1, ddof=1), axis=-1, keepdims=True)
+    per_beta = _interval(values, N - 1, 1 - (1 - confidence) / ac.shape[-2], pooled)
+    best = np.argmax(per_beta["estimate"], axis=-1)[..., None]
+    result = {
+        "estimate": np.take_along_axis(per_beta["estimate"], best, axis=-1)[..., 0],
+        "low": np.max(per_beta["low"], axis=-1),
+        "high": np.max(per_beta["high"], axis=-1),
+        "samples": per_beta["samples"],
+        "confidence": confidence,
+    }
+    result["half_width"] = (result["high"] - result["low"]) / 2
+    return _as_scalars(result) if s.ndim == 1 else result
+
+
+# ==========================================
+# PROVENANCE AFFINE: S(x) = K * INV(x) + C
+# ==========================================
+# Untuk S-Box hasil sbox_logic.construct_sbox, semua tabel adalah permutasi
+# baris/kolom dari tabel peta invers:
+#   W_S[b, a]  = (-1)^(b.C) * W_INV[K^T b, a]
+#   DDT_S[a, K d] = DDT_INV[a, d]
+#   AC_S[b, a] = AC_INV[K^T b, a]
+# sehingga tabel peta invers cukup dihitung sekali.
+
+# Konstanta affine AES (0x63) sebagai integer
+AES_CONSTANT = int(np.sum(sbox_logic.C_AES << np.arange(8)))
+
+def _affine_maps(matrix):
+    """(L, L^T) sebagai tabel int64: L[v] = K.v dan L^T[b] = K^T.b (sbox_logic.linear_tables)."""
+    matrix = sbox_logic.check_binary_matrices(matrix)
+    tables = sbox_logic.linear_tables(np.stack([matrix, np.swapaxes(matrix, -1, -2)]))
+    return tables[0].astype(np.int64), tables[1].astype(np.int64)
+
+@lru_cache(maxsize=None)
+def _inverse_map_profile(poly=0x11B):
+    """Profil peta invers GF(2^8)/poly; tabelnya dihitung sekali per polinomial lalu dipakai ulang."""
+    return SBoxProfile(sbox_logic.gf256(poly).inverse)
+
+
+# Urutan metrik standar (format respons /analyze dan kolom analyze_batch)
+METRICS = ("nl", "sac", "bic_nl", "bic_sac", "du", "dap", "lap", "ad", "ci", "to", "sv")
+
+# Metrik opsional: hanya dihitung jika diminta (extra=...)
+EXTRA_METRICS = ("bu", "dlct_max", "dac", "pc", "bd", "cc_var", "dpa_snr")
+
+def _check_extra_metrics(extra):
+    for name in extra:
+        if name not in EXTRA_METRICS:
+            raise ValueError(f"Metrik opsional tidak dikenal: {name} (tersedia: {', '.join(EXTRA_METRICS)})")
+
+
+class SBoxProfile:
+    """
+    Profil analisis satu S-Box.
+    Tabel perantara (komponen, tabel Walsh/LAT, DDT, autokorelasi) dihitung
+    secara lazy dan paling banyak sekali; setiap metrik diturunkan dari tabel
+    tersebut dan di-cache. m: lebar output (default disimpulkan dari nilai; boleh m < n).
+    """
+
+    def __init__(self, sbox, m=None):
+        self.sbox = np.asarray(sbox, dtype=np.int64)
+        self.n, self.m = sbox_widths(self.sbox, m)
+        self._coordinates = coordinate_masks(self.m)
+        # Provenance affine (diisi oleh from_affine): (profil invers, L, L^T, tanda b.C)
+        self._affine = None
+
+    @classmethod
+    def from_affine(cls, affine_matrix, constant=AES_CONSTANT, sbox=None, field=None):
+        """
+        Profil untuk S(x) = K * INV(x) + C. Tabel Walsh, DDT, autokorelasi, komponen
+        dan derajat diturunkan lewat permutasi indeks dari tabel peta invers;
+        hanya SAC/BIC-SAC yang dihitung langsung dari S-Box.
+        Jika sbox diberikan, harus sama dengan hasil konstruksi dari matriks.
+        constant: integer 0-255 atau vektor 8 bit (LSB dulu), seperti construct_sbox.
+        field: GF256 atau polinomial untuk INV (default medan AES).
+        """
+        field = sbox_logic.as_field(field)
+        constant = sbox_logic.constant_byte(constant)
+        linear, transpose = _affine_maps(affine_matrix)
+        constructed = linear[field.inverse] ^ constant
+        if sbox is not None and not np.array_equal(np.asarray(sbox), constructed):
+            raise ValueError("S-Box tidak sesuai dengan matriks affine yang diberikan")
+
+        profile = cls(constructed)
+        sign = HW_TABLE[np.arange(256) & constant] & 1
+        profile._affine = (_inverse_map_profile(field.poly), linear, transpose, sign)
+        return profile
+
+    # --- Tabel perantara ---
+
+    @cached_property
+    def components(self):
+        """Fungsi komponen b.S(x) untuk semua b = 0..2^m - 1 (baris b), dibuka dari bentuk terpaket."""
+        return unpack_truth_tables(self.packed_components, 1 << self.n)
+
+    @cached_property
+    def packed_components(self):
+        """Fungsi komponen terpaket (2^m, word) uint64 untuk semua b = 0..2^m - 1."""
+        if self._affine is not None:
+            base, _, transpose, sign = self._affine
+            # Konstanta b.C membalik seluruh tabel kebenaran komponen b
+            flip = np.where(sign == 1, np.uint64(2**64 - 1), np.uint64(0))
+            return base.packed_components[transpose] ^ flip[:, None]
+        return packed_components(self.sbox, np.arange(1 << self.m), self.m)
+
+    @cached_property
+    def walsh(self):
+        """Tabel Walsh penuh W[b, a]."""
+        if self._affine is not None:
+            base, _, transpose, sign = self._affine
+            return base.walsh[transpose] * (1 - 2 * sign)[:, None]
+        return walsh_hadamard_transform(1 - 2 * self.components)
+
+    @cached_property
+    def lat(self):
+        """Linear Approximation Table: #{x : a.x = b.S(x)} - 2^(n-1), diindeks [b, a]."""
+        return self.walsh // 2
+
+    @cached_property
+    def ddt(self):
+        if self._affine is not None:
+            # DDT_S[a, L(d)] += DDT_INV[a, d] (akumulasi juga benar untuk K singular)
+            base, linear, _, _ = self._affine
+            ddt = np.zeros_like(base.ddt)
+            np.add.at(ddt.T, linear, base.ddt.T)
+            return ddt
+        return difference_distribution_table(self.sbox, self.m)
+
+    @cached_property
+    def differential_spectrum(self):
+        return differential_spectrum(self.ddt)
+
+    @cached_property
+    def autocorrelation(self):
+        """Tabel autokorelasi AC[b, a], diturunkan dari DDT yang sama."""
+        if self._affine is not None:
+            base, _, transpose, _ = self._affine
+            return base.autocorrelation[transpose]
+        return autocorrelation_table(self.sbox, self.ddt)
+
+    # --- Metrik ---
+
+    @cached_property
+    def nl(self):
+        return int(_nl_from_spectra(self.walsh[self._coordinates]))
+
+    @cached_property
+    def avalanche(self):
+        """Tuple (sac_matrix, bic_sac_matrix) dari komponen terpaket."""
+        return avalanche_from_components(self.packed_components, self.n)
+
+    @cached_property
+    def sac_matrix(self):
+        return self.avalanche[0]
+
+    @cached_property
+    def bic_sac_matrix(self):
+        return self.avalanche[1]
+
+    @cached_property
+    def sac(self):
+        return float(np.mean(self.sac_matrix))
+
+    @cached_property
+    def bic_nl(self):
+        return float(_bic_nl_from_spectra(self.walsh[pair_masks(self.m)]))
+
+    @cached_property
+    def bic_sac(self):
+        return float(_bic_sac_from_matrix(self.bic_sac_matrix))
+
+    @cached_property
+    def du(self):
+        return int(_du_dap_from_ddt(self.ddt)[0])
+
+    @cached_property
+    def dap(self):
+        return float(_du_dap_from_ddt(self.ddt)[1])
+
+    @cached_property
+    def lap(self):
+        return float(_lap_from_spectra(self.walsh[1:]))
+
+    @cached_property
+    def anf(self):
+        """ANF semua fungsi komponen (baris b)."""
+        if self._affine is not None:
+            # Konstanta b.C hanya membalik koefisien monomial 1
+            base, _, transpose, sign = self._affine
+            anf = base.anf[transpose]
+            anf[:, 0] ^= sign
+            return anf
+        return algebraic_normal_form(self.components)
+
+    @cached_property
+    def degrees(self):
+        """Derajat aljabar per komponen, diindeks dengan mask b."""
+        if self._affine is not None:
+            base, _, transpose, _ = self._affine
+            return base.degrees[transpose]
+        return packed_degrees(self.packed_components, self.n)
+
+    @cached_property
+    def ad(self):
+        return int(np.max(self.degrees[self._coordinates]))
+
+    @cached_property
+    def ad_min(self):
+        """Derajat minimum atas semua komponen non-nol."""
+        return int(np.min(self.degrees[1:]))
+
+    @cached_property
+    def ci(self):
+        return int(_ci_from_spectra(self.walsh[self._coordinates]))
+
+    @cached_property
+    def to(self):
+        return float(_to_from_autocorrelation(self.autocorrelation[1:]))
+
+    @cached_property
+    def sv(self):
+        return calculate_sv(self.nl, self.sac, self.bic_nl, self.bic_sac, self.n)
+
+    # --- Metrik opsional ---
+
+    @cached_property
+    def bct(self):
+        """Boomerang Connectivity Table."""
+        return boomerang_connectivity_table(self.sbox)
+
+    @cached_property
+    def dlct(self):
+        """Differential-Linear Connectivity Table, diturunkan dari tabel autokorelasi."""
+        return differential_linear_table(self.sbox, self.autocorrelation)
+
+    @cached_property
+    def bu(self):
+        return int(_bu_from_bct(self.bct))
+
+    @cached_property
+    def dlct_max(self):
+        return int(_dlct_max_from_autocorrelation(self.autocorrelation))
+
+    @cached_property
+    def dac(self):
+        size = len(self.sbox)
+        return float(_dac_deviation_from_ddt(self.ddt[1:], size) / (self.m * (size - 1)))
+
+    @cached_property
+    def pc(self):
+        """PC orde 2 dari baris DDT untuk beda input berbobot 1-2."""
+        inputs = low_weight_differences(self.n, 2)
+        return float(_hw_sum_from_ddt(self.ddt[inputs]) / (self.m * len(self.sbox) * len(inputs)))
+
+    @cached_property
+    def bd(self):
+        return int(_branch_from_ddt(self.ddt[1:], np.arange(1, len(self.sbox))))
+
+    @cached_property
+    def side_channel(self):
+        """Tuple (cc_var, dpa_snr) dari baris Walsh koordinat."""
+        return _side_channel_from_spectra(self.walsh[self._coordinates])
+
+    @cached_property
+    def cc_var(self):
+        return float(self.side_channel[0])
+
+    @cached_property
+    def dpa_snr(self):
+        return float(self.side_channel[1])
+
+    def as_dict(self, extra=()):
+        """Semua metrik dalam bentuk dict (format respons /analyze), plus metrik opsional."""
+        _check_extra_metrics(extra)
+        return {name: getattr(self, name) for name in tuple(METRICS) + tuple(extra)}
+
+
+# ==========================================
+# ANALISIS BATCH (N x 2^n)
+# ==========================================
+
+def _as_candidates(sboxes, m=None):
+    """
+    Validasi tumpukan kandidat (N, 2^n) dan lebar output m yang berlaku untuk seluruh
+    batch (bukan per chunk). Returns: (sboxes uint8 untuk m <= 8 / uint16, m).
+    """
+    sboxes = np.asarray(sboxes)
+    if sboxes.ndim != 2:
+        raise ValueError(f"sboxes harus berbentuk (N, 2^n), ditemukan {sboxes.shape}")
+    if sboxes.size == 0:
+        return sboxes.astype(np.uint8), m
+    if np.min(sboxes) < 0:
+        raise ValueError("Nilai S-Box tidak boleh negatif")
+    _, m = sbox_widths(sboxes, m)
+    return sboxes.astype(np.uint8 if m <= 8 else np.uint16), m
+
+def _batch_metrics(sboxes, extra=(), m=None):
+    """
+    Semua metrik standar untuk satu chunk S-Box (N, 2^n), dihitung dengan broadcasting.
+    Tabel 2^n x 2^m (Walsh semua komponen, DDT, autokorelasi) hanya direduksi per blok.
+    """
+    n, m = sbox_widths(sboxes, m)
+    size = sboxes.shape[-1]
+    coordinate_rows = coordinate_masks(m)
+    max_abs_walsh, kept = _blocked_walsh(sboxes, np.concatenate([coordinate_rows, pair_masks(m)]), m)
+    coordinates, pairs = kept[:, :m], kept[:, m:]
+    sac_matrix, bic_sac_matrix = avalanche_matrices(sboxes, m)
+    degrees = packed_degrees(packed_coordinates(sboxes, m), n)
+    du, sum_abs_ac, max_abs_ac = _blocked_differential(sboxes, m=m)
+
+    nl = _nl_from_spectra(coordinates)
+    sac = np.mean(sac_matrix, axis=(-2, -1))
+    bic_nl = _bic_nl_from_spectra(pairs)
+    bic_sac = _bic_sac_from_matrix(bic_sac_matrix)
+    metrics = {
+        "nl": nl,
+        "sac": sac,
+        "bic_nl": bic_nl,
+        "bic_sac": bic_sac,
+        "du": du,
+        "dap": du / size,
+        "lap": max_abs_walsh / (2 * size),
+        "ad": np.max(degrees, axis=-1),
+        "ci": _ci_from_spectra(coordinates),
+        "to": _to_from_sum_abs(sum_abs_ac, size),
+        "sv": calculate_sv(nl, sac, bic_nl, bic_sac, n),
+    }
+    if "dlct_max" in extra:
+        metrics["dlct_max"] = max_abs_ac // 2
+    if "bu" in extra:
+        metrics["bu"] = np.array([_bu_from_bct(boomerang_connectivity_table(s)) for s in sboxes])
+    if {"dac", "pc", "bd"} & set(extra):
+        metrics.update(_stage_propagation(sboxes, metrics, m))
+    if {"cc_var", "dpa_snr"} & set(extra):
+        metrics["cc_var"], metrics["dpa_snr"] = _side_channel_from_spectra(coordinates)
+    return metrics
+
+# Tipe kolom hasil analyze_batch
+BATCH_DTYPES = {
+    "nl": np.int64,
+    "du": np.int64,
+    "ad": np.int64,
+    "ci": np.int64,
+    "bu": np.int64,
+    "dlct_max": np.int64,
+    "bd": np.int64,
+}
+
+def analyze_batch(sboxes, chunk_size=8, extra=(), m=None):
+    """
+    Analisis banyak S-Box sekaligus.
+    sboxes: array (N, 2^n) (n = 4..12), satu kandidat per baris.
+    chunk_size: jumlah kandidat per langkah; tabel besar juga direduksi per blok baris
+    sehingga memori perantara dibatasi BLOCK_ELEMENTS.
+    extra: metrik opsional dari EXTRA_METRICS, mis. ("bu", "dlct_max").
+    m: lebar output untuk seluruh batch (default disimpulkan dari nilai; boleh m < n).
+
+    Returns: dict kolom {metrik: array (N,)} dengan kunci sesuai METRICS (+ extra).
+    """
+    sboxes, m = _as_candidates(sboxes, m)
+    if chunk_size < 1:
+        raise ValueError("chunk_size harus >= 1")
+    _check_extra_metrics(extra)
+
+    names = tuple(METRICS) + tuple(extra)
+    total = len(sboxes)
+    columns = {name: np.empty(total, dtype=BATCH_DTYPES.get(name, np.float64)) for name in names}
+    for start in range(0, total, chunk_size):
+        chunk = sboxes[start:start + chunk_size]
+        metrics = _batch_metrics(chunk, extra, m)
+        for name in names:
+            columns[name][start:start + len(chunk)] = metrics[name]
+    return columns
+
+
+@lru_cache(maxsize=None)
+def _inverse_row_statistics(poly=0x11B):
+    """
+    Statistik per baris (mask b) dari tabel peta invers, dipakai analyze_affine_batch:
+    max |W|, bobot terendah spektrum non-nol (CI), nilai TO per beta, dan derajat.
+    """
+    base = _inverse_map_profile(poly)
+    walsh = base.walsh
+    weights = HW_TABLE[1:256]
+    N = walsh.shape[-1]
+    return {
+        "max_abs": np.max(np.abs(walsh), axis=-1),
+        "lowest_weight": np.where(walsh[:, 1:] != 0, weights, 8).min(axis=-1),
+        "to": 8 - np.sum(np.abs(base.autocorrelation[:, 1:]), axis=-1) / (N * (N - 1)),
+        "degree": base.degrees,
+        "du": int(_du_dap_from_ddt(base.ddt)[0]),
+    }
+
+def metrics_from_affine_maps(linear, transpose, sboxes, chunk_size=64, field=None):
+    """
+    Metrik standar untuk S-Box affine-atas-invers yang diketahui tabel L (linear)
+    dan L^T (transpose)-nya, masing-masing berbentuk (M, 256).
+    NL, BIC-NL, LAP, CI, AD, TO dan DU diturunkan dari statistik baris peta invers
+    lewat L^T (cukup gather 256 indeks per matriks); SAC dan BIC-SAC dihitung
+    langsung dari sboxes (M, 256).
+    """
+    n = 8
+    stats = _inverse_row_statistics(sbox_logic.as_field(field).poly)
+    count = len(sboxes)
+
+    coord = transpose[:, COORDINATE_MASKS]
+    pairs = transpose[:, PAIR_MASKS]
+    nl = (2**(n-1)) - np.max(stats["max_abs"][coord], axis=-1) / 2
+    bic_nl = np.mean((2**(n-1)) - stats["max_abs"][pairs] / 2, axis=-1)
+
+    # Untuk K invertible DDT hanya dipermutasi sehingga DU = DU peta invers;
+    # K singular (L tidak bijektif) dihitung langsung
+    invertible = sbox_logic.is_bijective_table(linear)
+    du = np.full(count, stats["du"], dtype=np.int64)
+    if not np.all(invertible):
+        du[~invertible] = _du_dap_from_ddt(difference_distribution_table(sboxes[~invertible]))[0]
+
+    sac = np.empty(count)
+    bic_sac = np.empty(count)
+    for start in range(0, count, chunk_size):
+        part = slice(start, start + chunk_size)
+        sac_matrix, bic_sac_matrix = avalanche_matrices(sboxes[part])
+        sac[part] = np.mean(sac_matrix, axis=(-2, -1))
+        bic_sac[part] = _bic_sac_from_matrix(bic_sac_matrix)
+
+    return {
+        "nl": nl.astype(np.int64),
+        "sac": sac,
+        "bic_nl": bic_nl,
+        "bic_sac": bic_sac,
+        "du": du,
+        "dap": du / 256,
+        "lap": np.max(stats["max_abs"][transpose[:, 1:]], axis=-1) / 512,
+        "ad": np.max(stats["degree"][coord], axis=-1),
+        "ci": np.maximum(0, np.min(stats["lowest_weight"][coord], axis=-1) - 1),
+        "to": np.max(stats["to"][transpose[:, 1:]], axis=-1),
+        "sv": calculate_sv(nl, sac, bic_nl, bic_sac),
+    }
+
+def analyze_affine_batch(matrices, constant=AES_CONSTANT, chunk_size=64, field=None):
+    """
+    Analisis batch untuk S-Box S(x) = K * INV(x) + C dari tumpukan matriks (M, 8, 8).
+    Tabel tidak dihitung ulang per kandidat: lihat metrics_from_affine_maps.
+    constant: integer 0-255 atau vektor 8 bit (LSB dulu), seperti construct_sboxes.
+    field: GF256 atau polinomial untuk INV (default medan AES 0x11B).
+
+    Returns: (sboxes (M, 256) uint8, dict kolom {metrik: array (M,)})
+    """
+    matrices = np.asarray(matrices)
+    if matrices.ndim != 3 or matrices.shape[1:] != (8, 8):
+        raise ValueError(f"matrices harus berbentuk (M, 8, 8), ditemukan {matrices.shape}")
+
+    constant = sbox_logic.constant_byte(constant)
+    linear, transpose = _affine_maps(matrices)
+    field = sbox_logic.as_field(field)
+    sboxes = (linear[:, field.inverse] ^ constant).astype(np.uint8)
+    return sboxes, metrics_from_affine_maps(linear, transpose, sboxes, chunk_size, field)
+
+
+# ==========================================
+# SCREENING BERTAHAP (EARLY REJECTION)
+# ==========================================
+
+# Tabel perantara yang dibagi antar tahap disimpan di computed dengan kunci berawalan "_"
+# (hanya untuk kandidat yang bertahan); tahap lain memakainya alih-alih membangun ulang.
+
+def _stage_differential(sboxes, computed, m):
+    _, m = sbox_widths(sboxes, m)
+    if sboxes.shape[-1] << m > SCREEN_TABLE_ELEMENTS:
+        du, _, _ = _blocked_differential(sboxes, autocorrelation=False, m=m)
+        return {"du": du, "dap": du / sboxes.shape[-1]}
+    ddt = difference_distribution_table(sboxes, m)
+    du = np.max(ddt[..., 1:, :], axis=(-2, -1))
+    return {"du": du, "dap": du / sboxes.shape[-1], "_ddt": ddt}
+
+def _stage_propagation(sboxes, computed, m):
+    n, m = sbox_widths(sboxes, m)
+    dac, bd = _dac_bd_blocked(sboxes, m, computed.get("_ddt"))
+    diffs = xor_differences(sboxes, low_weight_differences(n, 2))
+    return {"dac": dac, "pc": _pc_from_differences(diffs, m), "bd": bd}
+
+def _stage_coordinates(sboxes, computed, m):
+    spectra = walsh_spectra(sboxes, coordinate_masks(m))
+    return {"nl": _nl_from_spectra(spectra), "ci": _ci_from_spectra(spectra), "_coordinate_spectra": spectra}
+
+def _stage_side_channel(sboxes, computed, m):
+    spectra = computed.get("_coordinate_spectra")
+    if spectra is None:
+        spectra = walsh_spectra(sboxes, coordinate_masks(m))
+    cc_var, dpa_snr = _side_channel_from_spectra(np.asarray(spectra, dtype=np.int64))
+    return {"cc_var": cc_var, "dpa_snr": dpa_snr}
+
+def _stage_avalanche(sboxes, computed, m):
+    sac_matrix, bic_sac_matrix = avalanche_matrices(sboxes, m)
+    return {
+        "sac": np.mean(sac_matrix, axis=(-2, -1)),
+        "bic_sac": _bic_sac_from_matrix(bic_sac_matrix),
+    }
+
+def _stage_degree(sboxes, computed, m):
+    n, _ = sbox_widths(sboxes, m)
+    return {"ad": np.max(packed_degrees(packed_coordinates(sboxes, m), n), axis=-1)}
+
+def _stage_bic_nl(sboxes, computed, m):
+    return {"bic_nl": _bic_nl_from_spectra(walsh_spectra(sboxes, pair_masks(m)))}
+
+def _stage_sv(sboxes, computed, m):
+    n, _ = sbox_widths(sboxes, m)
+    return {"sv": calculate_sv(computed["nl"], computed["sac"], computed["bic_nl"], computed["bic_sac"], n)}
+
+def _stage_lap(sboxes, computed, m):
+    return {"lap": _blocked_walsh(sboxes, m=m)[0] / (2 * sboxes.shape[-1])}
+
+def _stage_to(sboxes, computed, m):
+    _, sum_abs, max_abs = _blocked_differential(sboxes, m=m, ddt=computed.get("_ddt"))
+    return {"to": _to_from_sum_abs(sum_abs, sboxes.shape[-1]), "dlct_max": max_abs // 2}
+
+def _stage_boomerang(sboxes, computed, m):
+    return {"bu": np.array([_bu_from_bct(boomerang_connectivity_table(s)) for s in sboxes])}
+
+# Tahapan screening, diurutkan dari yang termurah: (nama, metrik yang dihasilkan, fungsi)
+SCREENING_STAGES = (
+    ("differential", ("du", "dap"), _stage_differential),
+    ("coordinates", ("nl", "ci"), _stage_coordinates),
+    ("side_channel", ("cc_var", "dpa_snr"), _stage_side_channel),
+    ("avalanche", ("sac", "bic_sac"), _stage_avalanche),
+    ("degree", ("ad",), _stage_degree),
+    ("propagation", ("dac", "pc", "bd"), _stage_propagation),
+    ("bic_nl", ("bic_nl",), _stage_bic_nl),
+    ("sv", ("sv",), _stage_sv),
+    ("lap", ("lap",), _stage_lap),
+    ("to", ("to", "dlct_max"), _stage_to),
+    ("boomerang", ("bu",), _stage_boomerang),
+)
+
+# Metrik yang harus sudah tersedia sebelum metrik lain bisa dihitung
+_METRIC_DEPENDENCIES = {"sv": ("nl", "sac", "bic_nl", "bic_sac")}
+
+# Tabel perantara: (tipe penyimpanan, tahap yang memakainya setelah dibangun)
+_INTERMEDIATES = {
+    "_ddt": (np.uint16, ("propagation", "to")),
+    "_coordinate_spectra": (np.int32, ("side_channel",)),
+}
+
+_PREDICATE_PATTERN = re.compile(r"^\s*([a-z_]+)\s*(<=|>=|==|!=|<|>)\s*([-+0-9.eE]+)\s*$")
+_OPERATORS = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+
+def parse_predicate(text):
+    """
+    Mengubah predikat teks (mis. "nl>=112", "du <= 4") menjadi
+    tuple (metrik, operator_str, nilai).
+    """
+    match = _PREDICATE_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Predikat tidak valid: {text!r} (contoh: 'nl>=112')")
+    metric, op, value = match.groups()
+    if metric not in METRICS and metric not in EXTRA_METRICS:
+        raise ValueError(f"Metrik tidak dikenal dalam predikat {text!r}: {metric}")
+    return metric, op, float(value)
+
+def screen_sboxes(sboxes, predicates, metrics=(), chunk_size=8, m=None):
+    """
+    Screening bertahap untuk banyak kandidat S-Box.
+    Tahapan dijalankan dari yang termurah (SCREENING_STAGES); kandidat dibuang
+    segera setelah gagal di salah satu predikat, sehingga metrik mahal (BIC, TO)
+    hanya dihitung untuk kandidat yang masih bertahan.
+
+    sboxes: array (N, 2^n)
+    predicates: list predikat teks, mis. ["nl>=112", "du<=4", "sv<=16.01"]
+    metrics: metrik tambahan yang ingin dihitung untuk kandidat yang lolos
+    m: lebar output untuk seluruh batch (default disimpulkan dari nilai)
+
+    Returns: dict dengan
+    - "total": N
+    - "passed": indeks kandidat yang lolos semua predikat
+    - "metrics": {metrik: array nilai untuk kandidat yang lolos}
+    - "rejected": per tahap yang menolak kandidat: {"stage", "indices", "metrics"},
+      berisi metrik yang sudah dihitung untuk kandidat tersebut sampai tahap itu
+    - "stages": statistik per tahap (evaluated, passed, pass_rate, seconds)
+
+    DDT dan spektrum koordinat dibangun sekali per kandidat lalu dipakai ulang oleh
+    tahap berikutnya (lihat _INTERMEDIATES), selama muat dalam SCREEN_CACHE_ELEMENTS.
     """
-    sv = (120 - nl) + abs(0.5 - sac) + (120 - bic_nl) + abs(0.5 - bic_sac)
-    return sv
\ No newline at end of file
+    sboxes, m = _as_candidates(sboxes, m)
+    if chunk_size < 1:
+        raise ValueError("chunk_size harus >= 1")
+
+    parsed = [parse_predicate(p) for p in predicates]
+    for name in metrics:
+        if name not in METRICS and name not in EXTRA_METRICS:
+            raise ValueError(f"Metrik tidak dikenal: {name}")
+
+    # Metrik yang benar-benar perlu dihitung (termasuk dependensinya)
+    needed = set(metrics) | {metric for metric, _, _ in parsed}
+    for name in list(needed):
+        needed.update(_METRIC_DEPENDENCIES.get(name, ()))
+
+    running = [stage for stage in SCREENING_STAGES if needed.intersection(stage[1])]
+    survivors = np.arange(len(sboxes))
+    computed = {}
+    rejected = []
+    stages = []
+
+    for index, (stage_name, stage_metrics, stage_fn) in enumerate(running):
+        start_time = time.perf_counter()
+        evaluated = len(survivors)
+        later = {stage[0] for stage in running[index + 1:]}
+        results = {
+            name: np.empty(evaluated, dtype=BATCH_DTYPES.get(name, np.float64))
+            for name in stage_metrics
+        }
+        for start in range(0, evaluated, chunk_size):
+            part = slice(start, start + chunk_size)
+            chunk_computed = {name: values[part] for name, values in computed.items()}
+            chunk_results = stage_fn(sboxes[survivors[part]], chunk_computed, m)
+            for name in stage_metrics:
+                results[name][part] = chunk_results[name]
+            for name, (dtype, users) in _INTERMEDIATES.items():
+                table = chunk_results.get(name)
+                if table is None or not later.intersection(users) or evaluated * table[0].size > SCREEN_CACHE_ELEMENTS:
+                    continue
+                if name not in results:
+                    results[name] = np.empty((evaluated,) + table.shape[1:], dtype=dtype)
+                results[name][part] = table
+        computed.update(results)
+        # Tabel perantara yang tidak dipakai tahap berikutnya dilepas
+        for name, (_, users) in _INTERMEDIATES.items():
+            if name in computed and not later.intersection(users):
+                del computed[name]
+
+        # Terapkan predikat milik tahap ini, buang kandidat yang gagal
+        keep = np.ones(evaluated, dtype=bool)
+        for metric, op, value in parsed:
+            if metric in stage_metrics:
+                keep &= _OPERATORS[op](computed[metric], value)
+        if not np.all(keep):
+            rejected.append({
+                "stage": stage_name,
+                "indices": survivors[~keep],
+                "metrics": {name: values[~keep] for name, values in computed.items() if not name.startswith("_")},
+            })
+        survivors = survivors[keep]
+        computed = {name: values[keep] for name, values in computed.items()}
+
+        stages.append({
+            "stage": stage_name,
+            "metrics": list(stage_metrics),
+            "evaluated": evaluated,
+            "passed": len(survivors),
+            "pass_rate": len(survivors) / evaluated if evaluated else 0.0,
+            "seconds": time.perf_counter() - start_time,
+        })
+
+    return {
+        "total": len(sboxes),
+        "passed": survivors,
+        "metrics": {name: values for name, values in computed.items() if not name.startswith("_")},
+        "rejected": rejected,
+        "stages": stages,
+    }
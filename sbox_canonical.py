@@ -0,0 +1,214 @@
+"""
+Bentuk kanonik S-Box 8-bit di bawah relasi ekuivalensi, untuk deduplikasi
+kandidat eksplorasi. Dua S-Box ekuivalen <=> bentuk kanoniknya sama; metrik
+yang invarian terhadap relasi tersebut (INVARIANT_METRICS) cukup dihitung
+sekali per kelas.
+
+Relasi (Q permutasi bit, A matriks invertible, P permutasi bit input, c konstanta):
+- output_linear:          A * S(x)
+- output_affine:          A * S(x) + c
+- output_bit_permutation: Q * S(x) + c        (koordinat diurutkan)
+- bit_permutation:        Q * S(P * x) + c    (seluruh 8! = 40320 permutasi input)
+"""
+
+import hashlib
+import itertools
+from functools import lru_cache
+
+import numpy as np
+
+import sbox_analysis
+import sbox_logic
+
+EQUIVALENCES = ("output_linear", "output_affine", "output_bit_permutation", "bit_permutation")
+
+# Metrik yang tidak berubah di dalam satu kelas. NL, TO dan CI pada repo ini dihitung
+# atas fungsi koordinat sehingga tidak invarian terhadap transformasi linear output.
+INVARIANT_METRICS = {
+    "output_linear": ("du", "dap", "lap", "ad"),
+    "output_affine": ("du", "dap", "lap", "ad"),
+    "output_bit_permutation": sbox_analysis.METRICS,
+    "bit_permutation": sbox_analysis.METRICS,
+}
+
+# Ekuivalensi yang cukup murah untuk deduplikasi saat eksplorasi. bit_permutation
+# (~2 s per S-Box) hanya untuk pemanggilan canonical_form langsung (offline).
+FAST_EQUIVALENCES = ("output_linear", "output_affine", "output_bit_permutation")
+
+BITS = np.arange(8)
+
+
+def _as_sboxes(sboxes):
+    sboxes = np.asarray(sboxes)
+    if sboxes.ndim == 1:
+        sboxes = sboxes[None]
+    if sboxes.ndim != 2 or sboxes.shape[1] != 256:
+        raise ValueError(f"sboxes harus berbentuk (N, 256), ditemukan {sboxes.shape}")
+    if np.any((sboxes < 0) | (sboxes > 255)):
+        raise ValueError("Semua elemen S-Box harus berada dalam range 0-255")
+    if not np.all(sbox_logic.is_bijective_table(sboxes)):
+        raise ValueError("Bentuk kanonik hanya didefinisikan untuk S-Box bijektif")
+    return sboxes.astype(np.uint8)
+
+
+def _output_linear(sboxes):
+    """
+    A * S dengan A memetakan basis output yang muncul pertama (urut x naik) ke
+    1, 2, 4, ..., 128: bentuk lexicographically terkecil di kelas output-linear.
+    Span dilacak sebagai tabel keanggotaan (N, 256) dan hanya diperbarui saat
+    ditemukan nilai output baru yang bebas linear (8 kali per S-Box).
+    """
+    count = len(sboxes)
+    rows = np.arange(count)
+    values = np.arange(256)
+    span = np.zeros((count, 256), dtype=bool)
+    span[:, 0] = True
+    basis = np.zeros((count, 8), dtype=np.int64)
+    found = np.zeros(count, dtype=np.int64)
+    for x in range(256):
+        y = sboxes[:, x].astype(np.int64)
+        new = ~span[rows, y]
+        if not np.any(new):
+            continue
+        sel = rows[new]
+        basis[sel, found[sel]] = y[sel]
+        found[sel] += 1
+        span[sel] |= np.take_along_axis(span[sel], values ^ y[sel, None], axis=1)
+        if np.all(found == 8):
+            break
+
+    # B[v] = XOR basis_k untuk bit k di v; A = B^-1 sehingga A(basis_k) = 2^k
+    bits = (values[:, None] >> BITS) & 1
+    table = np.bitwise_xor.reduce(np.where(bits[None], basis[:, None, :], 0), axis=-1)
+    inverse = np.empty_like(table)
+    np.put_along_axis(inverse, table, np.broadcast_to(values, table.shape), axis=1)
+    return np.take_along_axis(inverse, sboxes.astype(np.int64), axis=1).astype(np.uint8)
+
+
+def _sorted_coordinates(sboxes):
+    """Q * S: koordinat output diurutkan berdasarkan tabel kebenarannya (256 bit)."""
+    bits = (sboxes[..., None] >> BITS.astype(np.uint8)) & 1
+    # words[..., i, k] = 64 bit ke-k dari koordinat i (x = 0 paling signifikan)
+    packed = np.ascontiguousarray(np.packbits(np.swapaxes(bits, -1, -2), axis=-1))
+    words = packed.reshape(*packed.shape[:-1], 4, 8).view(">u8")[..., 0]
+    keys = [words[..., k] for k in reversed(range(4))]
+    order = np.lexsort(keys, axis=-1)
+    permuted = np.take_along_axis(bits, order[..., None, :], axis=-1)
+    return np.sum(permuted << BITS.astype(np.uint8), axis=-1, dtype=np.uint8)
+
+
+@lru_cache(maxsize=None)
+def input_bit_permutations():
+    """Tabel (40320, 256) uint8: P(x) untuk setiap permutasi bit input."""
+    perms = np.array(list(itertools.permutations(range(8))), dtype=np.int64)
+    values = np.arange(256)
+    bits = (values[:, None] >> BITS) & 1
+    return np.sum(bits[None, :, :] << perms[:, None, :], axis=-1).astype(np.uint8)
+
+
+def _lexmin_row(tables):
+    """Baris lexicographically terkecil dari (K, 256)."""
+    candidates = tables
+    for column in range(tables.shape[1]):
+        candidates = candidates[candidates[:, column] == candidates[:, column].min()]
+        if len(candidates) == 1:
+            break
+    return candidates[0]
+
+
+def _bit_permutation(sboxes, block=4096):
+    """min_P (bentuk koordinat terurut dari S o P) per S-Box."""
+    perms = input_bit_permutations()
+    result = np.empty_like(sboxes)
+    for index, sbox in enumerate(sboxes):
+        best = [
+            _lexmin_row(_sorted_coordinates(sbox[perms[start:start + block]]))
+            for start in range(0, len(perms), block)
+        ]
+        result[index] = _lexmin_row(np.stack(best))
+    return result
+
+
+def canonical_form(sboxes, equivalence="output_affine"):
+    """
+    Representatif kanonik untuk S-Box (256,) atau tumpukan S-Box (N, 256).
+    Returns: array uint8 dengan bentuk yang sama.
+    """
+    if equivalence not in EQUIVALENCES:
+        raise ValueError(f"Ekuivalensi tidak dikenal: {equivalence}. Pilihan: {', '.join(EQUIVALENCES)}")
+    single = np.ndim(sboxes) == 1
+    sboxes = _as_sboxes(sboxes)
+    if equivalence != "output_linear":
+        # Konstanta output: normalisasi S(0) = 0 (komutatif dengan permutasi bit)
+        sboxes = sboxes ^ sboxes[:, :1]
+
+    if equivalence in ("output_linear", "output_affine"):
+        canonical = _output_linear(sboxes)
+    elif equivalence == "output_bit_permutation":
+        canonical = _sorted_coordinates(sboxes)
+    else:
+        canonical = _bit_permutation(sboxes)
+    return canonical[0] if single else canonical
+
+
+def canonical_affine_form(matrices, constant=sbox_analysis.AES_CONSTANT,
+                          equivalence="output_affine", field=None):
+    """Bentuk kanonik untuk S(x) = K * INV(x) + C dari matriks (8, 8) atau (M, 8, 8)."""
+    matrices = np.asarray(matrices)
+    single = matrices.ndim == 2
+    sboxes = sbox_logic.construct_sboxes(matrices[None] if single else matrices, constant, field)
+    canonical = canonical_form(sboxes, equivalence)
+    return canonical[0] if single else canonical
+
+
+def form_hashes(canonical):
+    """Hash 64-bit (BLAKE2b) untuk bentuk kanonik yang sudah dihitung (N, 256)."""
+    return [
+        int.from_bytes(hashlib.blake2b(row.tobytes(), digest_size=8).digest(), "big")
+        for row in np.atleast_2d(np.asarray(canonical, dtype=np.uint8))
+    ]
+
+
+def canonical_hash(sboxes, equivalence="output_affine"):
+    """Hash 64-bit dari bentuk kanonik; int untuk satu S-Box, list untuk batch."""
+    canonical = canonical_form(sboxes, equivalence)
+    digests = form_hashes(canonical)
+    return digests[0] if canonical.ndim == 1 else digests
+
+
+def group_forms(canonical):
+    """
+    Statistik duplikat dari bentuk kanonik yang sudah dihitung (N, 256); pembanding
+    adalah bentuk kanonik penuh, bukan hash, sehingga tidak ada tabrakan.
+
+    Returns: dict {representatives (indeks kandidat pertama tiap kelas), classes
+    (indeks kelas per kandidat), class_sizes, total, unique, duplicates, collapse_ratio}.
+    """
+    canonical = np.atleast_2d(canonical)
+    total = len(canonical)
+    if total == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return {"representatives": empty, "classes": empty, "class_sizes": empty,
+                "total": 0, "unique": 0, "duplicates": 0, "collapse_ratio": 0.0}
+    _, first, classes, sizes = np.unique(
+        canonical, axis=0, return_index=True, return_inverse=True, return_counts=True
+    )
+    # Nomor kelas mengikuti urutan kemunculan pertama
+    order = np.argsort(first)
+    relabel = np.empty_like(order)
+    relabel[order] = np.arange(len(order))
+    unique = len(first)
+    return {
+        "representatives": first[order],
+        "classes": relabel[classes.reshape(-1)],
+        "class_sizes": sizes[order],
+        "total": total,
+        "unique": unique,
+        "duplicates": total - unique,
+        "collapse_ratio": (total - unique) / total,
+    }
+
+
+def deduplicate(sboxes, equivalence="output_affine"):
+    """Kelompokkan kandidat (N, 256) per kelas ekuivalensi; lihat group_forms."""
+    return group_forms(canonical_form(sboxes, equivalence))
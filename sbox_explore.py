@@ -0,0 +1,245 @@
+"""
+Eksplorasi eksaustif keluarga matriks affine terstruktur.
+Matriks paper (K_44, K_81, K_111, K_128) berbentuk circulant; keluarga seperti
+ini cukup kecil untuk dicakup seluruhnya (256 circulant, 2^15 Toeplitz).
+Setiap anggota invertible dikonstruksi dan dianalisis sekaligus lewat
+sbox_analysis.analyze_affine_batch, lalu diurutkan berdasarkan SV. Keluarga
+peta pangkat x^d (Gold, Kasami, invers) disapu lewat jalur peringkat yang sama.
+
+Jalankan: python sbox_explore.py [--family circulant] [--top 10] [--sort-by sv]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import sbox_analysis
+import sbox_canonical
+import sbox_logic
+
+BITS = np.arange(8)
+
+
+def _bits(codes, width):
+    """Kode integer (M,) -> bit (M, width), LSB di indeks 0."""
+    return (np.asarray(codes, dtype=np.int64)[:, None] >> np.arange(width)) & 1
+
+
+def circulant_matrices():
+    """K[i][j] = c[(j - i) mod 8]: setiap baris = baris sebelumnya dirotasi kanan (256 anggota)."""
+    return _bits(np.arange(256), 8)[:, (BITS[None, :] - BITS[:, None]) % 8]
+
+
+def left_circulant_matrices():
+    """K[i][j] = c[(i + j) mod 8]: setiap baris = baris sebelumnya dirotasi kiri (256 anggota)."""
+    return _bits(np.arange(256), 8)[:, (BITS[:, None] + BITS[None, :]) % 8]
+
+
+def toeplitz_matrices():
+    """K[i][j] = t[j - i + 7]: konstan di setiap diagonal (2^15 anggota)."""
+    return _bits(np.arange(1 << 15), 15)[:, BITS[None, :] - BITS[:, None] + 7]
+
+
+def hankel_matrices():
+    """K[i][j] = t[i + j]: konstan di setiap anti-diagonal (2^15 anggota)."""
+    return _bits(np.arange(1 << 15), 15)[:, BITS[:, None] + BITS[None, :]]
+
+
+FAMILIES = {
+    "circulant": circulant_matrices,
+    "left_circulant": left_circulant_matrices,
+    "toeplitz": toeplitz_matrices,
+    "hankel": hankel_matrices,
+}
+
+# Metrik yang lebih besar lebih baik; SAC/BIC-SAC diurutkan berdasarkan jarak ke 0.5,
+# metrik lainnya (SV, DU, LAP, TO, ...) semakin kecil semakin baik
+MAXIMIZE = ("nl", "bic_nl", "ad", "ci")
+TARGET_HALF = ("sac", "bic_sac")
+
+# Ekuivalensi yang boleh dipakai untuk dedup: murah dan mempertahankan semua metrik standar
+DEDUP_EQUIVALENCES = tuple(
+    name for name in sbox_canonical.FAST_EQUIVALENCES
+    if set(sbox_analysis.METRICS) <= set(sbox_canonical.INVARIANT_METRICS[name])
+)
+
+
+def family_members(family):
+    """Semua anggota invertible dari keluarga (M, 8, 8) int64."""
+    if family not in FAMILIES:
+        raise ValueError(f"Keluarga tidak dikenal: {family}. Pilihan: {', '.join(FAMILIES)}")
+    matrices = FAMILIES[family]()
+    return matrices[sbox_logic.is_invertible_gf2(matrices)]
+
+
+def _rank_key(name, values):
+    if name in MAXIMIZE:
+        return -values
+    if name in TARGET_HALF:
+        return np.abs(values - 0.5)
+    return values
+
+
+def rank_candidates(columns, sort_by="sv"):
+    """
+    Urutan indeks kandidat dari yang terbaik menurut sort_by; seri diputus
+    berturut-turut oleh SV, NL dan DU.
+    """
+    if sort_by not in columns:
+        raise ValueError(f"Metrik tidak dikenal: {sort_by}")
+    keys = [sort_by] + [name for name in ("sv", "nl", "du") if name != sort_by]
+    # np.lexsort memakai kunci terakhir sebagai kunci utama
+    return np.lexsort([_rank_key(name, columns[name]) for name in reversed(keys)])
+
+
+def _analyze_unique(sboxes, analyze, dedup=None):
+    """
+    Kolom metrik untuk semua kandidat. Dengan dedup (nama ekuivalensi), hanya satu
+    representatif per kelas yang dianalisis lalu hasilnya disalin ke anggota kelas;
+    hanya diizinkan untuk DEDUP_EQUIVALENCES.
+
+    Returns: (columns, ringkasan dedup atau None)
+    """
+    if dedup is None:
+        return analyze(np.arange(len(sboxes))), None
+    if dedup not in DEDUP_EQUIVALENCES:
+        raise ValueError(f"Ekuivalensi dedup tidak didukung: {dedup}. Pilihan: {', '.join(DEDUP_EQUIVALENCES)}")
+    stats = sbox_canonical.deduplicate(sboxes, dedup)
+    columns = analyze(stats["representatives"])
+    summary = {
+        "equivalence": dedup,
+        "unique": stats["unique"],
+        "duplicates": stats["duplicates"],
+        "collapse_ratio": stats["collapse_ratio"],
+    }
+    return {name: values[stats["classes"]] for name, values in columns.items()}, summary
+
+
+def _ranked_rows(columns, sboxes, order, **fields):
+    """Baris hasil (terbaik dulu): metrik standar, S-Box dan kolom tambahan per kandidat."""
+    results = []
+    for position, index in enumerate(order):
+        row = {name: values[index].item() for name, values in columns.items()}
+        row.update({name: values[position] for name, values in fields.items()})
+        row["sbox"] = sboxes[index].tolist()
+        results.append(row)
+    return results
+
+
+def explore_family(family, constant=sbox_analysis.AES_CONSTANT, sort_by="sv", top=None, field=None,
+                   dedup=None):
+    """
+    Konstruksi dan analisis seluruh anggota invertible sebuah keluarga.
+    field: GF256 atau polinomial iredusibel untuk INV (default medan AES).
+    dedup: nama ekuivalensi sbox_canonical (mis. "output_bit_permutation") agar
+    setiap kelas hanya dianalisis sekali.
+
+    Returns: dict {family, members, invertible, dedup, results}; results adalah daftar
+    baris terurut (terbaik dulu) berisi rank enumerasi GL(8, 2), word hex,
+    matriks, S-Box dan metrik standar.
+    """
+    matrices = family_members(family)
+    if dedup is None:
+        sboxes, columns = sbox_analysis.analyze_affine_batch(matrices, constant, field=field)
+        summary = None
+    else:
+        sboxes = sbox_logic.construct_sboxes(matrices, constant, field)
+        columns, summary = _analyze_unique(
+            sboxes,
+            lambda index: sbox_analysis.analyze_affine_batch(matrices[index], constant, field=field)[1],
+            dedup,
+        )
+    order = rank_candidates(columns, sort_by)
+    if top is not None:
+        order = order[:int(top)]
+
+    ranks = sbox_logic.rank_affine_matrices(matrices[order]) if len(order) else []
+    words = sbox_logic.pack_matrix_words(matrices[order])
+    results = _ranked_rows(
+        columns, sboxes, order,
+        rank=[int(rank) for rank in ranks],
+        word=[f"{int(word):016x}" for word in words],
+        matrix=matrices[order].tolist(),
+    )
+    return {
+        "family": family,
+        "members": len(FAMILIES[family]()),
+        "invertible": len(matrices),
+        "dedup": summary,
+        "sort_by": sort_by,
+        "polynomial": sbox_logic.as_field(field).poly,
+        "results": results,
+    }
+
+
+def explore_power_family(family, output_matrices=None, input_matrix=None, constant=0,
+                         sort_by="sv", top=None, field=None, bijective_only=True, dedup=None):
+    """
+    Sapu peta pangkat x^d sebuah keluarga (gold, kasami, inverse, all), opsional
+    dengan lapisan affine: setiap eksponen dikombinasikan dengan setiap matriks
+    output (M, 8, 8). Kandidat dianalisis lewat analyze_batch dan diurutkan
+    dengan rank_candidates yang sama seperti keluarga matriks affine.
+    dedup: lihat explore_family.
+    """
+    exponents = sbox_logic.power_exponents(family, bijective_only)
+    if len(exponents) == 0:
+        raise ValueError(f"Keluarga {family} tidak memiliki eksponen permutasi di GF(2^8)")
+    output_matrices = None if output_matrices is None else np.asarray(output_matrices)
+    if output_matrices is not None and output_matrices.ndim == 2:
+        output_matrices = output_matrices[None]
+    candidates, sboxes = sbox_logic.construct_power_sboxes(
+        exponents, output_matrices, input_matrix, constant, field
+    )
+    columns, summary = _analyze_unique(
+        sboxes, lambda index: sbox_analysis.analyze_batch(sboxes[index]), dedup
+    )
+    order = rank_candidates(columns, sort_by)
+    if top is not None:
+        order = order[:int(top)]
+
+    fields = {"exponent": [int(candidates[index]) for index in order]}
+    if output_matrices is not None:
+        per_exponent = len(output_matrices)
+        fields["matrix"] = [output_matrices[index % per_exponent].tolist() for index in order]
+    return {
+        "family": family,
+        "exponents": exponents.tolist(),
+        "candidates": len(sboxes),
+        "dedup": summary,
+        "sort_by": sort_by,
+        "polynomial": sbox_logic.as_field(field).poly,
+        "results": _ranked_rows(columns, sboxes, order, **fields),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Eksplorasi keluarga matriks affine")
+    parser.add_argument("--family", choices=list(FAMILIES), default="circulant")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--sort-by", default="sv")
+    parser.add_argument("--poly", type=lambda text: int(text, 0), default=0x11B)
+    parser.add_argument("--dedup", choices=DEDUP_EQUIVALENCES)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = explore_family(
+        args.family, sort_by=args.sort_by, top=args.top, field=args.poly, dedup=args.dedup
+    )
+    seconds = time.perf_counter() - start
+
+    print("=" * 72)
+    print(f"KELUARGA {args.family} (0x{args.poly:X}): {report['invertible']} invertible dari "
+          f"{report['members']} anggota ({seconds:.2f} s)")
+    if report["dedup"]:
+        print(f"Dedup {report['dedup']['equivalence']}: {report['dedup']['unique']} kelas, "
+              f"{report['dedup']['duplicates']} duplikat dilewati")
+    print("=" * 72)
+    print(f"{'word':<18}{'NL':>5}{'SAC':>9}{'BIC-NL':>9}{'BIC-SAC':>9}{'DU':>4}{'TO':>8}{'SV':>10}")
+    for row in report["results"]:
+        print(f"{row['word']:<18}{row['nl']:>5}{row['sac']:>9.4f}{row['bic_nl']:>9.2f}"
+              f"{row['bic_sac']:>9.4f}{row['du']:>4}{row['to']:>8.3f}{row['sv']:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
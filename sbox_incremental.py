@@ -0,0 +1,183 @@
+import numpy as np
+
+import sbox_analysis
+import sbox_logic
+from sbox_analysis import HW_TABLE
+
+# ==========================================
+# ANALISIS INKREMENTAL UNTUK SWAP ENTRI S-BOX
+# ==========================================
+
+
+class SwapAnalysisState:
+    """
+    State analisis inkremental untuk local search berbasis swap.
+    Menyimpan DDT, tabel Walsh (LAT = W / 2) dan maksimum per baris; menukar
+    dua nilai output hanya memperbarui entri yang terpengaruh:
+    - DDT: 4 pasangan (x, x XOR a) per baris a -> O(2^n * 4)
+    - Walsh: perubahan berupa outer product di blok 2^(m-1) x 2^(n-1)
+      (baris b dengan b.(y1 XOR y2) = 1, kolom a dengan a.(x1 XOR x2) = 1)
+    Lebar (n, m) mengikuti sbox_analysis.sbox_widths.
+    """
+
+    def __init__(self, sbox):
+        self.sbox = np.array(sbox, dtype=np.int64)
+        profile = sbox_analysis.SBoxProfile(self.sbox)
+        self.n, self.m = profile.n, profile.m
+        self.size = 1 << self.n
+        self._coordinates = sbox_analysis.coordinate_masks(self.m)
+        self.ddt = profile.ddt.copy()
+        self.walsh = profile.walsh.copy()
+        self._history = []
+        self._ddt_row_max = np.max(self.ddt, axis=1)
+        self._walsh_row_max = np.max(np.abs(self.walsh), axis=1)
+
+    @property
+    def lat(self):
+        """Linear Approximation Table, diindeks [b, a]."""
+        return self.walsh // 2
+
+    def _ddt_pairs(self, x1, x2):
+        """Indeks (a, x) untuk semua pasangan DDT yang melibatkan x1 atau x2."""
+        a = np.arange(1, self.size)
+        xs = np.stack([np.full(len(a), x1), np.full(len(a), x2), x1 ^ a, x2 ^ a])
+        rows = np.broadcast_to(a, xs.shape)
+        # Untuk a = x1 XOR x2, x1 XOR a = x2 dan x2 XOR a = x1 (pasangan ganda)
+        keep = np.ones(xs.shape, dtype=bool)
+        keep[2:, a == (x1 ^ x2)] = False
+        return rows[keep], xs[keep]
+
+    def _apply_swap(self, x1, x2):
+        s = self.sbox
+        y1, y2 = int(s[x1]), int(s[x2])
+
+        # 1. DDT: kurangi kontribusi lama, tukar, tambahkan kontribusi baru
+        rows, xs = self._ddt_pairs(x1, x2)
+        table = self.ddt.reshape(-1)
+        removed = rows * self.ddt.shape[1] + (s[xs] ^ s[xs ^ rows])
+        # Baris yang entri maksimumnya ikut dikurangi dipindai ulang; baris lain
+        # cukup dibandingkan dengan entri yang bertambah
+        stale = rows[table[removed] == self._ddt_row_max[rows]]
+        np.subtract.at(table, removed, 1)
+        s[x1], s[x2] = y2, y1
+        added = rows * self.ddt.shape[1] + (s[xs] ^ s[xs ^ rows])
+        np.add.at(table, added, 1)
+        np.maximum.at(self._ddt_row_max, rows, table[added])
+        self._ddt_row_max[stale] = np.max(self.ddt[stale], axis=1)
+
+        # 2. Walsh: delta W[b, a] = u_b * v_a dengan
+        #    u_b = (-1)^(b.y2) - (-1)^(b.y1), v_a = (-1)^(a.x1) - (-1)^(a.x2)
+        b_rows = np.nonzero(HW_TABLE[np.arange(1 << self.m) & (y1 ^ y2)] & 1)[0]
+        a_cols = np.nonzero(HW_TABLE[np.arange(self.size) & (x1 ^ x2)] & 1)[0]
+        u = 2 * (1 - 2 * (HW_TABLE[b_rows & y2] & 1))
+        v = 2 * (1 - 2 * (HW_TABLE[a_cols & x1] & 1))
+        self.walsh[np.ix_(b_rows, a_cols)] += np.outer(u, v)
+        # Hanya baris b yang berubah (b.(y1 XOR y2) = 1) dipindai ulang
+        self._walsh_row_max[b_rows] = np.max(np.abs(self.walsh[b_rows]), axis=1)
+
+    def swap(self, x1, x2):
+        """Menukar S(x1) dan S(x2), lalu memperbarui tabel secara inkremental."""
+        if not (0 <= x1 < self.size and 0 <= x2 < self.size):
+            raise ValueError(f"Indeks swap harus berada dalam range 0-{self.size - 1}")
+        if x1 != x2:
+            self._apply_swap(x1, x2)
+        self._history.append((x1, x2))
+        return self.metrics()
+
+    def undo(self):
+        """Membatalkan swap terakhir (swap bersifat involusi)."""
+        if not self._history:
+            raise IndexError("Tidak ada swap untuk dibatalkan")
+        x1, x2 = self._history.pop()
+        if x1 != x2:
+            self._apply_swap(x1, x2)
+        return self.metrics()
+
+    @property
+    def du(self):
+        return int(np.max(self._ddt_row_max[1:]))
+
+    @property
+    def dap(self):
+        return self.du / self.size
+
+    @property
+    def nl(self):
+        return int((2**(self.n-1)) - np.max(self._walsh_row_max[self._coordinates]) / 2)
+
+    @property
+    def lap(self):
+        return float(np.max(self._walsh_row_max[1:]) / (2 * self.size))
+
+    def metrics(self):
+        """Metrik yang dipelihara secara inkremental."""
+        return {"nl": self.nl, "du": self.du, "dap": self.dap, "lap": self.lap}
+
+
+# ==========================================
+# SESI LIVE: FLIP SATU BIT MATRIKS AFFINE
+# ==========================================
+
+
+class LiveAffineSession:
+    """
+    Sesi analisis interaktif untuk editor matriks affine K.
+    S(x) = K * INV(x) + C, sehingga flip K[i][j] hanya mengubah koordinat output i
+    (XOR dengan bit j dari INV(x)). Yang diperbarui hanya:
+    - tabel L: bit i dari L[v] di-XOR dengan bit j dari v
+    - tabel L^T: 128 mask b yang memuat bit i di-XOR dengan e_j
+    - S-Box: bit i dari S(x) di-XOR dengan bit j dari INV(x)
+    Metrik lalu dibaca dari statistik baris peta invers yang sudah di-cache
+    (sbox_analysis.metrics_from_affine_maps), tanpa menghitung spektrum ulang.
+    """
+
+    def __init__(self, matrix, constant=sbox_analysis.AES_CONSTANT, field=None):
+        self.matrix = sbox_logic.check_binary_matrices(matrix).copy()
+        if self.matrix.shape != (8, 8):
+            raise ValueError(f"Matriks harus 8x8, ditemukan {self.matrix.shape}")
+        self.constant = sbox_logic.constant_byte(constant)
+        self.field = sbox_logic.as_field(field)
+        self._inverse = self.field.inverse.astype(np.int64)
+        self._linear = sbox_logic.linear_tables(self.matrix).astype(np.int64)
+        self._transpose = sbox_logic.linear_tables(self.matrix.T).astype(np.int64)
+        self.sbox = self._linear[self._inverse] ^ self.constant
+        self._metrics = None
+
+    def _flip(self, row, col):
+        if not (0 <= row < 8 and 0 <= col < 8):
+            raise ValueError("Indeks baris/kolom harus berada dalam range 0-7")
+        values = np.arange(256)
+        self.matrix[row, col] ^= 1
+        self._linear ^= ((values >> col) & 1) << row
+        self._transpose[((values >> row) & 1) == 1] ^= 1 << col
+        self.sbox ^= ((self._inverse >> col) & 1) << row
+        self._metrics = None
+
+    def flip(self, row, col):
+        """Membalik K[row][col] dan mengembalikan metrik terbaru."""
+        self._flip(row, col)
+        return self.metrics()
+
+    def apply(self, flips):
+        """Menerapkan beberapa flip (row, col) sekaligus, metrik dihitung sekali di akhir."""
+        flips = list(flips)
+        if any(not (0 <= row < 8 and 0 <= col < 8) for row, col in flips):
+            raise ValueError("Indeks baris/kolom harus berada dalam range 0-7")
+        for row, col in flips:
+            self._flip(row, col)
+        return self.metrics()
+
+    @property
+    def is_invertible(self):
+        """K invertible <=> L bijektif <=> S-Box bijektif."""
+        return bool(sbox_logic.is_bijective_table(self._linear))
+
+    def metrics(self):
+        """Metrik standar (format /analyze) untuk matriks saat ini."""
+        if self._metrics is None:
+            columns = sbox_analysis.metrics_from_affine_maps(
+                self._linear[None, :], self._transpose[None, :], self.sbox[None, :],
+                field=self.field,
+            )
+            self._metrics = {name: values[0].item() for name, values in columns.items()}
+        return dict(self._metrics)
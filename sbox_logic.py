@@ -1,269 +1,115 @@
+import hashlib
+from functools import cached_property, lru_cache
+
 import numpy as np
 
 # Konstanta AES standar (CAES) = 0x63 (01100011) [cite: 196]
 C_AES = np.array([1, 1, 0, 0, 0, 1, 1, 0])  # LSB first representation for vector calc
 
+# ==========================================
+# MEDAN GF(2^8) UNTUK SEMBARANG POLINOMIAL IREDUSIBEL
+# ==========================================
+
+
+def _poly_mod(a, b):
+    """Sisa pembagian polinomial a mod b atas GF(2) (bit i = koefisien x^i)."""
+    degree = b.bit_length()
+    while a.bit_length() >= degree:
+        a ^= b << (a.bit_length() - degree)
+    return a
+
+
+def _is_irreducible(poly):
+    degree = poly.bit_length() - 1
+    # Cukup diuji terhadap semua polinomial berderajat 1 .. degree // 2
+    return all(_poly_mod(poly, d) for d in range(2, 1 << (degree // 2 + 1)))
+
+
+# 30 polinomial iredusibel berderajat 8 (0x11B = polinomial AES)
+IRREDUCIBLE_POLYNOMIALS = tuple(p for p in range(0x100, 0x200) if _is_irreducible(p))
+
+
+class GF256:
+    """
+    Medan GF(2^8) = GF(2)[x] / (poly). Tabel exp/log (dengan generator terkecil),
+    invers multiplikatif dan tabel perkalian penuh 256 x 256 dibangun sekali saat
+    konstruksi; gunakan gf256(poly) agar objek di-cache per polinomial.
+    """
+
+    def __init__(self, poly=0x11B):
+        poly = int(poly)
+        if poly not in IRREDUCIBLE_POLYNOMIALS:
+            raise ValueError(f"0x{poly:X} bukan polinomial iredusibel berderajat 8")
+        self.poly = poly
+
+        # Perkalian dengan x pada semua elemen: dasar perkalian bit-serial tervektor
+        values = np.arange(256)
+        times_x = ((values << 1) ^ np.where(values & 0x80, poly, 0)) & 0xFF
+        products = np.zeros((256, 256), dtype=np.int64)
+        shifted = values.copy()
+        for bit in range(8):
+            products ^= np.where((values[:, None] >> bit) & 1, shifted[None, :], 0)
+            shifted = times_x[shifted]
+        self.mul = products.astype(np.uint8)
+
+        # Generator: elemen terkecil dengan orde 255
+        for generator in range(2, 256):
+            exp = np.ones(255, dtype=np.int64)
+            for i in range(1, 255):
+                exp[i] = self.mul[exp[i - 1], generator]
+            if len(np.unique(exp)) == 255:
+                break
+        self.generator = generator
+        # exp diulang agar exp[log a + log b] tidak perlu reduksi mod 255
+        self.exp = np.concatenate([exp, exp]).astype(np.uint8)
+        self.log = np.zeros(256, dtype=np.int64)
+        self.log[exp] = np.arange(255)
+
+        self.inverse = np.zeros(256, dtype=np.uint8)
+        self.inverse[1:] = self.exp[(255 - self.log[1:]) % 255]
+        # Bit invers: inverse_bits[x, j] = bit j dari inverse[x] (float32 untuk BLAS, lihat construct_sboxes)
+        self.inverse_bits = ((self.inverse[:, None] >> np.arange(8)) & 1).astype(np.float32)
+
+    @cached_property
+    def mul_rows(self):
+        """Tabel perkalian sebagai list baris int (lookup skalar cepat di cipher), dibangun sekali."""
+        return self.mul.tolist()
+
+    def multiply(self, a, b):
+        return self.mul[a, b]
+
+    def power(self, x, d):
+        """x^d untuk elemen (atau array elemen) x; 0^d = 0 untuk d > 0."""
+        x = np.asarray(x, dtype=np.int64)
+        d = int(d)
+        if d == 0:
+            return np.ones_like(x, dtype=np.uint8)
+        result = self.exp[(self.log[x] * d) % 255]
+        return np.where(x == 0, 0, result).astype(np.uint8)
+
+    def __repr__(self):
+        return f"GF256(0x{self.poly:X})"
+
+
+@lru_cache(maxsize=None)
+def gf256(poly=0x11B):
+    """Objek GF256 yang di-cache per polinomial."""
+    return GF256(poly)
+
+
+def as_field(field):
+    """None -> medan AES, integer -> gf256(poly), GF256 -> dirinya sendiri."""
+    if field is None:
+        return AES_FIELD
+    if isinstance(field, GF256):
+        return field
+    return gf256(int(field))
+
+
 # Irreducible Polynomial: x^8 + x^4 + x^3 + x + 1 (0x11B) [cite: 13]
-# Tabel Invers Multiplikatif AES (Standard) - Precomputed for efficiency
-# Sesuai Table 1 pada paper [cite: 188]
-AES_INVERSE_TABLE = [
-    0x00,
-    0x01,
-    0x8D,
-    0xF6,
-    0xCB,
-    0x52,
-    0x7B,
-    0xD1,
-    0xE8,
-    0x4F,
-    0x29,
-    0xC0,
-    0xB0,
-    0xE1,
-    0xE5,
-    0xC7,
-    0x74,
-    0xB4,
-    0xAA,
-    0x4B,
-    0x99,
-    0x2B,
-    0x60,
-    0x5F,
-    0x58,
-    0x3F,
-    0xFD,
-    0xCC,
-    0xFF,
-    0x40,
-    0xEE,
-    0xB2,
-    0x3A,
-    0x6E,
-    0x5A,
-    0xF1,
-    0x55,
-    0x4D,
-    0xA8,
-    0xC9,
-    0xC1,
-    0x0A,
-    0x98,
-    0x15,
-    0x30,
-    0x44,
-    0xA2,
-    0xC2,
-    0x2C,
-    0x45,
-    0x92,
-    0x6C,
-    0xF3,
-    0x39,
-    0x66,
-    0x42,
-    0xF2,
-    0x35,
-    0x20,
-    0x6F,
-    0x77,
-    0xBB,
-    0x59,
-    0x19,
-    0x1D,
-    0xFE,
-    0x37,
-    0x67,
-    0x2D,
-    0x31,
-    0xF5,
-    0x69,
-    0xA7,
-    0x64,
-    0xAB,
-    0x13,
-    0x54,
-    0x25,
-    0xE9,
-    0x09,
-    0xED,
-    0x5C,
-    0x05,
-    0xCA,
-    0x4C,
-    0x24,
-    0x87,
-    0xBF,
-    0x18,
-    0x3E,
-    0x22,
-    0xF0,
-    0x51,
-    0xEC,
-    0x61,
-    0x17,
-    0x16,
-    0x5E,
-    0xAF,
-    0xD3,
-    0x49,
-    0xA6,
-    0x36,
-    0x43,
-    0xF4,
-    0x47,
-    0x91,
-    0xDF,
-    0x33,
-    0x93,
-    0x21,
-    0x3B,
-    0x79,
-    0xB7,
-    0x97,
-    0x85,
-    0x10,
-    0xB5,
-    0xBA,
-    0x3C,
-    0xB6,
-    0x70,
-    0xD0,
-    0x06,
-    0xA1,
-    0xFA,
-    0x81,
-    0x82,
-    0x83,
-    0x7E,
-    0x7F,
-    0x80,
-    0x96,
-    0x73,
-    0xBE,
-    0x56,
-    0x9B,
-    0x9E,
-    0x95,
-    0xD9,
-    0xF7,
-    0x02,
-    0xB9,
-    0xA4,
-    0xDE,
-    0x6A,
-    0x32,
-    0x6D,
-    0xD8,
-    0x8A,
-    0x84,
-    0x72,
-    0x2A,
-    0x14,
-    0x9F,
-    0x88,
-    0xF9,
-    0xDC,
-    0x89,
-    0x9A,
-    0xFB,
-    0x7C,
-    0x2E,
-    0xC3,
-    0x8F,
-    0xB8,
-    0x65,
-    0x48,
-    0x26,
-    0xC8,
-    0x12,
-    0x4A,
-    0xCE,
-    0xE7,
-    0xD2,
-    0x62,
-    0x0C,
-    0xE0,
-    0x1F,
-    0xEF,
-    0x11,
-    0x75,
-    0x78,
-    0x71,
-    0xA5,
-    0x8E,
-    0x76,
-    0x3D,
-    0xBD,
-    0xBC,
-    0x86,
-    0x57,
-    0x0B,
-    0x28,
-    0x2F,
-    0xA3,
-    0xDA,
-    0xD4,
-    0xE4,
-    0x0F,
-    0xA9,
-    0x27,
-    0x53,
-    0x04,
-    0x1B,
-    0xFC,
-    0xAC,
-    0xE6,
-    0x7A,
-    0x07,
-    0xAE,
-    0x63,
-    0xC5,
-    0xDB,
-    0xE2,
-    0xEA,
-    0x94,
-    0x8B,
-    0xC4,
-    0xD5,
-    0x9D,
-    0xF8,
-    0x90,
-    0x6B,
-    0xB1,
-    0x0D,
-    0xD6,
-    0xEB,
-    0xC6,
-    0x0E,
-    0xCF,
-    0xAD,
-    0x08,
-    0x4E,
-    0xD7,
-    0xE3,
-    0x5D,
-    0x50,
-    0x1E,
-    0xB3,
-    0x5B,
-    0x23,
-    0x38,
-    0x34,
-    0x68,
-    0x46,
-    0x03,
-    0x8C,
-    0xDD,
-    0x9C,
-    0x7D,
-    0xA0,
-    0xCD,
-    0x1A,
-    0x41,
-    0x1C,
-]
+AES_FIELD = gf256(0x11B)
+# Tabel Invers Multiplikatif AES (Standard), sesuai Table 1 pada paper [cite: 188]
+AES_INVERSE_TABLE = AES_FIELD.inverse.tolist()
 
 # S-Box 44 dari Makalah (Table 5) [cite: 1008]
 # Digunakan sebagai "Golden Standard" jika pengguna memilih S-box terbaik
@@ -611,77 +457,625 @@ def bit_array_to_int(arr):
     return res
 
 
-def generate_random_affine_matrix():
-    """Membangkitkan matriks affine 8x8 secara acak (Step 1 Exploration)."""
-    while True:
-        # Generate matriks 8x8 random dengan nilai 0 atau 1
-        matrix = np.random.randint(2, size=(8, 8))
-        # Pastikan determinan tidak 0 (mod 2) agar invertible/bijektif
-        det = int(round(np.linalg.det(matrix))) % 2
-        if det != 0:
-            return matrix
+def pack_matrix_rows(matrices):
+    """
+    Mengemas baris matriks biner (..., 8, 8) menjadi integer (..., 8) uint8:
+    rows[..., i] = sum_j K[..., i, j] << j (LSB di kolom 0).
+    """
+    bits = np.asarray(matrices, dtype=np.uint8) & 1
+    return np.packbits(bits, axis=-1, bitorder="little")[..., 0]
+
+
+def unpack_matrix_rows(rows):
+    """Kebalikan pack_matrix_rows: (..., 8) uint8 -> matriks bit (..., 8, 8) int64."""
+    rows = np.asarray(rows, dtype=np.uint8)
+    return np.unpackbits(rows[..., None], axis=-1, bitorder="little").astype(np.int64)
+
+
+def gf2_rank(matrices):
+    """
+    Rank GF(2) eksak untuk batch matriks (M, 8, 8) atau satu matriks (8, 8).
+    Eliminasi Gauss pada baris terkemas (satu byte per baris), divektorkan
+    di seluruh batch: per kolom dipilih baris pivot pertama yang belum terpakai,
+    lalu pivot di-XOR-kan ke semua baris lain yang memuat bit kolom tersebut.
+    """
+    rows = pack_matrix_rows(matrices)
+    single = rows.ndim == 1
+    rows = np.atleast_2d(rows).copy()
+    if rows.shape[-1] != 8:
+        raise ValueError(f"Matriks harus 8x8, ditemukan {np.shape(matrices)}")
+
+    count = rows.shape[0]
+    batch = np.arange(count)
+    rank = np.zeros(count, dtype=np.int64)
+    for col in range(8):
+        bit = np.uint8(1 << col)
+        # Kandidat pivot: baris ke-rank ke atas yang memuat bit col
+        candidates = ((rows & bit) != 0) & (np.arange(8) >= rank[:, None])
+        found = candidates.any(axis=1)
+        pivot = np.argmax(candidates, axis=1)
+        target = np.minimum(rank, 7)
+
+        # Tukar baris pivot ke posisi rank (hanya untuk batch yang menemukan pivot)
+        sel = batch[found]
+        upper, lower = rows[sel, target[sel]], rows[sel, pivot[sel]]
+        rows[sel, pivot[sel]], rows[sel, target[sel]] = upper, lower
+
+        # Eliminasi bit col dari semua baris lain
+        pivot_rows = np.where(found, rows[batch, target], 0).astype(np.uint8)
+        hit = ((rows & bit) != 0) & (np.arange(8) != target[:, None]) & found[:, None]
+        rows ^= np.where(hit, pivot_rows[:, None], 0).astype(np.uint8)
+        rank += found
+    return int(rank[0]) if single else rank
+
+
+def is_invertible_gf2(matrices):
+    """True jika matriks 8x8 invertible atas GF(2) (rank penuh); mendukung batch."""
+    rank = gf2_rank(matrices)
+    return rank == 8 if np.ndim(rank) else bool(rank == 8)
+
+
+# Peluang matriks biner 8x8 acak invertible: prod_{k=1..8} (1 - 2^-k) ~ 0.2899
+INVERTIBLE_FRACTION = float(np.prod(1 - 0.5 ** np.arange(1, 9)))
+
+
+def generate_random_affine_matrices(rng, count):
+    """
+    Membangkitkan `count` matriks affine 8x8 invertible (M, 8, 8) int64.
+    rng: numpy.random.Generator atau seed (diteruskan ke np.random.default_rng),
+    sehingga hasil dapat direproduksi dari seed. Kandidat diambil per batch
+    sebagai byte baris acak dan disaring dengan gf2_rank.
+    """
+    count = int(count)
+    if count < 0:
+        raise ValueError("Jumlah matriks tidak boleh negatif")
+    rng = np.random.default_rng(rng)
+    accepted, total = [], 0
+    while total < count:
+        draw = int((count - total) / INVERTIBLE_FRACTION * 1.2) + 8
+        rows = rng.integers(0, 256, size=(draw, 8), dtype=np.uint8)
+        rows = rows[gf2_rank(unpack_matrix_rows(rows)) == 8]
+        accepted.append(rows)
+        total += len(rows)
+    rows = np.concatenate(accepted)[:count] if accepted else np.zeros((0, 8), dtype=np.uint8)
+    return unpack_matrix_rows(rows)
+
+
+def generate_random_affine_matrix(rng=None):
+    """Membangkitkan satu matriks affine 8x8 invertible secara acak (Step 1 Exploration)."""
+    return generate_random_affine_matrices(rng, 1)[0]
+
+
+# ==========================================
+# MATRIKS AFFINE TERKEMAS (uint64) DAN ENUMERASI GL(8, 2)
+# ==========================================
+
+# Radix enumerasi: baris ke-i dipilih dari 256 - 2^i vektor di luar span baris sebelumnya
+GL_RADICES = 256 - (1 << np.arange(8, dtype=np.int64))
+# Bobot mixed-radix (baris 0 paling signifikan) dan |GL(8, 2)| = 5348063769211699200
+GL_WEIGHTS = np.array([int(np.prod(GL_RADICES[i + 1:])) for i in range(8)], dtype=np.int64)
+GL_ORDER = int(GL_WEIGHTS[0]) * int(GL_RADICES[0])
+
+_BYTE_SHIFTS = np.arange(0, 64, 8, dtype=np.uint64)
+
+
+def pack_matrix_words(matrices):
+    """Matriks (..., 8, 8) -> word uint64 (...): byte ke-i = baris i terkemas."""
+    rows = pack_matrix_rows(matrices).astype(np.uint64)
+    return np.bitwise_or.reduce(rows << _BYTE_SHIFTS, axis=-1)
+
+
+def unpack_matrix_words(words):
+    """Kebalikan pack_matrix_words: word uint64 (...) -> matriks bit (..., 8, 8) int64."""
+    words = np.asarray(words, dtype=np.uint64)
+    return unpack_matrix_rows(((words[..., None] >> _BYTE_SHIFTS) & np.uint64(0xFF)).astype(np.uint8))
+
+
+def _span_step(span, rows):
+    """Memperbarui tabel keanggotaan span (M, 256) setelah menambah baris rows (M,)."""
+    values = np.arange(256)
+    return span | np.take_along_axis(span, values ^ rows[:, None], axis=1)
+
+
+def rank_affine_matrices(matrices):
+    """
+    Indeks enumerasi (0 .. GL_ORDER - 1) untuk batch matriks invertible (M, 8, 8).
+    Digit baris i = posisi baris tersebut di antara vektor yang tidak berada di
+    span baris 0..i-1 (urut naik); digit digabung secara mixed-radix.
+    """
+    rows = np.atleast_2d(pack_matrix_rows(matrices)).astype(np.int64)
+    count = rows.shape[0]
+    span = np.zeros((count, 256), dtype=bool)
+    span[:, 0] = True
+    ranks = np.zeros(count, dtype=np.int64)
+    for i in range(8):
+        row = rows[:, i]
+        if np.any(span[np.arange(count), row]):
+            raise ValueError("Matriks tidak invertible atas GF(2), tidak memiliki indeks enumerasi")
+        # Jumlah anggota span yang lebih kecil dari row
+        below = np.cumsum(span, axis=1)[np.arange(count), row]
+        ranks += (row - below) * GL_WEIGHTS[i]
+        span = _span_step(span, row)
+    return ranks
+
+
+def unrank_affine_matrices(ranks):
+    """Kebalikan rank_affine_matrices: indeks (M,) -> matriks invertible (M, 8, 8) int64."""
+    ranks = np.atleast_1d(np.asarray(ranks, dtype=np.int64))
+    if np.any((ranks < 0) | (ranks >= GL_ORDER)):
+        raise ValueError(f"Indeks enumerasi harus berada dalam range 0-{GL_ORDER - 1}")
+    count = ranks.shape[0]
+    span = np.zeros((count, 256), dtype=bool)
+    span[:, 0] = True
+    rows = np.zeros((count, 8), dtype=np.int64)
+    for i in range(8):
+        digit = (ranks // GL_WEIGHTS[i]) % GL_RADICES[i]
+        # Vektor ke-digit (urut naik) yang tidak berada di span
+        outside = np.cumsum(~span, axis=1)
+        rows[:, i] = np.argmax(outside > digit[:, None], axis=1)
+        span = _span_step(span, rows[:, i])
+    return unpack_matrix_rows(rows.astype(np.uint8))
+
+
+class AffineMatrix:
+    """
+    Matriks affine 8x8 atas GF(2) yang dikemas dalam satu word uint64
+    (byte ke-i = baris i, bit j = K[i][j]). Immutable, hash dan perbandingan O(1),
+    sehingga dapat disimpan di set/dict untuk deduplikasi hasil eksplorasi.
+    """
+
+    __slots__ = ("_word",)
+
+    def __init__(self, word):
+        word = int(word)
+        if not 0 <= word < 1 << 64:
+            raise ValueError("Word matriks harus berada dalam range 0 - 2^64-1")
+        object.__setattr__(self, "_word", word)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("AffineMatrix bersifat immutable")
+
+    @classmethod
+    def from_array(cls, matrix):
+        matrix = np.asarray(matrix)
+        if matrix.shape != (8, 8):
+            raise ValueError(f"Matriks harus 8x8, ditemukan {matrix.shape}")
+        if not np.all(np.isin(matrix, (0, 1))):
+            raise ValueError("Matriks hanya boleh berisi angka 0 atau 1")
+        return cls(pack_matrix_words(matrix))
+
+    @classmethod
+    def from_rank(cls, rank):
+        """Matriks invertible ke-rank dalam enumerasi GL(8, 2)."""
+        if not 0 <= rank < GL_ORDER:
+            raise ValueError(f"Indeks enumerasi harus berada dalam range 0-{GL_ORDER - 1}")
+        return cls.from_array(unrank_affine_matrices([rank])[0])
+
+    @classmethod
+    def from_json(cls, value):
+        """Menerima bentuk JSON: list 8x8, integer word, atau string hex word."""
+        if isinstance(value, str):
+            return cls(int(value, 16))
+        if isinstance(value, (int, np.integer)):
+            return cls(value)
+        return cls.from_array(value)
+
+    @property
+    def word(self):
+        return self._word
+
+    def to_array(self):
+        return unpack_matrix_words(np.uint64(self._word))
+
+    def __array__(self, dtype=None, copy=None):
+        matrix = self.to_array()
+        return matrix if dtype is None else matrix.astype(dtype)
+
+    def to_json(self):
+        """Bentuk JSON yang sama dengan MatrixRequest.matrix (list 8x8)."""
+        return self.to_array().tolist()
+
+    def to_hex(self):
+        return f"{self._word:016x}"
+
+    @property
+    def is_invertible(self):
+        return is_invertible_gf2(self.to_array())
+
+    @property
+    def rank(self):
+        """Indeks enumerasi GL(8, 2); ValueError jika matriks singular."""
+        return int(rank_affine_matrices(self.to_array())[0])
+
+    def __int__(self):
+        return self._word
+
+    def __index__(self):
+        return self._word
 
+    def __hash__(self):
+        return hash(self._word)
 
-def construct_sbox(affine_matrix):
+    def __eq__(self, other):
+        if isinstance(other, AffineMatrix):
+            return self._word == other._word
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, AffineMatrix):
+            return self._word < other._word
+        return NotImplemented
+
+    def __repr__(self):
+        return f"AffineMatrix(0x{self._word:016x})"
+
+    def __reduce__(self):
+        return (AffineMatrix, (self._word,))
+
+
+def affine_matrices_in_range(start, stop):
+    """Matriks invertible dengan indeks enumerasi [start, stop) untuk eksplorasi per shard."""
+    return unrank_affine_matrices(np.arange(int(start), int(stop), dtype=np.int64))
+
+
+# Tabel bit invers: INVERSE_BITS[x, j] = bit j dari AES_INVERSE_TABLE[x] (256 x 8, LSB di j = 0).
+# Disimpan sebagai float32 agar perkalian GF(2) berjalan lewat BLAS (jumlah <= 8, eksak).
+INVERSE_BITS = AES_FIELD.inverse_bits
+
+
+def check_binary_matrices(matrices):
+    """Matriks affine (..., 8, 8) sebagai int64; ValueError jika bentuk salah atau ada elemen selain 0/1."""
+    k = np.asarray(matrices)
+    if k.ndim < 2 or k.shape[-2:] != (8, 8):
+        raise ValueError(f"Matriks affine harus berbentuk (..., 8, 8), ditemukan {k.shape}")
+    if not np.all(np.isin(k, (0, 1))):
+        raise ValueError("Matriks hanya boleh berisi angka 0 atau 1")
+    return k.astype(np.int64)
+
+
+def constant_byte(constant):
+    """Konstanta C sebagai integer 0-255, dari integer atau vektor 8 bit 0/1 (LSB dulu, seperti C_AES)."""
+    if np.ndim(constant) == 0:
+        value = int(constant)
+        if not 0 <= value <= 255:
+            raise ValueError(f"Konstanta harus berada dalam range 0-255, ditemukan {value}")
+        return value
+    bits = np.asarray(constant)
+    if bits.shape != (8,) or not np.all(np.isin(bits, (0, 1))):
+        raise ValueError("Konstanta vektor harus berisi 8 bit 0/1 (LSB dulu)")
+    return int(np.sum(bits.astype(np.int64) << np.arange(8)))
+
+
+def _as_matrix_batch(matrices):
+    k = check_binary_matrices(matrices)
+    if k.ndim != 3:
+        raise ValueError(f"Matriks affine harus berbentuk (M, 8, 8), ditemukan {k.shape}")
+    return k
+
+
+def _constant_bits(constant):
+    return ((constant_byte(constant) >> np.arange(8)) & 1).astype(np.uint8)
+
+
+def _affine_images(input_bits, k, constant):
+    """
+    Peta affine K.v + C untuk setiap baris input_bits (256 x 8 float32) dan setiap
+    matriks k (M, 8, 8) dalam satu perkalian (256 x 8) @ (8 x M*8), kolom m*8 + i.
+    Returns: array (M, 256) uint8
+    """
+    count = k.shape[0]
+    columns = np.transpose(k, (2, 0, 1)).reshape(8, count * 8).astype(np.float32)
+    bits = (input_bits @ columns).astype(np.uint8).reshape(256, count, 8) & 1
+    bits ^= constant
+    sboxes = np.packbits(bits, axis=-1, bitorder="little")[..., 0]
+    return np.ascontiguousarray(sboxes.T)
+
+
+# Bit semua nilai 0..255 (256 x 8, float32), input untuk tabel peta linear
+VALUE_BITS = ((np.arange(256)[:, None] >> np.arange(8)) & 1).astype(np.float32)
+
+
+def linear_tables(matrices):
+    """Tabel L[..., v] = K . v di GF(2) untuk matriks (..., 8, 8); hasil (..., 256) uint8."""
+    k = np.asarray(matrices, dtype=np.int64) & 1
+    if k.shape[-2:] != (8, 8):
+        raise ValueError(f"Matriks affine harus berbentuk (..., 8, 8), ditemukan {k.shape}")
+    tables = _affine_images(VALUE_BITS, k.reshape(-1, 8, 8), np.uint8(0))
+    return tables.reshape(k.shape[:-2] + (256,))
+
+
+def is_bijective_table(tables):
+    """True per baris (..., N) yang merupakan permutasi 0..N-1 (K invertible <=> L bijektif)."""
+    tables = np.asarray(tables)
+    return np.all(np.sort(tables, axis=-1) == np.arange(tables.shape[-1]), axis=-1)
+
+
+def construct_sboxes(affine_matrices, constant=C_AES, field=None):
+    """
+    Step 2 (batch): konstruksi banyak kandidat S-box sekaligus.
+    Rumus: B(x) = (K * X^-1 + C) mod 2 sebagai satu perkalian matriks GF(2):
+    bits[x, m, i] = sum_j INVERSE_BITS[x, j] * K[m, i, j] mod 2.
+
+    affine_matrices: array (M, 8, 8) bit 0/1
+    constant: vektor bit C (LSB dulu) atau integer 0-255
+    field: GF256 atau polinomial iredusibel untuk X^-1 (default medan AES 0x11B)
+    Returns: array (M, 256) uint8
+    """
+    k = _as_matrix_batch(affine_matrices)
+    return _affine_images(as_field(field).inverse_bits, k, _constant_bits(constant))
+
+
+def construct_sbox(affine_matrix, constant=C_AES, field=None):
     """
     Step 2: Candidate S-box Construction.
-    Rumus: B(x) = (K * X^-1 + C) mod 2
+    Rumus: B(x) = (K * X^-1 + C) mod 2, dihitung lewat construct_sboxes.
+    Returns: array (256,) uint8
+    """
+    return construct_sboxes(np.asarray(affine_matrix)[None], constant, field)[0]
+
+
+# ==========================================
+# PETA PANGKAT x^d (GOLD, KASAMI, INVERS)
+# ==========================================
+
+
+def _exponent_list(values):
+    """Eksponen unik mod 255 (urut kemunculan), 0 dan kelipatan 255 dibuang."""
+    seen = []
+    for d in values:
+        d %= 255
+        if d and d not in seen:
+            seen.append(d)
+    return seen
+
+
+def gold_exponents():
+    """Eksponen Gold d = 2^k + 1, k = 1..7."""
+    return _exponent_list((1 << k) + 1 for k in range(1, 8))
+
+
+def kasami_exponents():
+    """Eksponen Kasami d = 2^(2k) - 2^k + 1, k = 1..7."""
+    return _exponent_list((1 << (2 * k)) - (1 << k) + 1 for k in range(1, 8))
+
 
+def inverse_exponents():
+    """Peta invers x^254 = x^-1 (0 -> 0), basis S-Box AES."""
+    return [254]
+
+
+def all_exponents():
+    """Semua eksponen 1..254."""
+    return list(range(1, 255))
+
+
+POWER_FAMILIES = {
+    "gold": gold_exponents,
+    "kasami": kasami_exponents,
+    "inverse": inverse_exponents,
+    "all": all_exponents,
+}
+
+
+def is_permutation_exponent(d):
+    """x^d bijektif di GF(2^8) <=> gcd(d, 255) = 1."""
+    return np.gcd(int(d), 255) == 1
+
+
+def power_exponents(family, bijective_only=True):
+    """Eksponen sebuah keluarga; default hanya yang menghasilkan permutasi (S-Box valid)."""
+    if family not in POWER_FAMILIES:
+        raise ValueError(f"Keluarga pangkat tidak dikenal: {family}. Pilihan: {', '.join(POWER_FAMILIES)}")
+    exponents = POWER_FAMILIES[family]()
+    if bijective_only:
+        exponents = [d for d in exponents if is_permutation_exponent(d)]
+    return np.array(exponents, dtype=np.int64)
+
+
+def power_maps(exponents, field=None):
+    """Tabel x^d untuk setiap eksponen (E,) lewat tabel log/exp; hasil (E, 256) uint8."""
+    field = as_field(field)
+    exponents = np.atleast_1d(np.asarray(exponents, dtype=np.int64))
+    if np.any(exponents < 1):
+        raise ValueError("Eksponen harus >= 1")
+    values = np.arange(256)
+    maps = field.exp[(field.log[values][None, :] * exponents[:, None]) % 255]
+    maps[:, 0] = 0
+    return maps
+
+
+def construct_power_sboxes(exponents, output_matrices=None, input_matrix=None, constant=0, field=None):
+    """
+    Kandidat S(x) = A_out * (A_in * x)^d + C untuk setiap eksponen (E,) dan setiap
+    matriks output (M, 8, 8); tanpa matriks, lapisan affine dilewati.
+    Semua langkah berupa lookup tabel (peta pangkat, tabel linear A_in/A_out).
+
+    Returns: (exponents (E*M,), sboxes (E*M, 256) uint8), urut eksponen lalu matriks.
+    """
+    exponents = np.atleast_1d(np.asarray(exponents, dtype=np.int64))
+    maps = power_maps(exponents, field)
+    if input_matrix is not None:
+        maps = maps[:, linear_tables(np.asarray(input_matrix)[None])[0]]
+
+    if output_matrices is None:
+        sboxes = maps[:, None, :]
+    else:
+        output_matrices = np.asarray(output_matrices)
+        if output_matrices.ndim == 2:
+            output_matrices = output_matrices[None]
+        tables = linear_tables(output_matrices)
+        sboxes = tables[np.arange(len(tables))[None, :, None], maps[:, None, :]]
+
+    constant = int(bit_array_to_int(constant)) if np.ndim(constant) else int(constant)
+    sboxes = (sboxes ^ np.uint8(constant)).reshape(-1, 256)
+    return np.repeat(exponents, sboxes.shape[0] // len(exponents)), sboxes
+
+
+# ==========================================
+# TIPE S-BOX IMMUTABLE (256 BYTE)
+# ==========================================
+
+
+class SBox:
+    """
+    S-Box 8-bit bijektif yang immutable, disimpan sebagai 256 byte.
+    Bijektivitas divalidasi sekali saat konstruksi; invers dan digest dihitung
+    lazy lalu di-cache. array memberi view NumPy uint8 read-only tanpa salinan.
+    Indeks, slicing, iterasi dan len() berperilaku seperti list[int] (slice
+    menghasilkan list[int] baru). Kesamaan (==) dan hash berdasarkan isi, tetapi
+    hanya antar-SBox: SBox tidak pernah sama dengan list atau bytes (pakai tolist()).
     """
-    sbox = [0] * 256
-    for x in range(256):
-        # 1. Ambil invers multiplikatif dari x
-        x_inv = AES_INVERSE_TABLE[x]
 
-        # 2. Ubah ke bentuk vektor bit
-        b_inv = int_to_bit_array(x_inv)
+    __slots__ = ("_data", "_inverse", "_digest")
+
+    def __init__(self, values):
+        if isinstance(values, SBox):
+            data = values._data
+        elif isinstance(values, (bytes, bytearray, memoryview)):
+            data = bytes(values)
+        else:
+            try:
+                array = np.asarray(values, dtype=np.int64)
+            except (ValueError, TypeError, OverflowError):
+                raise ValueError("Semua elemen S-Box harus berupa angka")
+            if array.ndim != 1:
+                raise ValueError(f"S-Box harus berupa array 1 dimensi, ditemukan {array.shape}")
+            if np.any((array < 0) | (array > 255)):
+                raise ValueError("Semua elemen S-Box harus berada dalam range 0-255")
+            data = array.astype(np.uint8).tobytes()
+
+        if len(data) != 256:
+            raise ValueError(f"S-Box harus memiliki 256 elemen, ditemukan {len(data)}")
+        if np.count_nonzero(np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)) != 256:
+            raise ValueError("S-Box harus bijektif (semua nilai unik, tidak ada duplikat)")
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_inverse", None)
+        object.__setattr__(self, "_digest", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SBox bersifat immutable")
+
+    @classmethod
+    def _trusted(cls, data):
+        """Konstruksi tanpa validasi ulang untuk data yang sudah pasti bijektif."""
+        sbox = object.__new__(cls)
+        object.__setattr__(sbox, "_data", data)
+        object.__setattr__(sbox, "_inverse", None)
+        object.__setattr__(sbox, "_digest", None)
+        return sbox
+
+    @property
+    def data(self):
+        return self._data
+
+    @property
+    def array(self):
+        """View uint8 (256,) read-only atas buffer yang sama."""
+        return np.frombuffer(self._data, dtype=np.uint8)
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.array
+        return array if dtype is None else array.astype(dtype)
 
-        # 3. Perkalian Matriks (Affine Transformation)
-        # Matriks paper biasanya direpresentasikan bit 0 (LSB) di atas atau bawah tergantung notasi.
-        # Disini kita gunakan perkalian dot product standar mod 2
-        prod = np.dot(affine_matrix, b_inv) % 2
+    @property
+    def inverse(self):
+        """S-Box invers (untuk dekripsi), dihitung sekali."""
+        if self._inverse is None:
+            inverse = np.empty(256, dtype=np.uint8)
+            inverse[self.array] = np.arange(256, dtype=np.uint8)
+            inverse = SBox._trusted(inverse.tobytes())
+            object.__setattr__(inverse, "_inverse", self)
+            object.__setattr__(self, "_inverse", inverse)
+        return self._inverse
 
-        # 4. Tambahkan Konstanta (XOR di GF(2))
-        res_bits = (prod + C_AES) % 2
+    @property
+    def digest(self):
+        """Digest SHA-256 (hex) dari isi S-Box, dihitung sekali."""
+        if self._digest is None:
+            object.__setattr__(self, "_digest", hashlib.sha256(self._data).hexdigest())
+        return self._digest
 
-        # 5. Kembalikan ke integer
-        sbox[x] = bit_array_to_int(res_bits)
+    def tolist(self):
+        return list(self._data)
 
-    return sbox
+    def __bytes__(self):
+        return self._data
+
+    def __len__(self):
+        return 256
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._data[index])
+        return self._data[index]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __hash__(self):
+        return hash(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, SBox):
+            return self._data == other._data
+        return NotImplemented
+
+    def __repr__(self):
+        return f"SBox({self.digest[:16]})"
+
+    def __reduce__(self):
+        return (SBox, (self._data,))
+
+
+def as_sbox(values):
+    """SBox apa adanya, atau konstruksi (dan validasi) dari list/array/bytes."""
+    return values if isinstance(values, SBox) else SBox(values)
 
 
 def generate_inverse_sbox(sbox):
-    """Membuat Invers S-Box untuk dekripsi."""
+    """Membuat Invers S-Box untuk dekripsi (untuk SBox, invers yang sudah di-cache)."""
+    if isinstance(sbox, SBox):
+        return sbox.inverse
     inv_sbox = [0] * 256
     for i in range(256):
         inv_sbox[sbox[i]] = i
     return inv_sbox
 
 
-def validate_sbox(sbox):
+def validate_sbox(sbox, n=8):
     """
-    Validasi S-Box untuk memastikan:
-    1. Panjang = 256
-    2. Semua nilai adalah integer 0-255
+    Validasi S-Box n-bit (default 8, didukung 4-12) untuk memastikan:
+    1. Panjang = 2^n
+    2. Semua nilai adalah integer 0 - (2^n - 1)
     3. Bijektif (semua nilai unik)
 
     Returns: (is_valid: bool, error_message: str)
     """
+    if not 4 <= n <= 12:
+        return False, f"Lebar S-Box harus 4-12 bit, ditemukan {n}"
+    size = 1 << n
+
+    if isinstance(sbox, SBox):
+        # Sudah divalidasi saat konstruksi
+        if n == 8:
+            return True, "✓ S-Box Valid"
+        return False, f"S-Box harus memiliki {size} elemen, ditemukan 256"
+
     if not isinstance(sbox, (list, np.ndarray)):
         return False, "S-Box harus berupa list atau array"
 
-    if len(sbox) != 256:
-        return False, f"S-Box harus memiliki 256 elemen, ditemukan {len(sbox)}"
+    if len(sbox) != size:
+        return False, f"S-Box harus memiliki {size} elemen, ditemukan {len(sbox)}"
 
     try:
-        sbox_int = [int(x) for x in sbox]
-    except (ValueError, TypeError):
+        sbox_int = np.array([int(x) for x in sbox], dtype=np.int64)
+    except (ValueError, TypeError, OverflowError):
         return False, "Semua elemen S-Box harus berupa angka"
 
-    if not all(0 <= x <= 255 for x in sbox_int):
-        return False, "Semua elemen S-Box harus berada dalam range 0-255"
+    if np.any((sbox_int < 0) | (sbox_int >= size)):
+        return False, f"Semua elemen S-Box harus berada dalam range 0-{size - 1}"
 
-    if len(set(sbox_int)) != 256:
+    if len(np.unique(sbox_int)) != size:
         return False, "S-Box harus bijektif (semua nilai unik, tidak ada duplikat)"
 
     return True, "✓ S-Box Valid"
@@ -0,0 +1,111 @@
+"""
+Test script untuk ModifiedAES dan medan GF(2^8) yang dapat dipilih di aes_cipher
+Jalankan: python test_aes_cipher.py
+"""
+
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+# FIPS-197 Appendix C.1 (AES-128)
+FIPS_KEY = bytes(range(16))
+FIPS_PLAINTEXT = bytes.fromhex("00112233445566778899aabbccddeeff")
+FIPS_CIPHERTEXT = bytes.fromhex("69c4e0d86a7b0430d8cdb78070b4c55a")
+
+
+def _aes_matrix():
+    """Matriks affine AES (FIPS 197): K[i][j] = 1 untuk j - i mod 8 di {0, 4, 5, 6, 7}."""
+    import numpy as np
+
+    return np.array([[int((j - i) % 8 in (0, 4, 5, 6, 7)) for j in range(8)] for i in range(8)])
+
+
+def test_known_answer():
+    """Test 1: Vektor uji FIPS-197 dengan S-Box AES standar"""
+    print("=" * 60)
+    print("TEST 1: FIPS-197 Known Answer")
+    print("=" * 60)
+
+    import aes_cipher
+    import sbox_logic
+
+    sbox = sbox_logic.construct_sbox(_aes_matrix()).tolist()
+    assert sbox[:4] == [0x63, 0x7C, 0x77, 0x7B], f"S-Box AES tidak sesuai: {sbox[:4]}"
+
+    print("\n• Testing encrypt_block() against FIPS-197 C.1...")
+    aes = aes_cipher.ModifiedAES(FIPS_KEY, sbox)
+    ciphertext = aes.encrypt_block(FIPS_PLAINTEXT)
+    assert ciphertext == FIPS_CIPHERTEXT, f"Expected {FIPS_CIPHERTEXT.hex()}, got {ciphertext.hex()}"
+    print(f"  ✓ Ciphertext {ciphertext.hex()}")
+
+    print("\n• Testing decrypt_block()...")
+    assert aes.decrypt_block(ciphertext) == FIPS_PLAINTEXT, "Dekripsi tidak mengembalikan plaintext"
+    print("  ✓ Plaintext kembali utuh")
+
+    print("\n✅ Known answer tests passed!\n")
+
+
+def test_custom_field_round_trip():
+    """Test 2: Enkripsi/dekripsi dengan polinomial selain AES"""
+    print("=" * 60)
+    print("TEST 2: Non-AES Polynomial Round Trip")
+    print("=" * 60)
+
+    import aes_cipher
+    import sbox_logic
+
+    poly = 0x11D
+    field = sbox_logic.gf256(poly)
+    sbox = sbox_logic.construct_sbox(_aes_matrix(), field=field).tolist()
+    data = b"S-Box round trip di GF(2^8)/0x11D, lebih dari satu blok."
+
+    print(f"\n• Testing InvMixColumns under 0x{poly:X}...")
+    _, mix, inv_mix = aes_cipher.round_constants(poly)
+    aes = aes_cipher.ModifiedAES(FIPS_KEY, sbox, field=field)
+    state = [[(4 * r + c) * 17 & 0xFF for c in range(4)] for r in range(4)]
+    mixed = aes.mix_columns([row[:] for row in state])
+    assert aes.inv_mix_columns(mixed) == state, "InvMixColumns bukan invers MixColumns"
+    print(f"  ✓ MixColumns {mix} dibalik oleh {inv_mix}")
+
+    print("\n• Testing CBC round trip...")
+    ciphertext = aes_cipher.encrypt_data(FIPS_KEY, data, sbox, field=poly)
+    assert aes_cipher.decrypt_data(FIPS_KEY, ciphertext, sbox, field=poly) == data, "Round trip gagal"
+    # Medan ikut menentukan MixColumns/Rcon: ciphertext berbeda dari medan AES
+    assert ciphertext != aes_cipher.encrypt_data(FIPS_KEY, data, sbox), "Medan tidak berpengaruh"
+    print(f"  ✓ {len(data)} byte kembali utuh, ciphertext {ciphertext[:8].hex()}...")
+
+    print("\n✅ Custom field tests passed!\n")
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("FIPS-197 Known Answer", test_known_answer),
+        ("Non-AES Polynomial", test_custom_field_round_trip),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' failed: {e!r}\n")
+            results.append((name, False))
+
+    print("=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+    for name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {name}")
+
+    passed_count = sum(1 for _, p in results if p)
+    print(f"\nResult: {passed_count}/{len(results)} test groups passed\n")
+    return 0 if passed_count == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -174,6 +174,27 @@ def test_api_structure():
         else:
             print("⚠️  Function not found (might be defined with decorator)")
 
+        # Upload file contoh dan pastikan analisis lengkap (tanpa error partial)
+        try:
+            from fastapi.testclient import TestClient
+        except ImportError:
+            TestClient = None
+        if TestClient is not None and os.path.exists("sample_sbox_column.xlsx"):
+            client = TestClient(api.app)
+            with open("sample_sbox_column.xlsx", "rb") as f:
+                response = client.post(
+                    "/upload-excel-sbox", files={"file": ("sample_sbox_column.xlsx", f)}
+                )
+            analysis = response.json().get("analysis", {})
+            expected = ("nl", "nonlinearity", "sac", "dac", "pc", "bd", "du", "lap", "sv")
+            if "error" in analysis or not all(key in analysis for key in expected):
+                print(f"✗ Upload analysis incomplete: {analysis}")
+                return False
+            if analysis["nonlinearity"] != analysis["nl"]:
+                print("✗ Alias nonlinearity tidak sama dengan nl")
+                return False
+            print(f"✓ Upload analysis complete (NL={analysis['nl']}, BD={analysis['bd']})")
+
         print("\n✅ API structure check passed!\n")
         return True
 
@@ -0,0 +1,227 @@
+"""
+Test script untuk metrik propagasi (DAC, PC, BD), profil affine dan screening di sbox_analysis
+Jalankan: python test_sbox_analysis.py
+"""
+
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+# S-Box 4-bit PRESENT
+PRESENT_SBOX = [0xC, 0x5, 0x6, 0xB, 0x9, 0x0, 0xA, 0xD, 0x3, 0xE, 0xF, 0x8, 0x4, 0x7, 0x1, 0x2]
+
+
+def test_dac():
+    """Test 1: DAC terhadap nilai yang dihitung manual"""
+    print("=" * 60)
+    print("TEST 1: Differential Avalanche Criterion")
+    print("=" * 60)
+
+    import numpy as np
+    import sbox_analysis
+    from sbox_logic import SBOX_44
+
+    # Identitas: bit j berubah tepat saat a_j = 1, sehingga |p - 1/2| = 1/2 di mana-mana
+    print("\n• Testing calculate_dac() with identity (4-bit)...")
+    dac = sbox_analysis.calculate_dac(list(range(16)))
+    assert dac == 0.5, f"Expected 0.5, got {dac}"
+    print(f"  ✓ DAC={dac}")
+
+    # PRESENT: sum_{a, j} |p(a, j) - 1/2| = 6 atas 15 * 4 pasangan -> 1/10
+    print("\n• Testing calculate_dac() with PRESENT S-Box...")
+    dac = sbox_analysis.calculate_dac(PRESENT_SBOX)
+    assert abs(dac - 0.1) < 1e-12, f"Expected 0.1, got {dac}"
+    print(f"  ✓ DAC={dac}")
+
+    # SBOX_44: jalur SBoxProfile, batch dan fungsi tunggal harus sama (11/408)
+    print("\n• Testing DAC paths with SBOX_44...")
+    values = (
+        sbox_analysis.calculate_dac(SBOX_44),
+        sbox_analysis.SBoxProfile(SBOX_44).dac,
+        float(sbox_analysis.analyze_batch(np.array([SBOX_44]), extra=("dac",))["dac"][0]),
+    )
+    assert all(abs(value - 11 / 408) < 1e-12 for value in values), f"Unexpected DAC values: {values}"
+    print(f"  ✓ DAC={values[0]:.6f} (profile, batch identik)")
+
+    print("\n✅ DAC tests passed!\n")
+
+
+def test_pc_bd():
+    """Test 2: PC dan branch number diferensial"""
+    print("=" * 60)
+    print("TEST 2: Propagation Criterion & Branch Number")
+    print("=" * 60)
+
+    import sbox_analysis
+    from sbox_logic import SBOX_44
+
+    print("\n• Testing calculate_pc/bd() with SBOX_44...")
+    pc = sbox_analysis.calculate_pc(SBOX_44)
+    bd = sbox_analysis.calculate_bd(SBOX_44)
+    profile = sbox_analysis.SBoxProfile(SBOX_44)
+    assert 0.45 < pc < 0.55 and bd >= 2, f"Unexpected metrics: PC={pc}, BD={bd}"
+    assert abs(profile.pc - pc) < 1e-12 and profile.bd == bd, "SBoxProfile tidak konsisten"
+    print(f"  ✓ PC={pc:.4f}, BD={bd}")
+
+    # Identitas: HW(a) + HW(a) minimum 2
+    print("\n• Testing calculate_bd() with identity (4-bit)...")
+    bd = sbox_analysis.calculate_bd(list(range(16)))
+    assert bd == 2, f"Expected 2, got {bd}"
+    print(f"  ✓ BD={bd}")
+
+    print("\n✅ PC/BD tests passed!\n")
+
+
+def test_affine_profile():
+    """Test 3: Profil dari tabel peta invers sama dengan profil langsung"""
+    print("=" * 60)
+    print("TEST 3: Affine Profiles")
+    print("=" * 60)
+
+    import numpy as np
+    import sbox_analysis
+    import sbox_logic
+
+    singular = sbox_logic.K_44.copy()
+    singular[7] = singular[0] ^ singular[1]
+    assert not sbox_logic.is_invertible_gf2(singular)
+    cases = [
+        ("K_44, C AES", sbox_logic.K_44, sbox_analysis.AES_CONSTANT),
+        ("K_44, C = 0", sbox_logic.K_44, 0),
+        ("K_128, C = 0xA5", sbox_logic.K_128, 0xA5),
+        ("K singular, C AES", singular, sbox_analysis.AES_CONSTANT),
+    ]
+    for label, matrix, constant in cases:
+        print(f"\n• Testing from_affine() with {label}...")
+        # BCT (bu) hanya terdefinisi untuk S-Box bijektif
+        extra = [name for name in sbox_analysis.EXTRA_METRICS
+                 if name != "bu" or sbox_logic.is_invertible_gf2(matrix)]
+        sbox = sbox_logic.construct_sbox(matrix, constant)
+        direct = sbox_analysis.SBoxProfile(sbox)
+        derived = sbox_analysis.SBoxProfile.from_affine(matrix, constant)
+        assert np.array_equal(derived.sbox, direct.sbox), "S-Box hasil konstruksi berbeda"
+        assert np.array_equal(derived.walsh, direct.walsh), "Tabel Walsh berbeda"
+        assert np.array_equal(derived.ddt, direct.ddt), "DDT berbeda"
+        expected, actual = direct.as_dict(extra=extra), derived.as_dict(extra=extra)
+        assert expected.keys() == actual.keys()
+        for name in expected:
+            assert np.isclose(actual[name], expected[name]), f"{name}: {actual[name]} != {expected[name]}"
+        print(f"  ✓ NL={actual['nl']}, DU={actual['du']}, SV={actual['sv']:.4f}")
+
+    print("\n• Testing analyze_affine_batch() against analyze_batch()...")
+    matrices = np.array([matrix for _, matrix, _ in cases])
+    sboxes, columns = sbox_analysis.analyze_affine_batch(matrices, 0xA5)
+    expected = sbox_analysis.analyze_batch(sbox_logic.construct_sboxes(matrices, 0xA5))
+    for name in sbox_analysis.METRICS:
+        assert np.allclose(columns[name], expected[name]), f"Kolom {name} berbeda"
+    print(f"  ✓ {len(sboxes)} kandidat identik")
+
+    print("\n✅ Affine profile tests passed!\n")
+
+
+def test_screening():
+    """Test 4: Screening bertahap menolak kandidat di tahap yang tepat"""
+    print("=" * 60)
+    print("TEST 4: Staged Screening")
+    print("=" * 60)
+
+    import numpy as np
+    import sbox_analysis
+    from sbox_logic import SBOX_44
+
+    identity = list(range(256))
+    random_sbox = np.random.default_rng(8).permutation(256)
+    candidates = np.array([identity, SBOX_44, random_sbox])
+    predicates = ["du<=4", "nl>=112", "sv<=16.01"]
+
+    print("\n• Testing rejection stages...")
+    result = sbox_analysis.screen_sboxes(candidates, predicates, metrics=("dac",))
+    stages = {stage["stage"]: stage for stage in result["stages"]}
+    rejected = {entry["stage"]: entry for entry in result["rejected"]}
+    # Identitas (DU = 256) dan permutasi acak gagal di tahap differential,
+    # SBOX_44 lolos semua predikat
+    assert result["passed"].tolist() == [1], f"Kandidat lolos: {result['passed']}"
+    assert rejected["differential"]["indices"].tolist() == [0, 2]
+    assert rejected["differential"]["metrics"]["du"][0] == 256
+    assert "nl" not in rejected["differential"]["metrics"], "Tahap berikutnya tidak boleh dihitung"
+    assert stages["differential"]["evaluated"] == 3 and stages["sv"]["evaluated"] <= 2
+    assert stages["propagation"]["passed"] == stages["propagation"]["evaluated"], "dac tidak berpredikat"
+    print(f"  ✓ Ditolak: {[(e['stage'], e['indices'].tolist()) for e in result['rejected']]}")
+
+    print("\n• Testing metrics of survivors and rejected candidates...")
+    expected = sbox_analysis.analyze_batch(candidates, extra=("dac", "pc", "bd"))
+    for name, values in result["metrics"].items():
+        assert np.allclose(values, expected[name][result["passed"]]), f"Metrik {name} berbeda"
+    for entry in result["rejected"]:
+        for name, values in entry["metrics"].items():
+            assert np.allclose(values, expected[name][entry["indices"]]), f"Metrik {name} berbeda"
+    print(f"  ✓ SBOX_44: SV={result['metrics']['sv'][0]:.4f}, DAC={result['metrics']['dac'][0]:.6f}")
+
+    print("\n• Testing rejection at the coordinates stage...")
+    result = sbox_analysis.screen_sboxes(np.array([SBOX_44]), ["du<=4", "nl>=113"])
+    assert len(result["passed"]) == 0 and [e["stage"] for e in result["rejected"]] == ["coordinates"]
+    assert result["rejected"][0]["metrics"]["nl"].tolist() == [112]
+    print("  ✓ NL=112 ditolak oleh nl>=113")
+
+    print("\n✅ Screening tests passed!\n")
+
+
+def test_to_estimate():
+    """Test 5: Interval estimasi TO memuat nilai eksak"""
+    print("=" * 60)
+    print("TEST 5: Transparency Order Estimate")
+    print("=" * 60)
+
+    import numpy as np
+    import sbox_analysis
+    from sbox_logic import SBOX_44
+
+    # Semua beta S-Box turunan peta invers memiliki TO_beta sama: kasus tersulit untuk low
+    print("\n• Testing estimate_to() coverage with SBOX_44 (32 shifts)...")
+    exact = sbox_analysis.calculate_to(SBOX_44)
+    trials = 200
+    covered = sum(
+        result["low"] <= exact <= result["high"]
+        for result in (sbox_analysis.estimate_to(SBOX_44, rng=seed) for seed in range(trials))
+    )
+    assert covered / trials >= 0.95, f"Cakupan {covered}/{trials} untuk confidence 0.95"
+    print(f"  ✓ Interval memuat TO={exact:.4f} pada {covered}/{trials} percobaan")
+
+    print("\n✅ TO estimate tests passed!\n")
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("DAC", test_dac),
+        ("PC/BD", test_pc_bd),
+        ("Affine Profiles", test_affine_profile),
+        ("Staged Screening", test_screening),
+        ("TO Estimate", test_to_estimate),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' failed: {e!r}\n")
+            results.append((name, False))
+
+    print("=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+    for name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {name}")
+
+    passed_count = sum(1 for _, p in results if p)
+    print(f"\nResult: {passed_count}/{len(results)} test groups passed\n")
+    return 0 if passed_count == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Test script untuk bentuk kanonik S-Box di sbox_canonical
+Jalankan: python test_sbox_canonical.py
+"""
+
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+
+def _random_transform(sbox, equivalence, rng):
+    """Menerapkan transformasi acak dari kelas ekuivalensi pada S-Box (256,)."""
+    import numpy as np
+    import sbox_logic
+
+    values = np.arange(256)
+    bits = (values[:, None] >> np.arange(8)) & 1
+    if equivalence in ("output_linear", "output_affine"):
+        output = sbox_logic.linear_tables(sbox_logic.generate_random_affine_matrices(rng, 1)[0])
+    else:
+        # Q: permutasi bit output
+        output = np.sum(bits << rng.permutation(8), axis=-1)
+    inputs = values
+    if equivalence == "bit_permutation":
+        inputs = np.sum(bits << rng.permutation(8), axis=-1)
+    constant = 0 if equivalence == "output_linear" else int(rng.integers(1, 256))
+    return (output[np.asarray(sbox)[inputs]] ^ constant).astype(np.uint8)
+
+
+def test_invariance():
+    """Test 1: Bentuk kanonik invarian terhadap transformasi ekuivalensi acak"""
+    print("=" * 60)
+    print("TEST 1: Canonical Form Invariance")
+    print("=" * 60)
+
+    import numpy as np
+    import sbox_analysis
+    import sbox_canonical
+    from sbox_logic import SBOX_44
+
+    rng = np.random.default_rng(25)
+    other = rng.permutation(256)
+    for equivalence in sbox_canonical.EQUIVALENCES:
+        print(f"\n• Testing {equivalence}...")
+        # bit_permutation mencoba 8! permutasi input (~2 s per S-Box): cukup satu transformasi
+        rounds = 1 if equivalence == "bit_permutation" else 5
+        sboxes = [SBOX_44] + [_random_transform(SBOX_44, equivalence, rng) for _ in range(rounds)]
+        forms = sbox_canonical.canonical_form(np.array(sboxes + [other]), equivalence)
+        assert all(np.array_equal(form, forms[0]) for form in forms[1:-1]), "Bentuk kanonik berubah"
+        assert not np.array_equal(forms[-1], forms[0]), "S-Box tidak ekuivalen mendapat bentuk yang sama"
+
+        # Metrik invarian juga harus sama di dalam kelas
+        columns = sbox_analysis.analyze_batch(np.array(sboxes))
+        for name in sbox_canonical.INVARIANT_METRICS[equivalence]:
+            assert np.allclose(columns[name], columns[name][0]), f"Metrik {name} tidak invarian"
+        print(f"  ✓ {rounds} transformasi, hash {sbox_canonical.form_hashes(forms[0])[0]:016x}")
+
+    print("\n✅ Invariance tests passed!\n")
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Canonical Invariance", test_invariance),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' failed: {e!r}\n")
+            results.append((name, False))
+
+    print("=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+    for name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {name}")
+
+    passed_count = sum(1 for _, p in results if p)
+    print(f"\nResult: {passed_count}/{len(results)} test groups passed\n")
+    return 0 if passed_count == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
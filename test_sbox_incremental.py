@@ -0,0 +1,91 @@
+"""
+Test script untuk analisis inkremental swap di sbox_incremental
+Jalankan: python test_sbox_incremental.py
+"""
+
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+
+def _assert_matches_full(state):
+    """Tabel dan maksimum per baris harus sama dengan perhitungan ulang penuh."""
+    import numpy as np
+    import sbox_analysis
+
+    ddt = sbox_analysis.difference_distribution_table(state.sbox, state.m)
+    walsh = sbox_analysis.walsh_table(state.sbox, state.m)
+    assert np.array_equal(state.ddt, ddt)
+    assert np.array_equal(state.walsh, walsh)
+    assert np.array_equal(state._ddt_row_max, np.max(ddt, axis=1))
+    assert np.array_equal(state._walsh_row_max, np.max(np.abs(walsh), axis=1))
+    assert state.metrics() == {
+        "nl": sbox_analysis.calculate_nl(state.sbox, state.m),
+        "du": int(np.max(ddt[1:])),
+        "dap": int(np.max(ddt[1:])) / state.size,
+        "lap": sbox_analysis.calculate_lap(state.sbox, state.m),
+    }
+
+
+def test_random_swaps():
+    """Test 1: Swap dan undo acak dibandingkan dengan perhitungan ulang penuh"""
+    print("=" * 60)
+    print("TEST 1: Random Swaps & Undos")
+    print("=" * 60)
+
+    import numpy as np
+    import sbox_incremental
+    from sbox_logic import SBOX_44
+
+    rng = np.random.default_rng(2024)
+    for sbox in (SBOX_44, rng.permutation(64), rng.integers(0, 16, 32)):
+        state = sbox_incremental.SwapAnalysisState(sbox)
+        size = state.size
+        print(f"\n• Testing {state.n}->{state.m} S-Box...")
+        for step in range(60):
+            if state._history and rng.random() < 0.3:
+                state.undo()
+            else:
+                x1, x2 = (int(x) for x in rng.integers(0, size, 2))
+                state.swap(x1, x2)
+            _assert_matches_full(state)
+        while state._history:
+            state.undo()
+        assert state.sbox.tolist() == list(sbox)
+        _assert_matches_full(state)
+        print(f"  ✓ 60 langkah konsisten: {state.metrics()}")
+
+    print("\n✅ Random swap tests passed!\n")
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Random Swaps", test_random_swaps),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' failed: {e!r}\n")
+            results.append((name, False))
+
+    print("=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+    for name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {name}")
+
+    passed_count = sum(1 for _, p in results if p)
+    print(f"\nResult: {passed_count}/{len(results)} test groups passed\n")
+    return 0 if passed_count == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
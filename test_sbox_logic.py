@@ -0,0 +1,179 @@
+"""
+Test script untuk tipe SBox immutable dan enumerasi matriks affine di sbox_logic
+Jalankan: python test_sbox_logic.py
+"""
+
+import sys
+import os
+import pickle
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+
+def test_construction():
+    """Test 1: Konstruksi, validasi dan invers ter-cache"""
+    print("=" * 60)
+    print("TEST 1: SBox Construction")
+    print("=" * 60)
+
+    import sbox_logic
+    from sbox_logic import SBOX_44
+
+    print("\n• Testing SBox type with SBOX_44...")
+    sbox = sbox_logic.SBox(SBOX_44)
+    assert sbox.tolist() == SBOX_44, "SBox tidak sesuai dengan SBOX_44"
+    assert sbox[:4] == SBOX_44[:4] and sbox[::-1] == SBOX_44[::-1], "Slice harus berupa list[int]"
+    assert sbox[-1] == SBOX_44[-1] and list(sbox) == SBOX_44 and len(sbox) == 256
+    assert all(sbox.inverse[sbox[x]] == x for x in range(256)), "Invers tidak sesuai"
+    print(f"  ✓ SBox OK: {sbox!r}")
+
+    print("\n• Testing cached inverse...")
+    assert sbox.inverse is sbox.inverse and sbox.inverse.inverse is sbox, "Inverse tidak di-cache"
+    print("  ✓ Inverse dihitung sekali dan saling terhubung")
+
+    print("\n• Testing rejection of invalid S-Boxes...")
+    duplicates = list(range(256))
+    duplicates[0] = duplicates[1]
+    for values in (duplicates, [1, 2, 3], list(range(255)) + [256]):
+        try:
+            sbox_logic.SBox(values)
+        except ValueError as e:
+            print(f"  ✓ Correctly rejected: {e}")
+        else:
+            raise AssertionError(f"SBox should have rejected {values[:4]}...")
+
+    print("\n✅ Construction tests passed!\n")
+
+
+def test_immutability():
+    """Test 2: SBox tidak dapat diubah"""
+    print("=" * 60)
+    print("TEST 2: SBox Immutability")
+    print("=" * 60)
+
+    import sbox_logic
+    from sbox_logic import SBOX_44
+
+    sbox = sbox_logic.SBox(SBOX_44)
+
+    print("\n• Testing attribute assignment...")
+    try:
+        sbox._data = bytes(256)
+    except AttributeError as e:
+        print(f"  ✓ Correctly rejected: {e}")
+    else:
+        raise AssertionError("Attribute assignment should fail")
+
+    print("\n• Testing item assignment and array view...")
+    try:
+        sbox[0] = 1
+    except TypeError:
+        print("  ✓ Item assignment rejected")
+    else:
+        raise AssertionError("Item assignment should fail")
+    try:
+        sbox.array[0] = 1
+    except ValueError:
+        print("  ✓ Array view read-only")
+    else:
+        raise AssertionError("Array view should be read-only")
+
+    assert sbox.tolist() == SBOX_44, "Isi SBox berubah"
+
+    print("\n✅ Immutability tests passed!\n")
+
+
+def test_hash_equality():
+    """Test 3: Hash dan kesamaan berdasarkan isi"""
+    print("=" * 60)
+    print("TEST 3: SBox Hashing & Equality")
+    print("=" * 60)
+
+    import sbox_logic
+    from sbox_logic import SBOX_44
+
+    a = sbox_logic.SBox(SBOX_44)
+    b = sbox_logic.SBox(bytes(SBOX_44))
+    c = a.inverse
+
+    print("\n• Testing equality and hash...")
+    assert a == b and hash(a) == hash(b) and a.digest == b.digest, "Equality/hash tidak konsisten"
+    assert a != c and len({a, b, c}) == 2, "SBox berbeda dianggap sama"
+    print(f"  ✓ Equal by content, digest {a.digest[:16]}")
+
+    print("\n• Testing comparison with list and pickle round-trip...")
+    assert a != SBOX_44, "SBox tidak boleh sama dengan list"
+    assert pickle.loads(pickle.dumps(a)) == a, "Pickle round-trip gagal"
+    print("  ✓ SBox != list, pickle round-trip OK")
+
+    print("\n✅ Hashing & equality tests passed!\n")
+
+
+def test_affine_ranking():
+    """Test 4: Enumerasi GL(8, 2) dan generator matriks ber-seed"""
+    print("=" * 60)
+    print("TEST 4: Affine Matrix Ranking")
+    print("=" * 60)
+
+    import numpy as np
+    import sbox_logic
+
+    print("\n• Testing unrank(rank(M)) == M...")
+    matrices = sbox_logic.generate_random_affine_matrices(np.random.default_rng(7), 50)
+    ranks = sbox_logic.rank_affine_matrices(matrices)
+    assert np.all((ranks >= 0) & (ranks < sbox_logic.GL_ORDER)), "Rank di luar range"
+    assert np.array_equal(sbox_logic.unrank_affine_matrices(ranks), matrices), "unrank(rank(M)) != M"
+    print(f"  ✓ 50 matriks kembali utuh, contoh rank {ranks[0]}")
+
+    print("\n• Testing rank(unrank(r)) == r at the range edges...")
+    edges = [0, 1, sbox_logic.GL_ORDER // 2, sbox_logic.GL_ORDER - 1]
+    assert [sbox_logic.AffineMatrix.from_rank(r).rank for r in edges] == edges, "Rank tepi tidak kembali utuh"
+    assert np.array_equal(sbox_logic.AffineMatrix.from_rank(0).to_array(), np.eye(8, dtype=np.int64)), \
+        "Rank 0 harus matriks identitas"
+    print("  ✓ Rank 0, tengah dan GL_ORDER - 1 konsisten")
+
+    print("\n• Testing seeded generator reproducibility...")
+    first = sbox_logic.generate_random_affine_matrices(123, 20)
+    second = sbox_logic.generate_random_affine_matrices(123, 20)
+    other = sbox_logic.generate_random_affine_matrices(124, 20)
+    assert np.array_equal(first, second), "Seed yang sama menghasilkan matriks berbeda"
+    assert not np.array_equal(first, other), "Seed berbeda menghasilkan matriks yang sama"
+    assert np.all(sbox_logic.is_invertible_gf2(first)), "Generator menghasilkan matriks singular"
+    print("  ✓ Seed 123 menghasilkan 20 matriks invertible yang sama")
+
+    print("\n✅ Affine ranking tests passed!\n")
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Construction", test_construction),
+        ("Immutability", test_immutability),
+        ("Hashing & Equality", test_hash_equality),
+        ("Affine Ranking", test_affine_ranking),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            test_func()
+            results.append((name, True))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' failed: {e!r}\n")
+            results.append((name, False))
+
+    print("=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+    for name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {name}")
+
+    passed_count = sum(1 for _, p in results if p)
+    print(f"\nResult: {passed_count}/{len(results)} test groups passed\n")
+    return 0 if passed_count == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())